@@ -0,0 +1,112 @@
+import asyncio
+import heapq
+import itertools
+import math
+from typing import Dict, List, Optional
+
+READ = 0
+WRITE = 1
+
+# Heap entries are [priority, sequence, future]; futures resolve to True when
+# a slot is handed over and to False when the waiter is shed. Shed and
+# cancelled entries stay in the heap and are skipped when popped.
+Entry = list
+
+
+class AdmissionController:
+    # At most `limit` requests run at once; up to `queue_size` more wait,
+    # reads ahead of writes and first come first served within a priority.
+    # A waiter whose deadline passes is shed by a timer instead of being
+    # served late, and a full queue lets a read displace the newest queued
+    # write. The loop is single threaded, so plain counters suffice.
+    def __init__(self, limit: int, queue_size: int, max_wait: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self.queued = 0
+        self.service_time = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.shed = 0
+        self.displaced = 0
+        self._queue: List[Entry] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: int, deadline: float) -> bool:
+        if self.in_flight < self.limit and not self.queued:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        loop = asyncio.get_running_loop()
+        if deadline <= loop.time():
+            self.shed += 1
+            return False
+        if self.queued >= self.queue_size and not self._displace(priority):
+            self.rejected += 1
+            return False
+
+        future = loop.create_future()
+        heapq.heappush(self._queue, [priority, next(self._sequence), future])
+        self.queued += 1
+        timer = loop.call_at(deadline, self._expire, future)
+        try:
+            granted = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.result():
+                self.release(0.0)
+            elif future.cancelled():
+                self.queued -= 1
+            raise
+        finally:
+            timer.cancel()
+        if granted:
+            self.admitted += 1
+        return granted
+
+    def release(self, elapsed: float) -> None:
+        if elapsed:
+            self.service_time += (elapsed - self.service_time) * 0.1
+        while self._queue:
+            future = heapq.heappop(self._queue)[2]
+            if not future.done():
+                self.queued -= 1
+                future.set_result(True)
+                return
+        self.in_flight -= 1
+
+    def retry_after(self) -> int:
+        # Seconds until the current backlog drains at the observed service
+        # time; at least one so clients do not retry in a tight loop.
+        backlog = (self.queued + 1) * self.service_time / self.limit
+        return max(1, math.ceil(backlog))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "shed": self.shed,
+            "displaced": self.displaced,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+        }
+
+    def _expire(self, future: "asyncio.Future[bool]") -> None:
+        if not future.done():
+            self.queued -= 1
+            self.shed += 1
+            future.set_result(False)
+
+    def _displace(self, priority: int) -> bool:
+        victim: Optional[Entry] = None
+        for entry in self._queue:
+            if entry[2].done() or entry[0] <= priority:
+                continue
+            if victim is None or entry[:2] > victim[:2]:
+                victim = entry
+        if victim is None:
+            return False
+        self.queued -= 1
+        self.displaced += 1
+        victim[2].set_result(False)
+        return True
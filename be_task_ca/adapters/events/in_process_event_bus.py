@@ -0,0 +1,298 @@
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_type_hints,
+)
+from uuid import UUID
+
+from be_task_ca.domain.events import DomainEvent
+from be_task_ca.ports.events.event_publisher import EventPublisher
+
+logger = logging.getLogger("be_task_ca.events")
+
+Handler = Callable[[Any], Awaitable[None]]
+
+
+@dataclasses.dataclass
+class Subscription:
+    name: str
+    event_types: Tuple[Type[DomainEvent], ...]
+    handler: Handler
+    cursor: int
+    handled: int = 0
+    failed: int = 0
+    wake: asyncio.Event = dataclasses.field(default_factory=asyncio.Event, repr=False)
+    worker: Optional["asyncio.Task[None]"] = dataclasses.field(default=None, repr=False)
+
+
+class InProcessEventBus(EventPublisher):
+    # Every published event gets the next sequence number and goes into one
+    # bounded outbox. Each subscription has its own cursor into the outbox
+    # and one worker task that runs the handler on the events at its cursor,
+    # so a handler sees its events in publish order and a slow handler never
+    # holds up the others. An event leaves the outbox once every cursor has
+    # passed it. When the outbox is full, publish() waits for the slowest
+    # handler to make room instead of dropping the event.
+    #
+    # With `journal_path` a writer task appends each event to a JSON-lines
+    # file before any handler sees it, and records how far every handler
+    # has got. start() replays the events the journal holds past that
+    # point, so events still queued when a worker stopped or died are
+    # delivered again: delivery is at least once for journaled events.
+    def __init__(
+        self,
+        outbox_capacity: int = 100_000,
+        journal_path: Optional[str] = None,
+    ):
+        self.outbox_capacity = outbox_capacity
+        self.journal_path = journal_path
+        self.published = 0
+        self.blocked = 0
+        self.replayed = 0
+        self.subscriptions: List[Subscription] = []
+        self._outbox: Deque[DomainEvent] = deque()
+        # Sequence number of the first event in the outbox, and of the
+        # first event not yet in the journal.
+        self._base = 0
+        self._journaled = 0
+        self._acked = 0
+        self._written_ack = 0
+        self._replay_pending = journal_path is not None
+        self._space = asyncio.Event()
+        self._pending = asyncio.Event()
+        self._writer: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def _next(self) -> int:
+        return self._base + len(self._outbox)
+
+    @property
+    def _deliverable(self) -> int:
+        return self._next if self.journal_path is None else self._journaled
+
+    def subscribe(
+        self,
+        event_types: Tuple[Type[DomainEvent], ...],
+        handler: Handler,
+        name: Optional[str] = None,
+    ) -> Subscription:
+        # Subscriptions made before start() also receive the replayed events.
+        subscription = Subscription(
+            name=name or getattr(handler, "__qualname__", repr(handler)),
+            event_types=event_types,
+            handler=handler,
+            cursor=self._base if self._loop is None else self._next,
+        )
+        self.subscriptions.append(subscription)
+        if self._loop is not None:
+            subscription.worker = self._loop.create_task(self._run_worker(subscription))
+        return subscription
+
+    def start(self) -> None:
+        # Called from the lifespan hook, or lazily on the first publish, on
+        # the loop serving requests. Events and tasks bind to a loop, so they
+        # are rebuilt if a new loop takes over (as with TestClient outside a
+        # `with` block).
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._replay_pending:
+            self._replay_pending = False
+            self._replay()
+        self._loop = loop
+        self._space = asyncio.Event()
+        self._pending = asyncio.Event()
+        if self.journal_path is not None:
+            self._writer = loop.create_task(self._run_writer())
+            self._pending.set()
+        for subscription in self.subscriptions:
+            subscription.wake = asyncio.Event()
+            subscription.worker = loop.create_task(self._run_worker(subscription))
+        self._trim()
+
+    async def publish(self, event: DomainEvent) -> None:
+        self.start()
+        if len(self._outbox) >= self.outbox_capacity:
+            self.blocked += 1
+            while len(self._outbox) >= self.outbox_capacity:
+                self._space.clear()
+                await self._space.wait()
+        self._outbox.append(event)
+        self.published += 1
+        if self.journal_path is not None:
+            self._pending.set()
+        elif not self.subscriptions:
+            self._trim()
+        else:
+            self._wake()
+
+    async def drain(self) -> None:
+        while self._outbox or self._written_ack < self._acked:
+            await asyncio.sleep(0.001)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            # Never started, or started on a loop that is gone along with
+            # its tasks.
+            self._loop = self._writer = None
+            return
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Closing event bus with %d events undelivered%s",
+                self.backlog,
+                "; they are replayed on the next start" if self.journal_path else "",
+            )
+        tasks = [s.worker for s in self.subscriptions if s.worker]
+        if self._writer is not None:
+            tasks.append(self._writer)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.journal_path is not None:
+            await self._flush_journal()
+        self._loop = self._writer = None
+
+    @property
+    def backlog(self) -> int:
+        return len(self._outbox)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "published": self.published,
+            "blocked": self.blocked,
+            "replayed": self.replayed,
+            "handled": sum(s.handled for s in self.subscriptions),
+            "failed": sum(s.failed for s in self.subscriptions),
+            "backlog": self.backlog,
+        }
+
+    async def _run_worker(self, subscription: Subscription) -> None:
+        while True:
+            if subscription.cursor >= self._deliverable:
+                subscription.wake.clear()
+                await subscription.wake.wait()
+                continue
+            event = self._outbox[subscription.cursor - self._base]
+            if isinstance(event, subscription.event_types):
+                try:
+                    await subscription.handler(event)
+                    subscription.handled += 1
+                except Exception:
+                    subscription.failed += 1
+                    logger.exception(
+                        "Event handler %s failed on %s",
+                        subscription.name,
+                        type(event).__name__,
+                    )
+            subscription.cursor += 1
+            self._trim()
+
+    def _wake(self) -> None:
+        for subscription in self.subscriptions:
+            subscription.wake.set()
+
+    def _trim(self) -> None:
+        handled = min((s.cursor for s in self.subscriptions), default=self._deliverable)
+        if handled <= self._base:
+            return
+        for _ in range(handled - self._base):
+            self._outbox.popleft()
+        self._base = handled
+        self._space.set()
+        if self.journal_path is not None:
+            self._acked = handled
+            self._pending.set()
+
+    async def _run_writer(self) -> None:
+        while True:
+            await self._pending.wait()
+            self._pending.clear()
+            await self._flush_journal()
+            self._wake()
+            self._trim()
+
+    async def _flush_journal(self) -> None:
+        start, end, acked = self._journaled, self._next, self._acked
+        if start == end and acked == self._written_ack:
+            return
+        events = list(islice(self._outbox, start - self._base, end - self._base))
+        await asyncio.to_thread(self._append, start, events, acked)
+        self._journaled = end
+        self._written_ack = acked
+
+    def _append(self, start: int, events: List[DomainEvent], acked: int) -> None:
+        lines = [encode(seq, event) for seq, event in enumerate(events, start)]
+        if acked > self._written_ack:
+            lines.append(json.dumps({"acked": acked}) + "\n")
+        with open(self.journal_path, "a") as journal:
+            journal.writelines(lines)
+
+    def _replay(self) -> None:
+        if not os.path.exists(self.journal_path):
+            return
+        events: Dict[int, DomainEvent] = {}
+        acked = 0
+        with open(self.journal_path) as journal:
+            for line in journal:
+                record = json.loads(line)
+                if "acked" in record:
+                    acked = max(acked, record["acked"])
+                else:
+                    seq = record.pop("seq")
+                    events[seq] = decode(record)
+        pending = sorted(seq for seq in events if seq >= acked)
+        # Rewritten with just the pending events, so the journal only grows
+        # by what is still undelivered across restarts.
+        with open(self.journal_path, "w") as journal:
+            journal.writelines(encode(seq, events[seq]) for seq in pending)
+        self._base = pending[0] if pending else acked
+        self._outbox.extend(events[seq] for seq in pending)
+        self._journaled = self._next
+        self._acked = self._written_ack = self._base
+        for subscription in self.subscriptions:
+            subscription.cursor = self._base
+        self.replayed = len(pending)
+        if pending:
+            logger.info(
+                "Replaying %d undelivered events from the journal", len(pending)
+            )
+
+
+def encode(seq: int, event: DomainEvent) -> str:
+    record = {"seq": seq, "type": type(event).__name__, **dataclasses.asdict(event)}
+    return json.dumps(record, default=str) + "\n"
+
+
+def decode(record: Dict[str, Any]) -> DomainEvent:
+    event_type = EVENT_TYPES[record.pop("type")]
+    hints = get_type_hints(event_type)
+    return event_type(
+        **{name: PARSERS.get(hints[name], lambda v: v)(v) for name, v in record.items()}
+    )
+
+
+EVENT_TYPES = {
+    event_type.__name__: event_type for event_type in DomainEvent.__subclasses__()
+}
+PARSERS: Dict[Any, Callable[[Any], Any]] = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+}
@@ -0,0 +1,7 @@
+from be_task_ca.domain.events import DomainEvent
+from be_task_ca.ports.events.event_publisher import EventPublisher
+
+
+class NullEventPublisher(EventPublisher):
+    async def publish(self, event: DomainEvent) -> None:
+        pass
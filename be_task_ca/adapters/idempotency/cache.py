@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    expires: float
+
+
+class IdempotencyCache:
+    # Responses in insertion order; with a single TTL that is also expiry
+    # order, so expired entries are popped off the front as the cache is
+    # used (amortized O(1)) and `max_entries` evicts the oldest first.
+    def __init__(self, max_entries: int = 10_000, ttl: float = 86_400.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stored = 0
+        self.replayed = 0
+        self.coalesced = 0
+        self.mismatched = 0
+        self._responses: "OrderedDict[str, StoredResponse]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: str, now: float) -> Optional[StoredResponse]:
+        self._expire(now)
+        return self._responses.get(key)
+
+    def put(
+        self,
+        key: str,
+        fingerprint: str,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        now: float,
+    ) -> None:
+        self._responses.pop(key, None)
+        self._responses[key] = StoredResponse(
+            fingerprint, status, headers, body, now + self.ttl
+        )
+        self.stored += 1
+        while len(self._responses) > self.max_entries:
+            self._responses.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "stored": self.stored,
+            "replayed": self.replayed,
+            "coalesced": self.coalesced,
+            "mismatched": self.mismatched,
+            "entries": len(self._responses),
+        }
+
+    def _expire(self, now: float) -> None:
+        responses = self._responses
+        while responses:
+            oldest = next(iter(responses.values()))
+            if oldest.expires > now:
+                return
+            responses.popitem(last=False)
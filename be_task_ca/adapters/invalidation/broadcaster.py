@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger("be_task_ca.invalidation")
+
+MAX_DATAGRAM = 16 * 1024
+SUFFIX = ".sock"
+
+Listener = Callable[[List[str]], None]
+
+
+class InvalidationBroadcaster:
+    # Workers on one host each bind a Unix datagram socket in a shared
+    # directory; every other socket there is a peer. Keys published within
+    # `window` seconds are coalesced into a set and sent as one JSON array per
+    # peer (split at MAX_DATAGRAM), so a burst of writes costs one sendto per
+    # peer. Sends never block: a peer whose receive buffer is full misses the
+    # message and is counted in `dropped`, which the caches' TTL bounds.
+    # Sockets left behind by dead workers refuse the send and are removed.
+    def __init__(
+        self, directory: str, window: float = 0.001, name: Optional[str] = None
+    ):
+        self.directory = directory
+        self.window = window
+        name = name or f"{os.getpid()}-{id(self):x}"
+        self.path = os.path.join(directory, name + SUFFIX)
+        self.sent = 0
+        self.sent_keys = 0
+        self.received = 0
+        self.received_keys = 0
+        self.dropped = 0
+        self.peers_removed = 0
+        self._listeners: List[Listener] = []
+        self._pending: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._socket: Optional[socket.socket] = None
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+        os.makedirs(self.directory, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(self.path)
+        self._socket = sock
+        self._loop.add_reader(sock.fileno(), self._receive)
+
+    def publish(self, keys: Iterable[str]) -> None:
+        if self._socket is None:
+            return
+        self._pending.update(keys)
+        if self._flush_handle is None and self._pending:
+            self._flush_handle = self._loop.call_later(self.window, self.flush)
+
+    def flush(self) -> None:
+        self._flush_handle = None
+        if not self._pending or self._socket is None:
+            return
+        keys = sorted(self._pending)
+        self._pending.clear()
+        datagrams = encode(keys)
+        for peer in self.peers():
+            for datagram in datagrams:
+                try:
+                    self._socket.sendto(datagram, peer)
+                except BlockingIOError:
+                    self.dropped += 1
+                except (ConnectionRefusedError, FileNotFoundError):
+                    self._remove_peer(peer)
+                    break
+                else:
+                    self.sent += 1
+        self.sent_keys += len(keys)
+
+    def peers(self) -> List[str]:
+        with os.scandir(self.directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(SUFFIX) and entry.path != self.path
+            ]
+
+    def close(self) -> None:
+        if self._socket is None:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self.flush()
+        if not self._loop.is_closed():
+            self._loop.remove_reader(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sent": self.sent,
+            "sent_keys": self.sent_keys,
+            "received": self.received,
+            "received_keys": self.received_keys,
+            "dropped": self.dropped,
+            "peers_removed": self.peers_removed,
+        }
+
+    def _receive(self) -> None:
+        while self._socket is not None:
+            try:
+                datagram = self._socket.recv(MAX_DATAGRAM)
+            except BlockingIOError:
+                return
+            try:
+                keys = json.loads(datagram)
+            except ValueError:
+                logger.warning("Ignoring malformed invalidation message")
+                continue
+            self.received += 1
+            self.received_keys += len(keys)
+            for listener in self._listeners:
+                listener(keys)
+
+    def _remove_peer(self, peer: str) -> None:
+        try:
+            os.unlink(peer)
+        except FileNotFoundError:
+            return
+        self.peers_removed += 1
+        logger.info("Removed stale invalidation socket %s", peer)
+
+
+def encode(keys: List[str]) -> List[bytes]:
+    datagrams = []
+    batch: List[str] = []
+    size = 2
+    for key in keys:
+        encoded = len(json.dumps(key)) + 1
+        if batch and size + encoded > MAX_DATAGRAM:
+            datagrams.append(json.dumps(batch, separators=(",", ":")).encode())
+            batch, size = [], 2
+        batch.append(key)
+        size += encoded
+    if batch:
+        datagrams.append(json.dumps(batch, separators=(",", ":")).encode())
+    return datagrams
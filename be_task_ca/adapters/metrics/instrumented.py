@@ -0,0 +1,116 @@
+import inspect
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from be_task_ca.adapters.metrics.registry import (
+    Collector,
+    Counter,
+    Family,
+    Histogram,
+    Sample,
+)
+
+
+class InstrumentedRepository:
+    # Wraps every coroutine method of whatever port it fronts; other attributes
+    # (decorator handles such as `.loader` or `.batcher`) pass through.
+    def __init__(self, inner: Any, name: str, durations: Histogram, errors: Counter):
+        self.inner = inner
+        self._name = name
+        self._durations = durations
+        self._errors = errors
+
+    def __getattr__(self, attribute: str) -> Any:
+        method = getattr(self.inner, attribute)
+        if not inspect.iscoroutinefunction(method):
+            return method
+        labels = (self._name, attribute)
+        series = self._durations.labels(labels)
+        errors = self._errors
+
+        async def timed(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            except Exception:
+                errors.inc(labels)
+                raise
+            finally:
+                series.observe(perf_counter() - started)
+
+        # Cache on the instance so later calls skip __getattr__ entirely.
+        setattr(self, attribute, timed)
+        return timed
+
+
+class InstrumentedUseCase:
+    def __init__(self, inner: Any, name: str, durations: Histogram):
+        self.inner = inner
+        self._ok = durations.labels((name, "ok"))
+        self._error = durations.labels((name, "error"))
+
+    async def __call__(self, *args, **kwargs):
+        started = perf_counter()
+        try:
+            result = await self.inner(*args, **kwargs)
+        except Exception:
+            self._error.observe(perf_counter() - started)
+            raise
+        self._ok.observe(perf_counter() - started)
+        return result
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.inner, attribute)
+
+
+def stats_collector(
+    prefix: str, label: str, sources: Dict[str, Any], gauges: Iterable[str] = ()
+) -> Collector:
+    # Exposes the `stats()` dicts of decorators at scrape time, so counting
+    # stays in the decorators and costs nothing extra per call.
+    gauge_keys = set(gauges)
+
+    def collect() -> List[Family]:
+        families: Dict[str, Family] = {}
+        for source_name, source in sources.items():
+            for key, value in source.stats().items():
+                name = (
+                    f"{prefix}_{key}" if key in gauge_keys else f"{prefix}_{key}_total"
+                )
+                kind = "gauge" if key in gauge_keys else "counter"
+                family = families.setdefault(
+                    name, (name, kind, f"{prefix} {key.replace('_', ' ')}", [])
+                )
+                family[3].append((name, {label: source_name}, value))
+        return list(families.values())
+
+    return collect
+
+
+def hit_ratio_collector(caches: Dict[str, Callable[[], Tuple[int, int]]]) -> Collector:
+    def collect() -> List[Family]:
+        requests: List[Sample] = []
+        ratios: List[Sample] = []
+        for cache, hits_and_misses in caches.items():
+            hits, misses = hits_and_misses()
+            requests.append(
+                ("cache_requests_total", {"cache": cache, "result": "hit"}, hits)
+            )
+            requests.append(
+                ("cache_requests_total", {"cache": cache, "result": "miss"}, misses)
+            )
+            total = hits + misses
+            ratios.append(
+                ("cache_hit_ratio", {"cache": cache}, hits / total if total else 0)
+            )
+        return [
+            ("cache_requests_total", "counter", "Cache lookups by result", requests),
+            (
+                "cache_hit_ratio",
+                "gauge",
+                "Share of cache lookups served as hits",
+                ratios,
+            ),
+        ]
+
+    return collect
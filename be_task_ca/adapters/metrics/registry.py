@@ -0,0 +1,179 @@
+import bisect
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+DEFAULT_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+DEFAULT_BUCKETS = tuple(ms / 1000 for ms in DEFAULT_BUCKETS_MS)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+# Metrics are only mutated from the event loop thread, so plain ints and lists
+# are enough: no locks or atomics on the hot path. Series are created once per
+# label combination and then updated in place.
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def collect(self) -> Family:
+        return (
+            self.name,
+            "counter",
+            self.documentation,
+            [
+                (self.name, dict(zip(self.labelnames, labels)), value)
+                for labels, value in self.values.items()
+            ],
+        )
+
+
+class Gauge(Counter):
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def set(self, labels: Labels, value: float) -> None:
+        self.values[labels] = value
+
+    def collect(self) -> Family:
+        name, _, documentation, samples = super().collect()
+        return name, "gauge", documentation, samples
+
+
+class HistogramSeries:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.series: Dict[Labels, HistogramSeries] = {}
+
+    def labels(self, labels: Labels = ()) -> HistogramSeries:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = HistogramSeries(self.buckets)
+        return series
+
+    def observe(self, labels: Labels, value: float) -> None:
+        self.labels(labels).observe(value)
+
+    def collect(self) -> Family:
+        samples: List[Sample] = []
+        for labels, series in self.series.items():
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series.counts):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**base, "le": format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", base, series.sum))
+            samples.append((f"{self.name}_count", base, cumulative))
+        return self.name, "histogram", self.documentation, samples
+
+
+Collector = Callable[[], Iterable[Family]]
+M = TypeVar("M", Counter, Gauge, Histogram)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: List[Counter | Histogram] = []
+        self.collectors: List[Collector] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric: M) -> M:
+        # Registering a name twice (e.g. a container rebuilt against the same
+        # registry) hands back the existing metric instead of a duplicate.
+        for existing in self.metrics:
+            if existing.name == metric.name and type(existing) is type(metric):
+                return existing  # type: ignore[return-value]
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        self.collectors.append(collector)
+
+    def collect(self) -> List[Family]:
+        families = [metric.collect() for metric in self.metrics]
+        for collector in self.collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        lines = []
+        for name, kind, documentation, samples in self.collect():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(
+                    f"{sample_name}{format_labels(labels)} {format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{escape(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
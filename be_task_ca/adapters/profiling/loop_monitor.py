@@ -0,0 +1,107 @@
+import asyncio
+import sys
+import threading
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Deque, List, Optional
+
+from be_task_ca.adapters.profiling.stacks import Stack, frame_stack
+
+
+@dataclass
+class Stall:
+    started: float
+    stack: Stack
+    ended: Optional[float] = None
+
+    def overlap(self, start: float, end: float) -> float:
+        ended = self.ended if self.ended is not None else end
+        return max(0.0, min(ended, end) - max(self.started, start))
+
+
+class LoopMonitor:
+    # A heartbeat task measures how late the loop wakes it up (scheduling
+    # lag). A watchdog thread notices when the heartbeat is overdue by more
+    # than `block_threshold` and captures the loop thread's stack while it is
+    # still blocked; that stack is the code doing the blocking.
+    def __init__(
+        self,
+        interval: float = 0.05,
+        block_threshold: float = 0.1,
+        window: int = 1200,
+        history: int = 64,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.lags: Deque[float] = deque(maxlen=window)
+        self.stalls: Deque[Stall] = deque(maxlen=history)
+        self.stall_count = 0
+        self._due = 0.0
+        self._open: Optional[Stall] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._stop: Optional[threading.Event] = None
+        self._watchdog: Optional[threading.Thread] = None
+
+    async def start(self) -> None:
+        # A thread only starts once, so each start gets a fresh watchdog and
+        # the same app can run its lifespan again.
+        self._loop_thread = threading.get_ident()
+        self._due = perf_counter() + self.interval
+        self._open = None
+        self._task = asyncio.create_task(self._heartbeat())
+        self._stop = threading.Event()
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(self._stop,), name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def percentile(self, fraction: float) -> float:
+        if not self.lags:
+            return 0.0
+        ordered = sorted(self.lags)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def stalls_between(self, start: float, end: float) -> List[Stall]:
+        return [stall for stall in self.stalls if stall.overlap(start, end) > 0]
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            now = perf_counter()
+            self.lags.append(max(0.0, now - self._due))
+            stall = self._open
+            if stall is not None:
+                stall.ended = now
+                self._open = None
+            self._due = now + self.interval
+
+    def _watch(self, stop: threading.Event) -> None:
+        poll = min(self.interval, self.block_threshold) / 2
+        while not stop.wait(poll):
+            due = self._due
+            overdue = perf_counter() - due
+            if overdue < self.block_threshold or self._open is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None or self._due != due:
+                continue
+            stall = Stall(started=due, stack=frame_stack(frame))
+            self._open = stall
+            self.stalls.append(stall)
+            self.stall_count += 1
@@ -0,0 +1,53 @@
+import sys
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+from be_task_ca.adapters.profiling.stacks import Stack, frame_stack
+
+
+class StackSampler:
+    # Statistical profiler: a daemon thread snapshots the stacks of running
+    # threads every `interval` seconds. The profiled code is not instrumented,
+    # so the cost is one GIL hand-over per sample. Since the sampler has to
+    # take the GIL, intervals below sys.getswitchinterval() are not honoured
+    # while the sampled thread is busy.
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: "Counter[Stack]" = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> "Counter[Stack]":
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if self.thread_id is not None:
+                frame = frames.get(self.thread_id)
+                if frame is not None:
+                    self.samples[frame_stack(frame)] += 1
+                continue
+            names = thread_names()
+            for thread_id, frame in frames.items():
+                if thread_id != own:
+                    thread = names.get(thread_id, str(thread_id))
+                    self.samples[(thread, *frame_stack(frame))] += 1
+
+
+def thread_names() -> Dict[int, str]:
+    return {
+        thread.ident: thread.name
+        for thread in threading.enumerate()
+        if thread.ident is not None
+    }
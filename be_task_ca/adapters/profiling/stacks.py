@@ -0,0 +1,40 @@
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Dict, Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+_labels: Dict[CodeType, str] = {}
+
+
+def frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    label = _labels.get(code)
+    if label is None:
+        module = frame.f_globals.get("__name__", code.co_filename)
+        label = _labels[code] = f"{module}:{code.co_qualname}"
+    return label
+
+
+def builtin_label(function: Any) -> str:
+    module = getattr(function, "__module__", None) or "builtins"
+    return f"{module}:{getattr(function, '__qualname__', repr(function))}"
+
+
+def frame_stack(frame: Optional[FrameType]) -> Stack:
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+def collapse(stacks: "Counter[Stack]") -> str:
+    # Brendan Gregg's collapsed format: root-first frames joined by ";" and
+    # a count, one stack per line; flamegraph.pl and speedscope read it.
+    return "".join(
+        f"{';'.join(stack)} {count}\n"
+        for stack, count in stacks.most_common()
+        if count > 0
+    )
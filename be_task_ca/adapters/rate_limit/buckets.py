@@ -0,0 +1,137 @@
+import mmap
+import multiprocessing
+import struct
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List
+
+
+class TokenBuckets(ABC):
+    # take() spends one token from the bucket of `key` and returns 0, or
+    # returns how many seconds until a token is available. Buckets refill
+    # at `rate` tokens per second up to `burst`.
+    @abstractmethod
+    def take(self, key: str, rate: float, burst: float, now: float) -> float:
+        pass
+
+
+class InMemoryTokenBuckets(TokenBuckets):
+    # Buckets are kept in last-touched order. A bucket idle for burst / rate
+    # seconds is full again, which is what a missing bucket means, so expired
+    # ones are popped off the front as the table is used: each bucket is
+    # removed once, so cleanup is amortized O(1) per call. `max_keys` bounds
+    # memory when many clients are active at once. A bucket evicted before it
+    # refilled is set aside, up to another `max_keys` of them, and its key
+    # picks up where it left off instead of starting over with a full burst;
+    # keys that were never evicted are not affected.
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> [tokens, updated, expires]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._evicted: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: str, rate: float, burst: float, now: float) -> float:
+        buckets = self._buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = self._evicted.pop(key, None) or [float(burst), now, 0.0]
+            buckets[key] = bucket
+            if len(buckets) > self.max_keys:
+                evicted_key, evicted = buckets.popitem(last=False)
+                self._evicted[evicted_key] = evicted
+                if len(self._evicted) > self.max_keys:
+                    self._evicted.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+        bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+
+        tokens = bucket[0]
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        bucket[0] = tokens
+        bucket[2] = now + (burst - tokens) / rate
+        self._expire(now)
+        return wait
+
+    def _expire(self, now: float) -> None:
+        for buckets in (self._buckets, self._evicted):
+            while buckets:
+                oldest = next(iter(buckets.values()))
+                if oldest[2] > now:
+                    break
+                buckets.popitem(last=False)
+
+
+# key hash, tokens, updated
+SLOT = struct.Struct("<Qdd")
+
+
+class SharedTokenBuckets(TokenBuckets):
+    # Fixed-size open-addressing table in an anonymous shared mapping. When
+    # it is created before the server forks its workers, every worker sees
+    # the same buckets. A key probes `probes` slots; if none is its own or
+    # free, the least recently updated one is reused. The bucket it held is
+    # moved to a direct-mapped table of evicted buckets, where its key finds
+    # it again, so being evicted never grants that key a fresh burst.
+    # Timestamps must come from a clock shared by all processes
+    # (time.monotonic), and the workers must be forked from the process that
+    # created the table.
+    def __init__(self, slots: int = 65_536, probes: int = 4):
+        self.slots = slots
+        self.probes = probes
+        # The live table, then as many slots of evicted buckets.
+        self._memory = mmap.mmap(-1, SLOT.size * slots * 2)
+        self._lock = multiprocessing.Lock()
+
+    def take(self, key: str, rate: float, burst: float, now: float) -> float:
+        # hash() is salted per interpreter, but forked workers inherit the
+        # salt of the process that created the table.
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF or 1
+        memory = self._memory
+        first = key_hash % self.slots
+        with self._lock:
+            offset = -1
+            oldest_offset, oldest_updated = -1, float("inf")
+            for probe in range(self.probes):
+                candidate = (first + probe) % self.slots * SLOT.size
+                stored, tokens, updated = SLOT.unpack_from(memory, candidate)
+                if stored == key_hash:
+                    offset = candidate
+                    tokens = min(burst, tokens + (now - updated) * rate)
+                    break
+                if stored == 0:
+                    oldest_offset, oldest_updated = candidate, float("-inf")
+                elif updated < oldest_updated:
+                    oldest_offset, oldest_updated = candidate, updated
+            else:
+                offset = oldest_offset
+                tokens = self._restore(key_hash, rate, burst, now)
+                stored, *evicted = SLOT.unpack_from(memory, offset)
+                if stored != 0:
+                    SLOT.pack_into(
+                        memory, self._evicted_offset(stored), stored, *evicted
+                    )
+
+            if tokens >= 1:
+                SLOT.pack_into(memory, offset, key_hash, tokens - 1, now)
+                return 0.0
+            SLOT.pack_into(memory, offset, key_hash, tokens, now)
+            return (1 - tokens) / rate
+
+    def _evicted_offset(self, key_hash: int) -> int:
+        return (self.slots + key_hash % self.slots) * SLOT.size
+
+    def _restore(self, key_hash: int, rate: float, burst: float, now: float) -> float:
+        offset = self._evicted_offset(key_hash)
+        stored, tokens, updated = SLOT.unpack_from(self._memory, offset)
+        if stored != key_hash:
+            return float(burst)
+        SLOT.pack_into(self._memory, offset, 0, 0.0, 0.0)
+        return min(burst, tokens + (now - updated) * rate)
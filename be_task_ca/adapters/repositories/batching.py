@@ -0,0 +1,172 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+from uuid import UUID
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Batch(Generic[K, V]):
+    def __init__(self):
+        self.futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self.dispatched = False
+
+
+class BatchLoader(Generic[K, V]):
+    loads: int
+    batches: int
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[List[V]]],
+        key_of: Callable[[V], K],
+        window_us: int = 0,
+        max_batch_size: int = 1000,
+    ):
+        self.batch_fn = batch_fn
+        self.key_of = key_of
+        self.window = window_us / 1_000_000
+        self.max_batch_size = max_batch_size
+        self.loads = 0
+        self.batches = 0
+        self._pending: Dict[asyncio.AbstractEventLoop, _Batch[K, V]] = {}
+
+    async def load(self, key: K) -> Optional[V]:
+        self.loads += 1
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = _Batch()
+            # A zero window dispatches on the next loop iteration, after every
+            # coroutine already scheduled in this tick has queued its key.
+            if self.window:
+                loop.call_later(self.window, self._dispatch, loop, batch)
+            else:
+                loop.call_soon(self._dispatch, loop, batch)
+
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self.max_batch_size:
+                self._dispatch(loop, batch)
+
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        return {"loads": self.loads, "batches": self.batches}
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: _Batch[K, V]) -> None:
+        if self._pending.get(loop) is batch:
+            del self._pending[loop]
+        if batch.dispatched:
+            return
+        batch.dispatched = True
+        self.batches += 1
+        loop.create_task(self._run(batch))
+
+    async def _run(self, batch: _Batch[K, V]) -> None:
+        try:
+            values = await self.batch_fn(list(batch.futures))
+        except BaseException as exc:
+            # Cancellation and interpreter exits included: a future left
+            # pending here would hang every caller coalesced into the batch.
+            for future in batch.futures.values():
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        by_key = {self.key_of(value): value for value in values}
+        for key, future in batch.futures.items():
+            if not future.done():
+                future.set_result(by_key.get(key))
+
+
+class BatchingUserRepository(UserRepository):
+    def __init__(
+        self, inner: UserRepository, window_us: int = 0, max_batch_size: int = 1000
+    ):
+        self.inner = inner
+        self.loader: BatchLoader[UUID, User] = BatchLoader(
+            inner.find_by_ids, lambda user: user.id, window_us, max_batch_size
+        )
+
+    async def save(self, user: User) -> User:
+        return await self.inner.save(user)
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        return await self.inner.save_many(users)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self.inner.find_by_email(email)
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        return await self.loader.load(user_id)
+
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return await self.inner.find_by_ids(user_ids)
+
+
+class BatchingItemRepository(ItemRepository):
+    def __init__(
+        self, inner: ItemRepository, window_us: int = 0, max_batch_size: int = 1000
+    ):
+        self.inner = inner
+        self.loader: BatchLoader[UUID, Item] = BatchLoader(
+            inner.find_by_ids, lambda item: item.id, window_us, max_batch_size
+        )
+
+    async def save(self, item: Item) -> Item:
+        return await self.inner.save(item)
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        return await self.inner.save_many(items)
+
+    async def list_all(self) -> List[Item]:
+        return await self.inner.list_all()
+
+    async def find_by_name(self, item_name: str) -> Optional[Item]:
+        return await self.inner.find_by_name(item_name)
+
+    async def find_by_id(self, item_id: UUID) -> Optional[Item]:
+        return await self.loader.load(item_id)
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        return await self.inner.find_by_ids(item_ids)
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.reserve_stock(item_id, quantity)
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.release_stock(item_id, quantity)
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        return await self.inner.update_price(item_id, price)
+
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        return await self.inner.start_flash_sale(item_id, shards)
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        return await self.inner.end_flash_sale(item_id)
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        return await self.inner.merge_cold_flash_sales(idle_for)
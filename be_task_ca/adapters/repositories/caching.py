@@ -0,0 +1,249 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+
+Publish = Callable[[Iterable[str]], None]
+
+
+class EntityCache:
+    # LRU over string keys with a TTL that only bounds how long an entry can
+    # stay stale if an invalidation is lost. Every invalidation bumps
+    # `epoch`; a read that started before it must not fill the cache with
+    # what it loaded, so fills carry the epoch they started at.
+    def __init__(self, max_entries: int = 10_000, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.stale_fills = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, now: float) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: Any, epoch: int, now: float) -> None:
+        if epoch != self.epoch:
+            self.stale_fills += 1
+            return
+        self._entries[key] = (value, now + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        self.epoch += 1
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidated += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "stale_fills": self.stale_fills,
+            "entries": len(self._entries),
+        }
+
+
+def user_keys(user: User) -> List[str]:
+    return [f"user:{user.id}", f"user-email:{user.email.lower()}"]
+
+
+def item_keys(item: Item) -> List[str]:
+    return [f"item:{item.id}", f"item-name:{item.name.lower()}"]
+
+
+class CachingUserRepository(UserRepository):
+    # Only hits are cached: a cached "no such email" would let a signup on
+    # another worker race past the duplicate check until it is invalidated.
+    def __init__(
+        self,
+        inner: UserRepository,
+        cache: EntityCache,
+        publish: Optional[Publish] = None,
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.publish = publish
+
+    async def save(self, user: User) -> User:
+        saved = await self.inner.save(user)
+        self._invalidate(user_keys(saved))
+        return saved
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        saved = await self.inner.save_many(users)
+        self._invalidate([key for user in saved for key in user_keys(user)])
+        return saved
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        key = f"user-email:{email.lower()}"
+        user = self.cache.get(key, time.monotonic())
+        if user is not None:
+            return user
+        epoch = self.cache.epoch
+        user = await self.inner.find_by_email(email)
+        if user is not None:
+            self.cache.put(key, user, epoch, time.monotonic())
+        return user
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        key = f"user:{user_id}"
+        user = self.cache.get(key, time.monotonic())
+        if user is not None:
+            return user
+        epoch = self.cache.epoch
+        user = await self.inner.find_by_id(user_id)
+        if user is not None:
+            self.cache.put(key, user, epoch, time.monotonic())
+        return user
+
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return await cached_many(self.cache, "user", user_ids, self.inner.find_by_ids)
+
+    def _invalidate(self, keys: List[str]) -> None:
+        self.cache.invalidate(keys)
+        if self.publish is not None:
+            self.publish(keys)
+
+
+class CachingItemRepository(ItemRepository):
+    # Names map to ids, so a stock change only drops the `item:<id>` entry.
+    # `list_all` is not cached: it is invalidated by every write.
+    def __init__(
+        self,
+        inner: ItemRepository,
+        cache: EntityCache,
+        publish: Optional[Publish] = None,
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.publish = publish
+
+    async def save(self, item: Item) -> Item:
+        saved = await self.inner.save(item)
+        self._invalidate(item_keys(saved))
+        return saved
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        saved = await self.inner.save_many(items)
+        self._invalidate([key for item in saved for key in item_keys(item)])
+        return saved
+
+    async def list_all(self) -> List[Item]:
+        return await self.inner.list_all()
+
+    async def find_by_name(self, item_name: str) -> Optional[Item]:
+        key = f"item-name:{item_name.lower()}"
+        item_id = self.cache.get(key, time.monotonic())
+        if item_id is not None:
+            item = await self.find_by_id(item_id)
+            if item is not None:
+                return item
+        epoch = self.cache.epoch
+        item = await self.inner.find_by_name(item_name)
+        if item is not None:
+            self.cache.put(key, item.id, epoch, time.monotonic())
+        return item
+
+    async def find_by_id(self, item_id: UUID) -> Optional[Item]:
+        key = f"item:{item_id}"
+        item = self.cache.get(key, time.monotonic())
+        if item is not None:
+            return item
+        epoch = self.cache.epoch
+        item = await self.inner.find_by_id(item_id)
+        if item is not None:
+            self.cache.put(key, item, epoch, time.monotonic())
+        return item
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        return await cached_many(self.cache, "item", item_ids, self.inner.find_by_ids)
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = await self.inner.reserve_stock(item_id, quantity)
+        if item is not None:
+            self._invalidate([f"item:{item_id}"])
+        return item
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = await self.inner.release_stock(item_id, quantity)
+        if item is not None:
+            self._invalidate([f"item:{item_id}"])
+        return item
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        item = await self.inner.update_price(item_id, price)
+        if item is not None:
+            self._invalidate([f"item:{item_id}"])
+        return item
+
+    # Cached copies of a flash-sale item hold a snapshot of the shard total,
+    # so switching modes drops them like any other stock change.
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        started = await self.inner.start_flash_sale(item_id, shards)
+        if started:
+            self._invalidate([f"item:{item_id}"])
+        return started
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        ended = await self.inner.end_flash_sale(item_id)
+        if ended:
+            self._invalidate([f"item:{item_id}"])
+        return ended
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        merged = await self.inner.merge_cold_flash_sales(idle_for)
+        if merged:
+            self._invalidate([f"item:{item_id}" for item_id in merged])
+        return merged
+
+    def _invalidate(self, keys: List[str]) -> None:
+        self.cache.invalidate(keys)
+        if self.publish is not None:
+            self.publish(keys)
+
+
+async def cached_many(
+    cache: EntityCache,
+    prefix: str,
+    ids: List[UUID],
+    load: Callable[[List[UUID]], Any],
+) -> List[Any]:
+    now = time.monotonic()
+    found: Dict[UUID, Any] = {}
+    missing = []
+    for entity_id in dict.fromkeys(ids):
+        entity = cache.get(f"{prefix}:{entity_id}", now)
+        if entity is None:
+            missing.append(entity_id)
+        else:
+            found[entity_id] = entity
+    if missing:
+        epoch = cache.epoch
+        loaded = await load(missing)
+        now = time.monotonic()
+        for entity in loaded:
+            found[entity.id] = entity
+            cache.put(f"{prefix}:{entity.id}", entity, epoch, now)
+    return [found[entity_id] for entity_id in dict.fromkeys(ids) if entity_id in found]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 from uuid import UUID
 
 from be_task_ca.domain.entities.cart_item import CartItem
@@ -8,10 +8,13 @@ from be_task_ca.ports.repositories.cart_item_repository import CartItemRepositor
 class InMemoryCartItemRepository(CartItemRepository):
     cart_items: List[CartItem]
 
-    def __init__(self):
+    def __init__(self, on_scan: Optional[Callable[[int], None]] = None):
         self.cart_items = []
+        self.on_scan = on_scan
 
     async def find_cart_items_for_user_id(self, user_id: UUID) -> List[CartItem]:
+        if self.on_scan is not None:
+            self.on_scan(len(self.cart_items))
         return [item for item in self.cart_items if item.user_id == user_id]
 
     async def save(self, cart_item: CartItem) -> CartItem:
@@ -21,7 +24,16 @@ class InMemoryCartItemRepository(CartItemRepository):
     async def find_by_user_and_item(
         self, user_id: UUID, item_id: UUID
     ) -> Optional[CartItem]:
-        for item in self.cart_items:
+        for position, item in enumerate(self.cart_items, 1):
             if item.user_id == user_id and item.item_id == item_id:
+                if self.on_scan is not None:
+                    self.on_scan(position)
                 return item
+        if self.on_scan is not None:
+            self.on_scan(len(self.cart_items))
         return None
+
+    async def list_user_ids(self) -> List[UUID]:
+        if self.on_scan is not None:
+            self.on_scan(len(self.cart_items))
+        return list(dict.fromkeys(item.user_id for item in self.cart_items))
@@ -0,0 +1,75 @@
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_summary import CartSummary
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
+
+
+class InMemoryCartSummaryRepository(CartSummaryRepository):
+    # The view keeps its own unit price per item and, per item, the
+    # quantity each cart holds, so adding a line is O(1) and a price change
+    # touches only the carts holding that item. A line is priced at the
+    # view's price when the view already knows the item: a price change
+    # that lands between a use case reading the item and adding the line
+    # then still wins.
+    def __init__(self):
+        self._summaries: Dict[UUID, CartSummary] = {}
+        self._prices: Dict[UUID, int] = {}
+        self._holders: Dict[UUID, Dict[UUID, int]] = {}
+        self._lines: Dict[UUID, Dict[UUID, int]] = {}
+
+    async def find_by_user_id(self, user_id: UUID) -> Optional[CartSummary]:
+        return self._summaries.get(user_id)
+
+    async def add_line(
+        self, user_id: UUID, item_id: UUID, quantity: int, unit_price_cents: int
+    ) -> CartSummary:
+        price = self._prices.setdefault(item_id, unit_price_cents)
+        lines = self._lines.setdefault(user_id, {})
+        new_line = item_id not in lines
+        lines[item_id] = lines.get(item_id, 0) + quantity
+        self._holders.setdefault(item_id, {})[user_id] = lines[item_id]
+        summary = self._summaries.get(user_id) or CartSummary(user_id=user_id)
+        summary = replace(
+            summary,
+            line_count=summary.line_count + new_line,
+            item_count=summary.item_count + quantity,
+            total_cents=summary.total_cents + price * quantity,
+        )
+        self._summaries[user_id] = summary
+        return summary
+
+    async def reprice(self, item_id: UUID, unit_price_cents: int) -> int:
+        previous = self._prices.get(item_id)
+        self._prices[item_id] = unit_price_cents
+        if previous is None or previous == unit_price_cents:
+            return 0
+        holders = self._holders.get(item_id, {})
+        for user_id, quantity in holders.items():
+            summary = self._summaries[user_id]
+            self._summaries[user_id] = replace(
+                summary,
+                total_cents=summary.total_cents
+                + (unit_price_cents - previous) * quantity,
+            )
+        return len(holders)
+
+    async def rebuild(
+        self, user_id: UUID, lines: List[Tuple[UUID, int, int]]
+    ) -> CartSummary:
+        for item_id in self._lines.pop(user_id, {}):
+            self._holders[item_id].pop(user_id, None)
+        self._summaries.pop(user_id, None)
+        summary = CartSummary(user_id=user_id)
+        for item_id, quantity, unit_price_cents in lines:
+            # Only this cart changes: lines are priced like any other added
+            # line, and the view's prices move only through reprice().
+            summary = await self.add_line(user_id, item_id, quantity, unit_price_cents)
+        self._summaries[user_id] = summary
+        return summary
+
+    async def list_user_ids(self) -> List[UUID]:
+        return list(self._summaries)
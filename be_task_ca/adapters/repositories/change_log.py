@@ -0,0 +1,63 @@
+from typing import List, Optional
+from uuid import UUID
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.ports.repositories.item_change_log import ItemChangeLog
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+
+
+class ChangeLoggingItemRepository(ItemRepository):
+    # Changes are recorded after the write returns, so a client reading the
+    # log never sees a sequence for an item state that is not there yet.
+    def __init__(self, inner: ItemRepository, change_log: ItemChangeLog):
+        self.inner = inner
+        self.change_log = change_log
+
+    async def save(self, item: Item) -> Item:
+        saved = await self.inner.save(item)
+        await self.change_log.record([saved.id])
+        return saved
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        saved = await self.inner.save_many(items)
+        await self.change_log.record([item.id for item in saved])
+        return saved
+
+    async def list_all(self) -> List[Item]:
+        return await self.inner.list_all()
+
+    async def find_by_name(self, item_name: str) -> Optional[Item]:
+        return await self.inner.find_by_name(item_name)
+
+    async def find_by_id(self, item_id: UUID) -> Optional[Item]:
+        return await self.inner.find_by_id(item_id)
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        return await self.inner.find_by_ids(item_ids)
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = await self.inner.reserve_stock(item_id, quantity)
+        if item is not None:
+            await self.change_log.record([item_id])
+        return item
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = await self.inner.release_stock(item_id, quantity)
+        if item is not None:
+            await self.change_log.record([item_id])
+        return item
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        item = await self.inner.update_price(item_id, price)
+        if item is not None:
+            await self.change_log.record([item_id])
+        return item
+
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        return await self.inner.start_flash_sale(item_id, shards)
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        return await self.inner.end_flash_sale(item_id)
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        return await self.inner.merge_cold_flash_sales(idle_for)
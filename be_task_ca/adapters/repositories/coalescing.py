@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    calls: int
+    executed: int
+    coalesced: int
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        future = self._in_flight.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            self.executed += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so one caller giving up does not cancel the shared read.
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    def _forget(self, key: Hashable, done: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is done:
+            del self._in_flight[key]
+
+
+class CoalescingUserRepository(UserRepository):
+    def __init__(self, inner: UserRepository):
+        self.inner = inner
+        self.single_flight = SingleFlight()
+
+    async def save(self, user: User) -> User:
+        return await self.inner.save(user)
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        return await self.inner.save_many(users)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self.single_flight.do(
+            ("find_by_email", email), lambda: self.inner.find_by_email(email)
+        )
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        return await self.single_flight.do(
+            ("find_by_id", user_id), lambda: self.inner.find_by_id(user_id)
+        )
+
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        users = await self.single_flight.do(
+            ("find_by_ids", tuple(user_ids)), lambda: self.inner.find_by_ids(user_ids)
+        )
+        return users.copy()
+
+
+class CoalescingItemRepository(ItemRepository):
+    def __init__(self, inner: ItemRepository):
+        self.inner = inner
+        self.single_flight = SingleFlight()
+
+    async def save(self, item: Item) -> Item:
+        return await self.inner.save(item)
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        return await self.inner.save_many(items)
+
+    async def list_all(self) -> List[Item]:
+        items = await self.single_flight.do(("list_all",), self.inner.list_all)
+        return items.copy()
+
+    async def find_by_name(self, item_name: str) -> Optional[Item]:
+        return await self.single_flight.do(
+            ("find_by_name", item_name), lambda: self.inner.find_by_name(item_name)
+        )
+
+    async def find_by_id(self, item_id: UUID) -> Optional[Item]:
+        return await self.single_flight.do(
+            ("find_by_id", item_id), lambda: self.inner.find_by_id(item_id)
+        )
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        items = await self.single_flight.do(
+            ("find_by_ids", tuple(item_ids)), lambda: self.inner.find_by_ids(item_ids)
+        )
+        return items.copy()
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.reserve_stock(item_id, quantity)
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.release_stock(item_id, quantity)
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        return await self.inner.update_price(item_id, price)
+
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        return await self.inner.start_flash_sale(item_id, shards)
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        return await self.inner.end_flash_sale(item_id)
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        return await self.inner.merge_cold_flash_sales(idle_for)
+
+
+class CoalescingCartItemRepository(CartItemRepository):
+    def __init__(self, inner: CartItemRepository):
+        self.inner = inner
+        self.single_flight = SingleFlight()
+
+    async def find_cart_items_for_user_id(self, user_id: UUID) -> List[CartItem]:
+        cart_items = await self.single_flight.do(
+            ("find_cart_items_for_user_id", user_id),
+            lambda: self.inner.find_cart_items_for_user_id(user_id),
+        )
+        return cart_items.copy()
+
+    async def save(self, cart_item: CartItem) -> CartItem:
+        return await self.inner.save(cart_item)
+
+    async def find_by_user_and_item(
+        self, user_id: UUID, item_id: UUID
+    ) -> Optional[CartItem]:
+        return await self.single_flight.do(
+            ("find_by_user_and_item", user_id, item_id),
+            lambda: self.inner.find_by_user_and_item(user_id, item_id),
+        )
+
+    async def list_user_ids(self) -> List[UUID]:
+        return await self.inner.list_user_ids()
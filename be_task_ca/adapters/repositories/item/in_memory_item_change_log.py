@@ -0,0 +1,79 @@
+from bisect import bisect_right
+from itertools import islice
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from be_task_ca.domain.entities.item_changes import ItemChangeSet
+from be_task_ca.ports.repositories.item_change_log import ItemChangeLog
+
+# Dead entries tolerated beyond the live ones before the log is rewritten.
+SLACK = 64
+
+
+def sequence_of(entry: Tuple[int, UUID]) -> int:
+    return entry[0]
+
+
+class InMemoryItemChangeLog(ItemChangeLog):
+    # Every change is appended in sequence order, and `_latest` says which
+    # entry of an item is its newest; the older ones are dead and skipped,
+    # so an item changed many times is returned once. Reading changes since
+    # `since` bisects to the first later entry and stops after `limit` live
+    # ones, so a page costs O(log n + limit) plus the dead entries it skips.
+    # The log is rewritten with just the live entries once the dead ones
+    # outnumber them, which keeps that amortized O(1) per change. Beyond
+    # `capacity` items the oldest entries are compacted away; a client
+    # behind the newest compacted sequence has to resync.
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        self.sequence = 0
+        self.compacted_through = 0
+        self._latest: Dict[UUID, int] = {}
+        self._log: List[Tuple[int, UUID]] = []
+        # Entries before `_head` are compacted away.
+        self._head = 0
+
+    async def record(self, item_ids: List[UUID]) -> int:
+        latest, log = self._latest, self._log
+        for item_id in item_ids:
+            self.sequence += 1
+            latest[item_id] = self.sequence
+            log.append((self.sequence, item_id))
+        while len(latest) > self.capacity:
+            sequence, item_id = log[self._head]
+            self._head += 1
+            if latest.get(item_id) == sequence:
+                del latest[item_id]
+                self.compacted_through = sequence
+        if len(log) > 2 * len(latest) + SLACK:
+            self._log = [
+                (sequence, item_id)
+                for sequence, item_id in islice(log, self._head, None)
+                if latest.get(item_id) == sequence
+            ]
+            self._head = 0
+        return self.sequence
+
+    async def changes_since(self, since: int, limit: int) -> ItemChangeSet:
+        # A sequence ahead of ours comes from another worker or from before a
+        # restart; either way the client's copy cannot be patched.
+        if since < self.compacted_through or since > self.sequence:
+            return ItemChangeSet(next_since=self.sequence, resync=True)
+        latest, log = self._latest, self._log
+        page: List[Tuple[int, UUID]] = []
+        has_more = False
+        for index in range(
+            bisect_right(log, since, self._head, key=sequence_of), len(log)
+        ):
+            sequence, item_id = log[index]
+            if latest.get(item_id) != sequence:
+                continue
+            if len(page) == limit:
+                has_more = True
+                break
+            page.append((sequence, item_id))
+        return ItemChangeSet(
+            next_since=page[-1][0] if page else self.sequence,
+            item_ids=[item_id for _, item_id in page],
+            has_more=has_more,
+        )
@@ -1,31 +1,161 @@
-from typing import List, Optional
+import threading
+import time
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional
 from uuid import UUID
 
+from be_task_ca.adapters.repositories.item.sharded_stock import ShardedStock
 from be_task_ca.domain.entities.item import Item
 from be_task_ca.ports.repositories.item_repository import ItemRepository
 
+LOCK_STRIPES = 64
+
 
 class InMemoryItemRepository(ItemRepository):
     items: List[Item]
 
-    def __init__(self):
+    def __init__(self, on_scan: Optional[Callable[[int], None]] = None):
         self.items = []
+        self.on_scan = on_scan
+        self._items_by_id: Dict[UUID, Item] = {}
+        self._flash_sales: Dict[UUID, ShardedStock] = {}
+        # Python has no native CAS, so each item's compare-and-set runs under
+        # one of a fixed set of striped locks; unrelated items never contend.
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
 
     async def save(self, item: Item) -> Item:
         self.items.append(item)
+        self._items_by_id.setdefault(item.id, item)
         return item
 
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        self.items.extend(items)
+        for item in items:
+            self._items_by_id.setdefault(item.id, item)
+        return list(items)
+
     async def list_all(self) -> List[Item]:
+        if self.on_scan is not None:
+            self.on_scan(len(self.items))
+        if self._flash_sales:
+            return [self._current(item) for item in self.items]
         return self.items.copy()
 
     async def find_by_name(self, item_name: str) -> Optional[Item]:
-        for item in self.items:
-            if item.name.lower() == item_name.lower():
-                return item
+        wanted = item_name.lower()
+        for position, item in enumerate(self.items, 1):
+            if item.name.lower() == wanted:
+                if self.on_scan is not None:
+                    self.on_scan(position)
+                return self._current(item)
+        if self.on_scan is not None:
+            self.on_scan(len(self.items))
         return None
 
     async def find_by_id(self, item_id: UUID) -> Optional[Item]:
-        for item in self.items:
-            if item.id == item_id:
+        item = self._items_by_id.get(item_id)
+        return self._current(item) if item is not None else None
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        found = []
+        for item_id in dict.fromkeys(item_ids):
+            item = self._items_by_id.get(item_id)
+            if item is not None:
+                found.append(self._current(item))
+        return found
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return None
+        while True:
+            sharded = self._flash_sales.get(item_id)
+            if sharded is not None:
+                if sharded.reserve(quantity):
+                    return self._current(item)
+                if sharded.closed:
+                    continue
+                return None
+            version = item.version
+            available = item.quantity
+            if available < quantity:
+                return None
+            if self._compare_and_set_quantity(item, version, available - quantity):
                 return item
-        return None
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return None
+        while True:
+            sharded = self._flash_sales.get(item_id)
+            if sharded is not None:
+                if sharded.release(quantity):
+                    return self._current(item)
+                continue
+            version = item.version
+            if self._compare_and_set_quantity(item, version, item.quantity + quantity):
+                return item
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return None
+        with self._stripe(item_id):
+            item.price = price
+        return self._current(item)
+
+    async def start_flash_sale(self, item_id: UUID, shards: int = 8) -> bool:
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return False
+        with self._stripe(item_id):
+            if item_id not in self._flash_sales:
+                self._flash_sales[item_id] = ShardedStock(item.quantity, shards)
+                # Invalidates any compare-and-set already in flight so it
+                # retries against the shards instead of the stale quantity.
+                item.version += 1
+        return True
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        return self._end_flash_sale(item_id)
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        cutoff = time.monotonic() - idle_for
+        cold = [
+            item_id
+            for item_id, sharded in list(self._flash_sales.items())
+            if sharded.last_reserved_at <= cutoff
+        ]
+        return [item_id for item_id in cold if self._end_flash_sale(item_id)]
+
+    def _end_flash_sale(self, item_id: UUID) -> bool:
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return False
+        with self._stripe(item_id):
+            sharded = self._flash_sales.pop(item_id, None)
+            if sharded is None:
+                return False
+            item.quantity = sharded.close()
+            item.version += 1
+        return True
+
+    def _current(self, item: Item) -> Item:
+        sharded = self._flash_sales.get(item.id)
+        if sharded is None:
+            return item
+        return replace(item, quantity=sharded.total())
+
+    def _stripe(self, item_id: UUID) -> threading.Lock:
+        return self._stripes[hash(item_id) % LOCK_STRIPES]
+
+    def _compare_and_set_quantity(
+        self, item: Item, expected_version: int, quantity: int
+    ) -> bool:
+        with self._stripe(item.id):
+            if item.version != expected_version:
+                return False
+            item.quantity = quantity
+            item.version += 1
+            return True
@@ -0,0 +1,76 @@
+import random
+import threading
+import time
+from contextlib import ExitStack
+from typing import List
+
+
+class ShardedStock:
+    counters: List[int]
+    closed: bool
+
+    def __init__(self, quantity: int, shards: int):
+        if shards < 1:
+            raise ValueError("A flash sale needs at least one shard")
+        base, remainder = divmod(quantity, shards)
+        self.counters = [base + (1 if i < remainder else 0) for i in range(shards)]
+        self.closed = False
+        self.last_reserved_at = time.monotonic()
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def total(self) -> int:
+        return sum(self.counters)
+
+    def reserve(self, quantity: int) -> bool:
+        shards = len(self.counters)
+        home = random.randrange(shards)
+        for offset in range(shards):
+            index = (home + offset) % shards
+            # Unlocked peek: shards that are visibly short are skipped without
+            # contending, the locked re-check below is what guarantees safety.
+            if self.counters[index] < quantity:
+                continue
+            with self._locks[index]:
+                if self.closed:
+                    return False
+                if self.counters[index] >= quantity:
+                    self.counters[index] -= quantity
+                    self.last_reserved_at = time.monotonic()
+                    return True
+        if self.closed or self.total() < quantity:
+            return False
+        return self._reserve_across_shards(quantity)
+
+    def release(self, quantity: int) -> bool:
+        index = random.randrange(len(self.counters))
+        with self._locks[index]:
+            if self.closed:
+                return False
+            self.counters[index] += quantity
+            return True
+
+    def close(self) -> int:
+        with self._all_locks():
+            self.closed = True
+            return self.total()
+
+    def _reserve_across_shards(self, quantity: int) -> bool:
+        # Slow path for requests larger than any single shard: take every lock
+        # in index order so concurrent stealers cannot deadlock.
+        with self._all_locks():
+            if self.closed or self.total() < quantity:
+                return False
+            for index, available in enumerate(self.counters):
+                taken = min(available, quantity)
+                self.counters[index] -= taken
+                quantity -= taken
+                if quantity == 0:
+                    break
+            self.last_reserved_at = time.monotonic()
+            return True
+
+    def _all_locks(self) -> ExitStack:
+        stack = ExitStack()
+        for lock in self._locks:
+            stack.enter_context(lock)
+        return stack
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from uuid import UUID
 
 from be_task_ca.domain.entities.user import User
@@ -8,21 +8,40 @@ from be_task_ca.ports.repositories.user_repository import UserRepository
 class InMemoryUserRepository(UserRepository):
     users: List[User]
 
-    def __init__(self):
+    def __init__(self, on_scan: Optional[Callable[[int], None]] = None):
         self.users = []
+        self.on_scan = on_scan
+        self._users_by_id: Dict[UUID, User] = {}
 
     async def save(self, user: User) -> User:
         self.users.append(user)
+        self._users_by_id.setdefault(user.id, user)
         return user
 
+    async def save_many(self, users: List[User]) -> List[User]:
+        self.users.extend(users)
+        for user in users:
+            self._users_by_id.setdefault(user.id, user)
+        return list(users)
+
     async def find_by_email(self, email: str) -> Optional[User]:
-        for user in self.users:
-            if user.email.lower() == email.lower():
+        wanted = email.lower()
+        for position, user in enumerate(self.users, 1):
+            if user.email.lower() == wanted:
+                if self.on_scan is not None:
+                    self.on_scan(position)
                 return user
+        if self.on_scan is not None:
+            self.on_scan(len(self.users))
         return None
 
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
-        for user in self.users:
-            if user.id == user_id:
-                return user
-        return None
+        return self._users_by_id.get(user_id)
+
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        found = []
+        for user_id in dict.fromkeys(user_ids):
+            user = self._users_by_id.get(user_id)
+            if user is not None:
+                found.append(user)
+        return found
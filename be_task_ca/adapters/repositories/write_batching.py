@@ -0,0 +1,228 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, TypeVar
+from uuid import UUID
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+
+V = TypeVar("V")
+
+
+class _PendingWrites(Generic[V]):
+    def __init__(self):
+        self.entities: List[V] = []
+        self.futures: List["asyncio.Future[V]"] = []
+        self.flushed = False
+
+
+class WriteBatcher(Generic[V]):
+    writes: int
+    batches: int
+    fallbacks: int
+
+    def __init__(
+        self,
+        save_many: Callable[[List[V]], Awaitable[List[V]]],
+        save_one: Callable[[V], Awaitable[V]],
+        window_ms: float = 2.0,
+        max_batch_size: int = 100,
+        atomic: bool = False,
+    ):
+        # `atomic` promises that a failed save_many committed nothing, which
+        # is what makes replaying its writes one by one safe.
+        self.save_many = save_many
+        self.save_one = save_one
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.atomic = atomic
+        self.writes = 0
+        self.batches = 0
+        self.fallbacks = 0
+        self._pending: Dict[asyncio.AbstractEventLoop, _PendingWrites[V]] = {}
+        self._uncommitted: List[_PendingWrites[V]] = []
+        self._commits: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, entity: V) -> V:
+        self.writes += 1
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = _PendingWrites()
+            self._uncommitted.append(pending)
+            loop.call_later(self.window, self._flush, loop, pending)
+
+        future: "asyncio.Future[V]" = loop.create_future()
+        pending.entities.append(entity)
+        pending.futures.append(future)
+        if len(pending.entities) >= self.max_batch_size:
+            self._flush(loop, pending)
+
+        return await asyncio.shield(future)
+
+    def find_pending(self, matches: Callable[[V], bool]) -> Optional[V]:
+        # Writes waiting for the window or inside a group commit that has not
+        # returned yet, so lookups by a unique field see them.
+        for pending in self._uncommitted:
+            for entity in pending.entities:
+                if matches(entity):
+                    return entity
+        return None
+
+    async def close(self) -> None:
+        for loop, pending in list(self._pending.items()):
+            self._flush(loop, pending)
+        if self._commits:
+            await asyncio.gather(*self._commits, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "writes": self.writes,
+            "batches": self.batches,
+            "fallbacks": self.fallbacks,
+        }
+
+    def _flush(
+        self, loop: asyncio.AbstractEventLoop, pending: _PendingWrites[V]
+    ) -> None:
+        if self._pending.get(loop) is pending:
+            del self._pending[loop]
+        if pending.flushed:
+            return
+        pending.flushed = True
+        self.batches += 1
+        commit = loop.create_task(self._commit(pending))
+        self._commits.add(commit)
+        commit.add_done_callback(self._commits.discard)
+
+    async def _commit(self, pending: _PendingWrites[V]) -> None:
+        try:
+            await self._commit_batch(pending)
+        finally:
+            self._uncommitted.remove(pending)
+
+    async def _commit_batch(self, pending: _PendingWrites[V]) -> None:
+        try:
+            saved = await self.save_many(pending.entities)
+        except Exception as exc:
+            if not self.atomic:
+                # Part of the batch may be stored already; replaying it would
+                # write those entities twice, so every write in it fails.
+                for future in pending.futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+            # Nothing was committed; replay each write on its own so only the
+            # callers whose entity is actually at fault see an error.
+            self.fallbacks += 1
+            await self._commit_individually(pending)
+            return
+
+        for future, result in zip(pending.futures, saved):
+            if not future.done():
+                future.set_result(result)
+        matched = len(saved)
+        for future in pending.futures[matched:]:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError("Group commit returned fewer results than writes")
+                )
+
+    async def _commit_individually(self, pending: _PendingWrites[V]) -> None:
+        for entity, future in zip(pending.entities, pending.futures):
+            try:
+                result = await self.save_one(entity)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+class BatchedWriteUserRepository(UserRepository):
+    def __init__(
+        self,
+        inner: UserRepository,
+        window_ms: float = 2.0,
+        max_batch_size: int = 100,
+        atomic_save_many: bool = False,
+    ):
+        self.inner = inner
+        self.batcher: WriteBatcher[User] = WriteBatcher(
+            inner.save_many, inner.save, window_ms, max_batch_size, atomic_save_many
+        )
+
+    async def save(self, user: User) -> User:
+        return await self.batcher.submit(user)
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        return await self.inner.save_many(users)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        wanted = email.lower()
+        pending = self.batcher.find_pending(lambda user: user.email.lower() == wanted)
+        if pending is not None:
+            return pending
+        return await self.inner.find_by_email(email)
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        return await self.inner.find_by_id(user_id)
+
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return await self.inner.find_by_ids(user_ids)
+
+
+class BatchedWriteItemRepository(ItemRepository):
+    def __init__(
+        self,
+        inner: ItemRepository,
+        window_ms: float = 2.0,
+        max_batch_size: int = 100,
+        atomic_save_many: bool = False,
+    ):
+        self.inner = inner
+        self.batcher: WriteBatcher[Item] = WriteBatcher(
+            inner.save_many, inner.save, window_ms, max_batch_size, atomic_save_many
+        )
+
+    async def save(self, item: Item) -> Item:
+        return await self.batcher.submit(item)
+
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        return await self.inner.save_many(items)
+
+    async def list_all(self) -> List[Item]:
+        return await self.inner.list_all()
+
+    async def find_by_name(self, item_name: str) -> Optional[Item]:
+        wanted = item_name.lower()
+        pending = self.batcher.find_pending(lambda item: item.name.lower() == wanted)
+        if pending is not None:
+            return pending
+        return await self.inner.find_by_name(item_name)
+
+    async def find_by_id(self, item_id: UUID) -> Optional[Item]:
+        return await self.inner.find_by_id(item_id)
+
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        return await self.inner.find_by_ids(item_ids)
+
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.reserve_stock(item_id, quantity)
+
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        return await self.inner.release_stock(item_id, quantity)
+
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        return await self.inner.update_price(item_id, price)
+
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        return await self.inner.start_flash_sale(item_id, shards)
+
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        return await self.inner.end_flash_sale(item_id)
+
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        return await self.inner.merge_cold_flash_sales(idle_for)
@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Tuple
+
+from be_task_ca.ports.security.password_hasher import (
+    PasswordHasher,
+    PasswordHasherOverloadedError,
+)
+
+SCRYPT = "scrypt"
+PBKDF2 = "pbkdf2_sha256"
+
+DEFAULT_COST = {
+    SCRYPT: (2**14, 8, 1),
+    PBKDF2: (600_000,),
+}
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def derive_key(kdf: str, password: bytes, salt: bytes, cost: Tuple[int, ...]) -> bytes:
+    if kdf == SCRYPT:
+        n, r, p = cost
+        return hashlib.scrypt(
+            password, salt=salt, n=n, r=r, p=p, maxmem=256 * n * r, dklen=KEY_BYTES
+        )
+    if kdf == PBKDF2:
+        (iterations,) = cost
+        return hashlib.pbkdf2_hmac("sha256", password, salt, iterations, KEY_BYTES)
+    raise ValueError(f"Unsupported key derivation function '{kdf}'")
+
+
+def hash_password(kdf: str, password: str, cost: Tuple[int, ...]) -> str:
+    salt = os.urandom(SALT_BYTES)
+    key = derive_key(kdf, password.encode(), salt, cost)
+    return "$".join([kdf, *map(str, cost), _b64(salt), _b64(key)])
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    kdf, *fields = hashed_password.split("$")
+    *cost, salt, key = fields
+    derived = derive_key(
+        kdf, password.encode(), _unb64(salt), tuple(int(c) for c in cost)
+    )
+    return hmac.compare_digest(derived, _unb64(key))
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode()
+
+
+def _unb64(encoded: str) -> bytes:
+    return base64.b64decode(encoded)
+
+
+class PooledPasswordHasher(PasswordHasher):
+    def __init__(
+        self,
+        kdf: str = SCRYPT,
+        cost: Tuple[int, ...] | None = None,
+        max_workers: int | None = None,
+        max_pending: int = 64,
+        use_processes: bool = False,
+    ):
+        if kdf not in DEFAULT_COST:
+            raise ValueError(f"Unsupported key derivation function '{kdf}'")
+        self.kdf = kdf
+        self.cost = cost or DEFAULT_COST[kdf]
+        self.max_pending = max_pending
+        self.pending = 0
+        workers = max_workers or os.cpu_count() or 1
+        # hashlib releases the GIL while deriving, so threads scale with cores
+        # for both KDFs; processes are there for interpreters where it does not.
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if use_processes
+            else ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password-hasher"
+            )
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, self.kdf, password, self.cost)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, password, hashed_password)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _submit(self, fn, *args):
+        if self.pending >= self.max_pending:
+            raise PasswordHasherOverloadedError(pending=self.pending)
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
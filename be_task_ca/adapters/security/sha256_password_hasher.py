@@ -0,0 +1,12 @@
+import hashlib
+import hmac
+
+from be_task_ca.ports.security.password_hasher import PasswordHasher
+
+
+class Sha256PasswordHasher(PasswordHasher):
+    async def hash(self, password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return hmac.compare_digest(await self.hash(password), hashed_password)
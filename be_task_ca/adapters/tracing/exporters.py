@@ -0,0 +1,168 @@
+import json
+import queue
+import threading
+import urllib.request
+from collections import deque
+from dataclasses import asdict
+from typing import Any, Deque, Dict, List, Optional
+
+from be_task_ca.adapters.tracing.tracer import Span, SpanExporter
+
+
+class RingBufferExporter(SpanExporter):
+    def __init__(self, capacity: int = 1024):
+        self.spans: Deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+    def traces(self, limit: Optional[int] = None) -> Dict[str, List[Span]]:
+        traces: Dict[str, List[Span]] = {}
+        for span in reversed(self.spans):
+            if span.trace_id not in traces:
+                if limit is not None and len(traces) >= limit:
+                    continue
+                traces[span.trace_id] = []
+            traces[span.trace_id].append(span)
+        return traces
+
+
+class JsonLinesExporter(SpanExporter):
+    # Buffered so a request does not pay for a write; flushed every
+    # `flush_every` spans and on close.
+    def __init__(self, path: str, flush_every: int = 256):
+        self.path = path
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+
+    def export(self, span: Span) -> None:
+        self._buffer.append(json.dumps(asdict(span), default=str))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        with open(self.path, "a") as output:
+            output.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        self.flush()
+
+
+def otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_span(span: Span) -> Dict[str, Any]:
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 2 if span.parent_id is None else 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": key, "value": otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": ({"code": 2, "message": span.error} if span.error else {"code": 1}),
+    }
+    if span.parent_id is not None:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "be_task_ca"},
+                        "spans": [otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OtlpHttpExporter(SpanExporter):
+    # OTLP/HTTP with the JSON encoding, posted from a background thread. The
+    # queue is bounded: when the collector falls behind, spans are dropped
+    # and counted rather than growing memory or blocking requests.
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "be-task-ca",
+        batch_size: int = 512,
+        max_queue: int = 8192,
+        interval: float = 1.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self.failed_batches = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(
+            target=self._run, name="otlp-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch: List[Span] = []
+            try:
+                span = self._queue.get(timeout=self.interval)
+                while span is not None:
+                    batch.append(span)
+                    if len(batch) >= self.batch_size:
+                        break
+                    span = self._queue.get_nowait()
+                closing = span is None
+            except queue.Empty:
+                pass
+            if batch:
+                self._post(batch)
+
+    def _post(self, batch: List[Span]) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(otlp_payload(batch, self.service_name)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5):
+                pass
+        except OSError:
+            self.failed_batches += 1
@@ -0,0 +1,65 @@
+import inspect
+from typing import Any, Optional
+
+from be_task_ca.adapters.tracing.tracer import Tracer
+
+
+class TracedRepository:
+    # Opens a span around every coroutine method of the port it fronts. The
+    # span is current while the adapter runs, so a backend built with
+    # `on_scan=record_rows_scanned` can annotate it.
+    def __init__(self, inner: Any, name: str, tracer: Tracer):
+        self.inner = inner
+        self._name = name
+        self._tracer = tracer
+
+    def __getattr__(self, attribute: str) -> Any:
+        method = getattr(self.inner, attribute)
+        if not inspect.iscoroutinefunction(method):
+            return method
+        name = f"repository.{self._name}.{attribute}"
+        tracer = self._tracer
+
+        async def traced(*args, **kwargs):
+            span = tracer.start(name)
+            if not span.sampled:
+                return await method(*args, **kwargs)
+            token = tracer.activate(span)
+            error: Optional[BaseException] = None
+            try:
+                result = await method(*args, **kwargs)
+                if isinstance(result, list):
+                    span.attributes["rows_returned"] = len(result)
+                return result
+            except BaseException as raised:
+                error = raised
+                raise
+            finally:
+                tracer.finish(span, token, error)
+
+        setattr(self, attribute, traced)
+        return traced
+
+
+class TracedUseCase:
+    def __init__(self, inner: Any, name: str, tracer: Tracer):
+        self.inner = inner
+        self._name = f"use_case.{name}"
+        self._tracer = tracer
+
+    async def __call__(self, *args, **kwargs):
+        span = self._tracer.start(self._name)
+        if not span.sampled:
+            return await self.inner(*args, **kwargs)
+        token = self._tracer.activate(span)
+        error: Optional[BaseException] = None
+        try:
+            return await self.inner(*args, **kwargs)
+        except BaseException as raised:
+            error = raised
+            raise
+        finally:
+            self._tracer.finish(span, token, error)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.inner, attribute)
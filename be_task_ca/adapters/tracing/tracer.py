@@ -0,0 +1,101 @@
+import random
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    sampled: bool = True
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+
+# Shared by every span of an unsampled trace: children see it as their parent
+# and skip all work, which is what keeps head sampling cheap.
+UNSAMPLED = Span(name="", trace_id="", span_id="", sampled=False)
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    span = _current_span.get()
+    if span is not None and span.sampled:
+        span.attributes[key] = value
+
+
+def record_rows_scanned(rows: int) -> None:
+    set_span_attribute("rows_scanned", rows)
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+RemoteParent = Tuple[str, str, bool]
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def start(self, name: str, remote_parent: Optional[RemoteParent] = None) -> Span:
+        parent = _current_span.get()
+        if parent is not None:
+            if not parent.sampled:
+                return UNSAMPLED
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        elif remote_parent is not None:
+            trace_id, parent_id, sampled = remote_parent
+            if not sampled:
+                return UNSAMPLED
+        else:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return UNSAMPLED
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+        return Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+        )
+
+    def activate(self, span: Span) -> Token:
+        return _current_span.set(span)
+
+    def finish(self, span: Span, token: Token, error: Optional[BaseException]) -> None:
+        _current_span.reset(token)
+        if not span.sampled:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self.exporter.export(span)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class CartSummary:
+    user_id: UUID
+    line_count: int = 0
+    item_count: int = 0
+    total_cents: int = 0
+
+
+@dataclass(frozen=True)
+class CartSummaryMismatch:
+    expected: CartSummary
+    actual: Optional[CartSummary]
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+
+def to_cents(amount: float) -> int:
+    return round(amount * 100)
+
+
+@dataclass(frozen=True)
+class CartLine:
+    item_id: UUID
+    name: str
+    unit_price_cents: int
+    quantity: int
+    line_total_cents: int
+
+
+@dataclass(frozen=True)
+class CartTotals:
+    user_id: UUID
+    lines: List[CartLine] = field(default_factory=list)
+    subtotal_cents: int = 0
+    item_count: int = 0
+    total_cents: int = 0
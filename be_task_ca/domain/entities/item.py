@@ -9,3 +9,4 @@ class Item:
     price: float
     quantity: int
     id: UUID = field(default_factory=uuid4)
+    version: int = 0
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from be_task_ca.domain.entities.item import Item
+
+
+@dataclass(frozen=True)
+class ItemChangeSet:
+    next_since: int
+    item_ids: List[UUID] = field(default_factory=list)
+    has_more: bool = False
+    resync: bool = False
+
+
+@dataclass(frozen=True)
+class ItemChanges:
+    next_since: int
+    items: List[Item] = field(default_factory=list)
+    has_more: bool = False
+    resync: bool = False
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    event_id: UUID = field(default_factory=uuid4)
+    occurred_at: datetime = field(default_factory=utc_now)
+
+
+@dataclass(frozen=True)
+class UserRegistered(DomainEvent):
+    user_id: UUID
+    email: str
+
+
+@dataclass(frozen=True)
+class ItemCreated(DomainEvent):
+    item_id: UUID
+    name: str
+    price: float
+    quantity: int
+
+
+@dataclass(frozen=True)
+class ItemAddedToCart(DomainEvent):
+    user_id: UUID
+    item_id: UUID
+    quantity: int
+
+
+@dataclass(frozen=True)
+class ItemPriceChanged(DomainEvent):
+    item_id: UUID
+    price: float
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import re
+from time import perf_counter
+from typing import Any, Callable, List, Optional, Pattern, Sequence, Tuple
+
+from fastapi import FastAPI
+
+from be_task_ca.adapters.admission.controller import READ, WRITE, AdmissionController
+from be_task_ca.adapters.metrics.instrumented import stats_collector
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+
+TIMEOUT_HEADER = b"x-request-timeout-ms"
+READ_METHODS = ("GET", "HEAD")
+
+Group = Tuple[str, Pattern, AdmissionController]
+
+
+def prefix_pattern(prefix: str) -> Pattern:
+    # "/users/{user_id}/cart" -> ^/users/[^/]+/cart(/|$)
+    parts = re.split(r"\{[^}]+\}", prefix)
+    return re.compile("^" + "[^/]+".join(map(re.escape, parts)) + "(/|$)")
+
+
+def request_deadline(scope: dict, now: float, max_wait: float) -> float:
+    for name, value in scope["headers"]:
+        if name == TIMEOUT_HEADER:
+            try:
+                return now + min(max_wait, float(value) / 1000)
+            except ValueError:
+                break
+    return now + max_wait
+
+
+class AdmissionMiddleware:
+    # Routes each request to the controller of its router by path prefix,
+    # before any parsing or dependency work, and answers 503 with
+    # Retry-After when the controller sheds it.
+    def __init__(self, app: Any, groups: Sequence[Group]):
+        self.app = app
+        # Longest prefix first, so /users/{id}/cart is not taken for /users.
+        self.groups = sorted(groups, key=lambda group: -len(group[1].pattern))
+
+    def controller(self, path: str) -> Optional[AdmissionController]:
+        for _, pattern, controller in self.groups:
+            if pattern.match(path):
+                return controller
+        return None
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        controller = self.controller(scope["path"]) if scope["type"] == "http" else None
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = request_deadline(
+            scope, asyncio.get_running_loop().time(), controller.max_wait
+        )
+        priority = READ if scope["method"] in READ_METHODS else WRITE
+        if not await controller.acquire(priority, deadline):
+            await reject(send, controller.retry_after())
+            return
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(perf_counter() - started)
+
+
+async def reject(send: Callable, retry_after: int) -> None:
+    body = json.dumps(
+        {"error": "overloaded", "message": "Server is overloaded, retry later"}
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def add_admission(
+    app: FastAPI,
+    prefixes: Sequence[Tuple[str, str]],
+    limits: Sequence[Tuple[str, int, int]],
+    max_wait: float,
+    registry: Optional[MetricsRegistry] = None,
+) -> None:
+    routers = dict(prefixes)
+    unknown = {name for name, _, _ in limits} - set(routers)
+    if unknown:
+        raise ValueError(f"Unknown admission groups: {', '.join(sorted(unknown))}")
+    groups: List[Group] = [
+        (
+            name,
+            prefix_pattern(routers[name]),
+            AdmissionController(limit, queue_size, max_wait),
+        )
+        for name, limit, queue_size in limits
+    ]
+    app.state.admission = {name: controller for name, _, controller in groups}
+    app.add_middleware(AdmissionMiddleware, groups=groups)
+    if registry is not None:
+        registry.add_collector(
+            stats_collector(
+                "admission", "group", app.state.admission, ("in_flight", "queued")
+            )
+        )
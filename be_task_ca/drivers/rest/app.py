@@ -1,28 +1,174 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
 
-from be_task_ca.drivers.rest.routers.user_router import router as user_router
-from be_task_ca.drivers.rest.routers.item_router import router as item_router
-from be_task_ca.drivers.rest.routers.cart_router import router as cart_router
-from be_task_ca.drivers.rest.exception_handlers import register_exception_handlers
+from be_task_ca.drivers.rest.settings import Settings
+
+OPENAPI_LAZY = "lazy"
+OPENAPI_STARTUP = "startup"
+OPENAPI_DISABLED = "disabled"
+OPENAPI_MODES = (OPENAPI_LAZY, OPENAPI_STARTUP, OPENAPI_DISABLED)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from be_task_ca.drivers.rest.container import Container
+    from be_task_ca.drivers.rest.flash_sales import cool_down_flash_sales
+
+    settings: Settings = app.state.settings
+    tracer = getattr(app.state, "tracer", None)
+    container = Container.build(
+        settings, metrics=getattr(app.state, "metrics", None), tracer=tracer
+    )
+    app.state.container = container
+    if settings.openapi == OPENAPI_STARTUP and app.openapi_schema is None:
+        app.openapi()
+    start_events = getattr(container.event_publisher, "start", None)
+    if start_events is not None:
+        # Replays journaled events to handlers that subscribed before now.
+        start_events()
+    monitor = getattr(app.state, "loop_monitor", None)
+    if monitor is not None:
+        await monitor.start()
+    cool_down = asyncio.create_task(
+        cool_down_flash_sales(
+            container.end_cold_flash_sales, settings.flash_sale_cool_down_interval_s
+        )
+    )
+    try:
+        yield
+    finally:
+        cool_down.cancel()
+        if monitor is not None:
+            await monitor.stop()
+        await container.close()
+        if tracer is not None:
+            tracer.exporter.close()
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    from be_task_ca.drivers.rest.exception_handlers import (
+        register_exception_handlers,
+    )
+    from be_task_ca.drivers.rest.routers.cart_router import router as cart_router
+    from be_task_ca.drivers.rest.routers.item_router import router as item_router
+    from be_task_ca.drivers.rest.routers.user_router import router as user_router
+
+    settings = settings or Settings.from_env()
+    if settings.openapi not in OPENAPI_MODES:
+        raise ValueError(f"Unknown OpenAPI mode '{settings.openapi}'")
+    disabled = settings.openapi == OPENAPI_DISABLED
+
+    app = FastAPI(
+        title="Shopping Cart API - Clean Architecture",
+        description="",
+        version="2.0.0",
+        openapi_url=None if disabled else "/openapi.json",
+        docs_url=None if disabled else "/docs",
+        redoc_url=None if disabled else "/redoc",
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+
+    register_exception_handlers(app)
+    registry = None
+    if settings.metrics:
+        from be_task_ca.adapters.metrics.registry import MetricsRegistry
+
+        registry = MetricsRegistry()
+    # Middleware added first runs innermost: metrics and tracing wrap
+    # admission control and rate limiting, so rejected requests are still
+    # counted, and rate-limited requests never take an admission slot.
+    # Idempotency sits inside both, so a refused request never reaches its
+    # cache and a retry after a 429 or 503 runs normally.
+    if settings.idempotency:
+        from be_task_ca.adapters.idempotency.cache import IdempotencyCache
+        from be_task_ca.drivers.rest.idempotency import add_idempotency
+
+        add_idempotency(
+            app,
+            IdempotencyCache(
+                settings.idempotency_max_entries, settings.idempotency_ttl_s
+            ),
+            registry,
+        )
+    if settings.admission_limits:
+        from be_task_ca.drivers.rest.admission import add_admission
+
+        add_admission(
+            app,
+            (
+                ("users", user_router.prefix),
+                ("items", item_router.prefix),
+                ("cart", cart_router.prefix),
+            ),
+            settings.admission_limits,
+            settings.admission_max_wait_ms / 1000,
+            registry,
+        )
+    if settings.rate_limits:
+        from be_task_ca.drivers.rest.rate_limit import add_rate_limiting, build_buckets
+
+        add_rate_limiting(app, settings.rate_limits, build_buckets(settings), registry)
+    if registry is not None:
+        from be_task_ca.drivers.rest.metrics import add_metrics
+
+        add_metrics(app, registry)
+    if settings.tracing_exporter:
+        from be_task_ca.drivers.rest.tracing import TracingMiddleware, build_tracer
+
+        app.state.tracer = build_tracer(settings)
+        app.add_middleware(TracingMiddleware, tracer=app.state.tracer)
+    if settings.loop_monitor:
+        from be_task_ca.adapters.profiling.loop_monitor import LoopMonitor
+        from be_task_ca.drivers.rest.watchdog import add_watchdog
+
+        monitor = LoopMonitor(
+            settings.loop_lag_interval_ms / 1000,
+            settings.loop_block_threshold_ms / 1000,
+        )
+        add_watchdog(
+            app,
+            monitor,
+            settings.slow_request_ms / 1000,
+            registry,
+        )
+    if settings.admin_token:
+        from be_task_ca.drivers.rest.consistency import add_consistency_checks
+        from be_task_ca.drivers.rest.flash_sales import add_flash_sales
+        from be_task_ca.drivers.rest.profiling import add_profiling
+
+        add_profiling(app, settings.admin_token, settings.profile_max_seconds)
+        add_consistency_checks(app, settings.admin_token)
+        add_flash_sales(app, settings.admin_token)
+
+    app.include_router(user_router)
+    app.include_router(item_router)
+    app.include_router(cart_router)
 
-app = FastAPI(
-    title="Shopping Cart API - Clean Architecture",
-    description="",
-    version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+    @app.get("/", tags=["health"])
+    async def root():
+        return {
+            "status": "healthy",
+            "version": "2.0.0",
+        }
 
-register_exception_handlers(app)
+    if settings.openapi_schema_path and not disabled:
+        with open(settings.openapi_schema_path) as schema_file:
+            schema = json.load(schema_file)
+        app.openapi = lambda: schema  # type: ignore[method-assign]
 
-app.include_router(user_router)
-app.include_router(item_router)
-app.include_router(cart_router)
+    return app
 
 
-@app.get("/", tags=["health"])
-async def root():
-    return {
-        "status": "healthy",
-        "version": "2.0.0",
-    }
+def __getattr__(name: str):
+    # `app` is built on first access so importing this module (for
+    # create_app, tooling or tests) does not pull in every router.
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from be_task_ca.domain.entities.cart_summary import CartSummary
+from be_task_ca.drivers.rest.profiling import ADMIN_TOKEN_HEADER, is_admin, unauthorized
+
+
+def summary_body(summary: Optional[CartSummary]) -> Optional[Dict[str, Any]]:
+    if summary is None:
+        return None
+    return {
+        "line_count": summary.line_count,
+        "item_count": summary.item_count,
+        "total": summary.total_cents / 100,
+    }
+
+
+def add_consistency_checks(app: FastAPI, token: str) -> None:
+    async def check_cart_summaries(request: Request, repair: bool = False) -> Response:
+        if not is_admin(token, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return unauthorized()
+        mismatches = await request.app.state.container.check_cart_summaries(
+            repair=repair
+        )
+        return JSONResponse(
+            {
+                "mismatches": [
+                    {
+                        "user_id": str(mismatch.expected.user_id),
+                        "expected": summary_body(mismatch.expected),
+                        "actual": summary_body(mismatch.actual),
+                    }
+                    for mismatch in mismatches
+                ],
+                "repaired": len(mismatches) if repair else 0,
+            }
+        )
+
+    app.add_api_route(
+        "/admin/cart-summaries/check",
+        check_cart_summaries,
+        methods=["POST"],
+        include_in_schema=False,
+    )
@@ -0,0 +1,448 @@
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import (
+    InMemoryCartItemRepository,
+)
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import (
+    InMemoryCartSummaryRepository,
+)
+from be_task_ca.adapters.repositories.change_log import ChangeLoggingItemRepository
+from be_task_ca.adapters.repositories.item.in_memory_item_change_log import (
+    InMemoryItemChangeLog,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+from be_task_ca.adapters.security.pooled_password_hasher import PooledPasswordHasher
+from be_task_ca.adapters.tracing.tracer import Tracer
+from be_task_ca.drivers.rest.settings import Settings
+from be_task_ca.ports.events.event_publisher import EventPublisher
+from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
+from be_task_ca.ports.repositories.item_change_log import ItemChangeLog
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.ports.security.password_hasher import PasswordHasher
+from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
+from be_task_ca.use_cases.check_cart_summaries import CheckCartSummariesUseCase
+from be_task_ca.use_cases.create_item import CreateItemUseCase
+from be_task_ca.use_cases.end_flash_sale import (
+    EndColdFlashSalesUseCase,
+    EndFlashSaleUseCase,
+)
+from be_task_ca.use_cases.get_all_items import GetAllItemsUseCase
+from be_task_ca.use_cases.get_item_changes import GetItemChangesUseCase
+from be_task_ca.use_cases.get_user_cart import GetUserCartUseCase
+from be_task_ca.use_cases.get_user_cart_summary import GetUserCartSummaryUseCase
+from be_task_ca.use_cases.get_user_cart_totals import GetUserCartTotalsUseCase
+from be_task_ca.use_cases.save_user import CreateUserUseCase
+from be_task_ca.use_cases.start_flash_sale import StartFlashSaleUseCase
+from be_task_ca.use_cases.update_item_price import UpdateItemPriceUseCase
+
+Repositories = Tuple[UserRepository, ItemRepository, CartItemRepository]
+
+
+def in_memory_backend(settings: Settings) -> Repositories:
+    # Scans are only counted when there are spans to put the count on.
+    on_scan = None
+    if settings.tracing_exporter:
+        from be_task_ca.adapters.tracing.tracer import record_rows_scanned
+
+        on_scan = record_rows_scanned
+    return (
+        InMemoryUserRepository(on_scan),
+        InMemoryItemRepository(on_scan),
+        InMemoryCartItemRepository(on_scan),
+    )
+
+
+BACKENDS: Dict[str, Callable[[Settings], Repositories]] = {
+    "memory": in_memory_backend,
+}
+
+
+def build_backend(settings: Settings) -> Repositories:
+    if settings.repository_backend not in BACKENDS:
+        raise ValueError(f"Unknown repository backend '{settings.repository_backend}'")
+    return BACKENDS[settings.repository_backend](settings)
+
+
+def build_event_publisher(settings: Settings) -> EventPublisher:
+    if not settings.events:
+        from be_task_ca.adapters.events.null_event_publisher import (
+            NullEventPublisher,
+        )
+
+        return NullEventPublisher()
+    from be_task_ca.adapters.events.in_process_event_bus import InProcessEventBus
+
+    return InProcessEventBus(
+        settings.events_outbox_capacity,
+        settings.events_journal_path,
+    )
+
+
+def build_broadcaster(settings: Settings) -> Any:
+    # Needs the worker's running loop, so containers with cross-worker
+    # invalidation are built in the lifespan hook.
+    from be_task_ca.adapters.invalidation.broadcaster import InvalidationBroadcaster
+
+    broadcaster = InvalidationBroadcaster(
+        settings.cache_invalidation_dir, settings.cache_invalidation_window_ms / 1000
+    )
+    broadcaster.start()
+    return broadcaster
+
+
+USE_CASES = (
+    "create_user",
+    "create_item",
+    "get_all_items",
+    "get_item_changes",
+    "add_item_to_cart",
+    "get_user_cart",
+    "get_user_cart_totals",
+    "get_user_cart_summary",
+    "update_item_price",
+    "check_cart_summaries",
+    "start_flash_sale",
+    "end_flash_sale",
+    "end_cold_flash_sales",
+)
+
+
+def instrument_repositories(
+    metrics: MetricsRegistry,
+    repositories: Repositories,
+    stats_sources: Dict[str, Dict[str, Any]],
+) -> Repositories:
+    from be_task_ca.adapters.metrics.instrumented import (
+        InstrumentedRepository,
+        hit_ratio_collector,
+        stats_collector,
+    )
+
+    durations = metrics.histogram(
+        "repository_call_duration_seconds",
+        "Repository call latency",
+        ("repository", "method"),
+    )
+    errors = metrics.counter(
+        "repository_call_errors_total",
+        "Repository calls that raised",
+        ("repository", "method"),
+    )
+    for prefix, sources in stats_sources.items():
+        metrics.add_collector(
+            stats_collector(
+                prefix, "repository", sources, gauges=("in_flight", "entries")
+            )
+        )
+    if "entity_cache" in stats_sources:
+        metrics.add_collector(
+            hit_ratio_collector(
+                {
+                    f"entity_{name}": (lambda cache=cache: (cache.hits, cache.misses))
+                    for name, cache in stats_sources["entity_cache"].items()
+                }
+            )
+        )
+    if "single_flight" in stats_sources:
+        metrics.add_collector(
+            hit_ratio_collector(
+                {
+                    f"single_flight_{name}": (
+                        lambda flight=flight: (flight.coalesced, flight.executed)
+                    )
+                    for name, flight in stats_sources["single_flight"].items()
+                }
+            )
+        )
+    return cast(
+        Repositories,
+        tuple(
+            InstrumentedRepository(repository, name, durations, errors)
+            for name, repository in zip(("user", "item", "cart_item"), repositories)
+        ),
+    )
+
+
+def instrument_use_cases(metrics: MetricsRegistry, container: "Container") -> None:
+    from be_task_ca.adapters.metrics.instrumented import InstrumentedUseCase
+
+    durations = metrics.histogram(
+        "use_case_duration_seconds", "Use case latency", ("use_case", "outcome")
+    )
+    for name in USE_CASES:
+        setattr(
+            container,
+            name,
+            InstrumentedUseCase(getattr(container, name), name, durations),
+        )
+
+
+def trace_repositories(tracer: Tracer, repositories: Repositories) -> Repositories:
+    from be_task_ca.adapters.tracing.instrumented import TracedRepository
+
+    return cast(
+        Repositories,
+        tuple(
+            TracedRepository(repository, name, tracer)
+            for name, repository in zip(("user", "item", "cart_item"), repositories)
+        ),
+    )
+
+
+def trace_use_cases(tracer: Tracer, container: "Container") -> None:
+    from be_task_ca.adapters.tracing.instrumented import TracedUseCase
+
+    for name in USE_CASES:
+        setattr(container, name, TracedUseCase(getattr(container, name), name, tracer))
+
+
+@dataclass
+class Container:
+    settings: Settings
+    user_repository: UserRepository
+    item_repository: ItemRepository
+    cart_item_repository: CartItemRepository
+    cart_summary_repository: CartSummaryRepository
+    item_change_log: ItemChangeLog
+    password_hasher: PasswordHasher
+    event_publisher: EventPublisher
+    create_user: CreateUserUseCase
+    create_item: CreateItemUseCase
+    get_all_items: GetAllItemsUseCase
+    get_item_changes: GetItemChangesUseCase
+    add_item_to_cart: AddItemToCartUseCase
+    get_user_cart: GetUserCartUseCase
+    get_user_cart_totals: GetUserCartTotalsUseCase
+    get_user_cart_summary: GetUserCartSummaryUseCase
+    update_item_price: UpdateItemPriceUseCase
+    check_cart_summaries: CheckCartSummariesUseCase
+    start_flash_sale: StartFlashSaleUseCase
+    end_flash_sale: EndFlashSaleUseCase
+    end_cold_flash_sales: EndColdFlashSalesUseCase
+    closers: List[Callable[[], Any]] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls,
+        settings: Settings,
+        repositories: Optional[Repositories] = None,
+        password_hasher: Optional[PasswordHasher] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        event_publisher: Optional[EventPublisher] = None,
+        cart_summary_repository: Optional[CartSummaryRepository] = None,
+        item_change_log: Optional[ItemChangeLog] = None,
+    ) -> "Container":
+        closers: List[Callable[[], Any]] = []
+        stats_sources: Dict[str, Dict[str, Any]] = {}
+        user_repository: UserRepository
+        item_repository: ItemRepository
+        cart_item_repository: CartItemRepository
+        user_repository, item_repository, cart_item_repository = (
+            repositories or build_backend(settings)
+        )
+        # Innermost, so every decorator's writes reach the log once they are
+        # committed.
+        if item_change_log is None:
+            item_change_log = InMemoryItemChangeLog(settings.item_change_log_capacity)
+        item_repository = ChangeLoggingItemRepository(item_repository, item_change_log)
+
+        # Decorators are imported only when enabled so a plain deployment does
+        # not pay for them at cold start.
+        if settings.batch_writes_window_ms is not None:
+            from be_task_ca.adapters.repositories.write_batching import (
+                BatchedWriteItemRepository,
+                BatchedWriteUserRepository,
+            )
+
+            user_repository = BatchedWriteUserRepository(
+                user_repository,
+                settings.batch_writes_window_ms,
+                settings.write_batch_size,
+            )
+            item_repository = BatchedWriteItemRepository(
+                item_repository,
+                settings.batch_writes_window_ms,
+                settings.write_batch_size,
+            )
+            closers += [user_repository.batcher.close, item_repository.batcher.close]
+            stats_sources["write_batcher"] = {
+                "user": user_repository.batcher,
+                "item": item_repository.batcher,
+            }
+        if settings.batch_reads_window_us is not None:
+            from be_task_ca.adapters.repositories.batching import (
+                BatchingItemRepository,
+                BatchingUserRepository,
+            )
+
+            user_repository = BatchingUserRepository(
+                user_repository, settings.batch_reads_window_us
+            )
+            item_repository = BatchingItemRepository(
+                item_repository, settings.batch_reads_window_us
+            )
+            stats_sources["batch_loader"] = {
+                "user": user_repository.loader,
+                "item": item_repository.loader,
+            }
+        if settings.coalesce_reads:
+            from be_task_ca.adapters.repositories.coalescing import (
+                CoalescingCartItemRepository,
+                CoalescingItemRepository,
+                CoalescingUserRepository,
+            )
+
+            user_repository = CoalescingUserRepository(user_repository)
+            item_repository = CoalescingItemRepository(item_repository)
+            cart_item_repository = CoalescingCartItemRepository(cart_item_repository)
+            stats_sources["single_flight"] = {
+                "user": user_repository.single_flight,
+                "item": item_repository.single_flight,
+                "cart_item": cart_item_repository.single_flight,
+            }
+        if settings.cache_reads:
+            from be_task_ca.adapters.repositories.caching import (
+                CachingItemRepository,
+                CachingUserRepository,
+                EntityCache,
+            )
+
+            user_cache = EntityCache(settings.cache_max_entries, settings.cache_ttl_s)
+            item_cache = EntityCache(settings.cache_max_entries, settings.cache_ttl_s)
+            publish = None
+            if settings.cache_invalidation_dir is not None:
+                broadcaster = build_broadcaster(settings)
+                broadcaster.subscribe(user_cache.invalidate)
+                broadcaster.subscribe(item_cache.invalidate)
+                closers.append(broadcaster.close)
+                publish = broadcaster.publish
+                if metrics is not None:
+                    from be_task_ca.adapters.metrics.instrumented import (
+                        stats_collector,
+                    )
+
+                    metrics.add_collector(
+                        stats_collector(
+                            "cache_invalidation", "transport", {"unix": broadcaster}
+                        )
+                    )
+            user_repository = CachingUserRepository(
+                user_repository, user_cache, publish
+            )
+            item_repository = CachingItemRepository(
+                item_repository, item_cache, publish
+            )
+            stats_sources["entity_cache"] = {"user": user_cache, "item": item_cache}
+        if metrics is not None:
+            user_repository, item_repository, cart_item_repository = (
+                instrument_repositories(
+                    metrics,
+                    (user_repository, item_repository, cart_item_repository),
+                    stats_sources,
+                )
+            )
+        if tracer is not None:
+            user_repository, item_repository, cart_item_repository = trace_repositories(
+                tracer, (user_repository, item_repository, cart_item_repository)
+            )
+
+        if password_hasher is None:
+            pooled = PooledPasswordHasher(
+                kdf=settings.password_kdf,
+                cost=settings.password_cost,
+                max_workers=settings.password_hash_workers,
+                max_pending=settings.password_hash_max_pending,
+                use_processes=settings.password_hash_processes,
+            )
+            closers.append(pooled.close)
+            password_hasher = pooled
+
+        if event_publisher is None:
+            event_publisher = build_event_publisher(settings)
+            close_events = getattr(event_publisher, "close", None)
+            if close_events is not None:
+                # Handlers may still use the repositories and the hasher, so
+                # the bus drains before anything else is closed.
+                closers.insert(0, close_events)
+            if metrics is not None and hasattr(event_publisher, "stats"):
+                from be_task_ca.adapters.metrics.instrumented import stats_collector
+
+                metrics.add_collector(
+                    stats_collector(
+                        "events", "bus", {"in_process": event_publisher}, ("backlog",)
+                    )
+                )
+
+        if cart_summary_repository is None:
+            cart_summary_repository = InMemoryCartSummaryRepository()
+
+        container = cls(
+            settings=settings,
+            user_repository=user_repository,
+            item_repository=item_repository,
+            cart_item_repository=cart_item_repository,
+            cart_summary_repository=cart_summary_repository,
+            item_change_log=item_change_log,
+            password_hasher=password_hasher,
+            event_publisher=event_publisher,
+            create_user=CreateUserUseCase(
+                user_repository, password_hasher, event_publisher
+            ),
+            create_item=CreateItemUseCase(item_repository, event_publisher),
+            get_all_items=GetAllItemsUseCase(item_repository),
+            get_item_changes=GetItemChangesUseCase(item_change_log, item_repository),
+            add_item_to_cart=AddItemToCartUseCase(
+                cart_item_repository,
+                user_repository,
+                item_repository,
+                cart_summary_repository,
+                event_publisher,
+            ),
+            get_user_cart=GetUserCartUseCase(cart_item_repository, user_repository),
+            get_user_cart_totals=GetUserCartTotalsUseCase(
+                cart_item_repository, user_repository, item_repository
+            ),
+            get_user_cart_summary=GetUserCartSummaryUseCase(
+                cart_summary_repository, user_repository
+            ),
+            update_item_price=UpdateItemPriceUseCase(
+                item_repository, cart_summary_repository, event_publisher
+            ),
+            check_cart_summaries=CheckCartSummariesUseCase(
+                cart_item_repository, item_repository, cart_summary_repository
+            ),
+            start_flash_sale=StartFlashSaleUseCase(
+                item_repository, settings.flash_sale_shards
+            ),
+            end_flash_sale=EndFlashSaleUseCase(item_repository),
+            end_cold_flash_sales=EndColdFlashSalesUseCase(
+                item_repository, settings.flash_sale_idle_s
+            ),
+            closers=closers,
+        )
+        if metrics is not None:
+            instrument_use_cases(metrics, container)
+        if tracer is not None:
+            trace_use_cases(tracer, container)
+        return container
+
+    async def close(self) -> None:
+        # Write batchers flush before the hasher pool is torn down; both were
+        # registered in build order.
+        while self.closers:
+            result = self.closers.pop(0)()
+            if inspect.isawaitable(result):
+                await result
@@ -1,70 +1,75 @@
 from typing import Annotated
-from functools import lru_cache
-
-from fastapi import Depends
-
-from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
-    InMemoryUserRepository,
-)
-from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
-    InMemoryItemRepository,
-)
-from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import (
-    InMemoryCartItemRepository,
-)
-from be_task_ca.ports.repositories.user_repository import UserRepository
-from be_task_ca.ports.repositories.item_repository import ItemRepository
-from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+
+from fastapi import Depends, Request
+
+from be_task_ca.drivers.rest.container import Container
 from be_task_ca.use_cases.save_user import CreateUserUseCase
 from be_task_ca.use_cases.create_item import CreateItemUseCase
 from be_task_ca.use_cases.get_all_items import GetAllItemsUseCase
+from be_task_ca.use_cases.get_item_changes import GetItemChangesUseCase
 from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
 from be_task_ca.use_cases.get_user_cart import GetUserCartUseCase
+from be_task_ca.use_cases.get_user_cart_totals import GetUserCartTotalsUseCase
+from be_task_ca.use_cases.get_user_cart_summary import GetUserCartSummaryUseCase
+from be_task_ca.use_cases.update_item_price import UpdateItemPriceUseCase
 
+# Every provider is async: FastAPI would otherwise hop to the threadpool to
+# call a plain function, which costs more than the lookup itself.
 
-@lru_cache
-def get_user_repository() -> UserRepository:
-    return InMemoryUserRepository()
-
-
-@lru_cache
-def get_item_repository() -> ItemRepository:
-    return InMemoryItemRepository()
 
+async def get_container(request: Request) -> Container:
+    return request.app.state.container
 
-@lru_cache
-def get_cart_item_repository() -> CartItemRepository:
-    return InMemoryCartItemRepository()
 
-
-def get_create_user_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+async def get_create_user_use_case(
+    container: Annotated[Container, Depends(get_container)],
 ) -> CreateUserUseCase:
-    return CreateUserUseCase(user_repo)
+    return container.create_user
 
 
-def get_create_item_use_case(
-    item_repo: Annotated[ItemRepository, Depends(get_item_repository)],
+async def get_create_item_use_case(
+    container: Annotated[Container, Depends(get_container)],
 ) -> CreateItemUseCase:
-    return CreateItemUseCase(item_repo)
+    return container.create_item
 
 
-def get_all_items_use_case(
-    item_repo: Annotated[ItemRepository, Depends(get_item_repository)],
+async def get_all_items_use_case(
+    container: Annotated[Container, Depends(get_container)],
 ) -> GetAllItemsUseCase:
-    return GetAllItemsUseCase(item_repo)
+    return container.get_all_items
+
+
+async def get_item_changes_use_case(
+    container: Annotated[Container, Depends(get_container)],
+) -> GetItemChangesUseCase:
+    return container.get_item_changes
 
 
-def get_add_item_to_cart_use_case(
-    cart_repo: Annotated[CartItemRepository, Depends(get_cart_item_repository)],
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
-    item_repo: Annotated[ItemRepository, Depends(get_item_repository)],
+async def get_add_item_to_cart_use_case(
+    container: Annotated[Container, Depends(get_container)],
 ) -> AddItemToCartUseCase:
-    return AddItemToCartUseCase(cart_repo, user_repo, item_repo)
+    return container.add_item_to_cart
 
 
-def get_user_cart_use_case(
-    cart_repo: Annotated[CartItemRepository, Depends(get_cart_item_repository)],
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+async def get_user_cart_use_case(
+    container: Annotated[Container, Depends(get_container)],
 ) -> GetUserCartUseCase:
-    return GetUserCartUseCase(cart_repo, user_repo)
+    return container.get_user_cart
+
+
+async def get_user_cart_totals_use_case(
+    container: Annotated[Container, Depends(get_container)],
+) -> GetUserCartTotalsUseCase:
+    return container.get_user_cart_totals
+
+
+async def get_user_cart_summary_use_case(
+    container: Annotated[Container, Depends(get_container)],
+) -> GetUserCartSummaryUseCase:
+    return container.get_user_cart_summary
+
+
+async def get_update_item_price_use_case(
+    container: Annotated[Container, Depends(get_container)],
+) -> UpdateItemPriceUseCase:
+    return container.update_item_price
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
+from be_task_ca.ports.security.password_hasher import PasswordHasherOverloadedError
 from be_task_ca.use_cases.exceptions.user_exceptions import (
     UserNotFoundError,
     EmailAlreadyExistsError,
@@ -68,6 +69,16 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"error": "item_already_in_cart", "message": str(exc)},
         )
 
+    @app.exception_handler(PasswordHasherOverloadedError)
+    async def password_hasher_overloaded_handler(
+        request: Request, exc: PasswordHasherOverloadedError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"error": "service_overloaded", "message": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
         return JSONResponse(
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List
+from uuid import UUID
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from be_task_ca.drivers.rest.profiling import ADMIN_TOKEN_HEADER, is_admin, unauthorized
+
+logger = logging.getLogger("be_task_ca.flash_sales")
+
+
+async def cool_down_flash_sales(
+    end_cold_flash_sales: Callable[[], Awaitable[List[UUID]]], interval: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            ended = await end_cold_flash_sales()
+        except Exception:
+            logger.exception("Merging cold flash sales failed")
+            continue
+        for item_id in ended:
+            logger.info("Flash sale for item %s cooled down and was merged", item_id)
+
+
+def add_flash_sales(app: FastAPI, token: str) -> None:
+    async def start_flash_sale(request: Request, item_id: UUID) -> Response:
+        if not is_admin(token, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return unauthorized()
+        container = request.app.state.container
+        await container.start_flash_sale(item_id)
+        return JSONResponse(
+            {"item_id": str(item_id), "shards": container.settings.flash_sale_shards}
+        )
+
+    async def end_flash_sale(request: Request, item_id: UUID) -> Response:
+        if not is_admin(token, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return unauthorized()
+        ended = await request.app.state.container.end_flash_sale(item_id)
+        return JSONResponse({"item_id": str(item_id), "ended": ended})
+
+    app.add_api_route(
+        "/admin/items/{item_id}/flash-sale",
+        start_flash_sale,
+        methods=["POST"],
+        include_in_schema=False,
+    )
+    app.add_api_route(
+        "/admin/items/{item_id}/flash-sale",
+        end_flash_sale,
+        methods=["DELETE"],
+        include_in_schema=False,
+    )
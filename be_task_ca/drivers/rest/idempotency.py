@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import json
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+
+from be_task_ca.adapters.idempotency.cache import IdempotencyCache, StoredResponse
+from be_task_ca.adapters.metrics.instrumented import stats_collector
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+
+KEY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+MAX_BODY_BYTES = 1 << 20
+# Refusals that say nothing about the request itself; storing them would
+# replay a rate limit or a timeout for as long as the key lives.
+NOT_STORED = frozenset({408, 429})
+
+
+def error(status: int, code: str, message: str) -> StoredResponse:
+    return StoredResponse(
+        fingerprint="",
+        status=status,
+        headers=[(b"content-type", b"application/json")],
+        body=json.dumps({"error": code, "message": message}).encode(),
+        expires=0.0,
+    )
+
+
+class BodyTooLarge(Exception):
+    pass
+
+
+class IdempotencyMiddleware:
+    # POST requests with an Idempotency-Key and an Authorization credential
+    # run once per (credential, path, key):
+    # the first non-5xx response is stored and replayed for later duplicates,
+    # and duplicates arriving while the first is still running wait for it
+    # instead of running the use case again. Reusing a key with a different
+    # body is a 422. Server errors, 408 and 429 are not stored, so they can
+    # be retried. Requests without a credential pass straight through: a
+    # peer address can be shared behind NAT or a proxy, and replaying one
+    # client's response to another would leak it. Request bodies are
+    # buffered to fingerprint them, so they are capped at MAX_BODY_BYTES.
+    def __init__(self, app: Any, cache: IdempotencyCache):
+        self.app = app
+        self.cache = cache
+        self.in_flight: Dict[str, "asyncio.Future[None]"] = {}
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        idempotency_key = headers.get(KEY_HEADER)
+        client = credential(headers)
+        if idempotency_key is None or client is None:
+            await self.app(scope, receive, send)
+            return
+        if not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+            await respond(
+                send,
+                error(
+                    400,
+                    "invalid_idempotency_key",
+                    f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters",
+                ),
+            )
+            return
+
+        try:
+            body = await read_body(receive)
+        except BodyTooLarge:
+            await respond(
+                send,
+                error(
+                    413,
+                    "request_too_large",
+                    f"Requests with an Idempotency-Key are limited to "
+                    f"{MAX_BODY_BYTES} bytes",
+                ),
+            )
+            return
+        if body is None:
+            return
+        key = f"{client}|{scope['path']}|{idempotency_key.decode('latin-1')}"
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        while True:
+            stored = self.cache.get(key, monotonic())
+            if stored is not None:
+                await self.replay(send, stored, fingerprint)
+                return
+            pending = self.in_flight.get(key)
+            if pending is None:
+                break
+            self.cache.coalesced += 1
+            await asyncio.shield(pending)
+
+        await self.execute(scope, receive, send, key, fingerprint, body)
+
+    async def replay(
+        self, send: Callable, stored: StoredResponse, fingerprint: str
+    ) -> None:
+        if stored.fingerprint != fingerprint:
+            self.cache.mismatched += 1
+            await respond(
+                send,
+                error(
+                    422,
+                    "idempotency_key_reused",
+                    "Idempotency-Key was already used with a different request body",
+                ),
+            )
+            return
+        self.cache.replayed += 1
+        await respond(send, stored, ((REPLAYED_HEADER, b"true"),))
+
+    async def execute(
+        self,
+        scope: dict,
+        receive: Callable,
+        send: Callable,
+        key: str,
+        fingerprint: str,
+        body: bytes,
+    ) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        status: Optional[int] = None
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+        complete = False
+
+        async def capture(message: dict) -> None:
+            nonlocal status, headers, size, complete
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size <= MAX_BODY_BYTES:
+                    chunks.append(chunk)
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, replay_body(body, receive), capture)
+        finally:
+            del self.in_flight[key]
+            if (
+                complete
+                and status is not None
+                and status < 500
+                and status not in NOT_STORED
+                and size <= MAX_BODY_BYTES
+            ):
+                self.cache.put(
+                    key, fingerprint, status, headers, b"".join(chunks), monotonic()
+                )
+            future.set_result(None)
+
+
+def credential(headers: Dict[bytes, bytes]) -> Optional[str]:
+    # Hashed, so the cache never holds the credential itself.
+    authorization = headers.get(b"authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization).hexdigest()
+
+
+async def read_body(receive: Callable) -> Optional[bytes]:
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise BodyTooLarge()
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive: Callable) -> Callable:
+    sent = False
+
+    async def receive_replayed() -> dict:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive_replayed
+
+
+async def respond(
+    send: Callable,
+    response: StoredResponse,
+    extra_headers: Tuple[Tuple[bytes, bytes], ...] = (),
+) -> None:
+    headers = [
+        (name, value) for name, value in response.headers if name != b"content-length"
+    ]
+    headers += [
+        (b"content-length", str(len(response.body)).encode()),
+        *extra_headers,
+    ]
+    await send(
+        {"type": "http.response.start", "status": response.status, "headers": headers}
+    )
+    await send({"type": "http.response.body", "body": response.body})
+
+
+def add_idempotency(
+    app: FastAPI, cache: IdempotencyCache, registry: Optional[MetricsRegistry] = None
+) -> None:
+    app.state.idempotency = cache
+    app.add_middleware(IdempotencyMiddleware, cache=cache)
+    if registry is not None:
+        registry.add_collector(
+            stats_collector("idempotency", "cache", {"responses": cache}, ("entries",))
+        )
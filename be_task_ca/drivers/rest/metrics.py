@@ -0,0 +1,83 @@
+from time import perf_counter
+from typing import Any, Callable, List
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from be_task_ca.adapters.metrics.registry import Family, Histogram, MetricsRegistry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsMiddleware:
+    # A plain ASGI middleware: BaseHTTPMiddleware would add a task and a
+    # stream per request, which is most of the budget we have.
+    def __init__(self, app: Any, registry: MetricsRegistry):
+        self.app = app
+        labels = ("method", "route", "status")
+        self.durations = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency", labels
+        )
+        # The request counter is read off the histogram at scrape time instead
+        # of being incremented separately on every request.
+        registry.add_collector(request_counter(self.durations))
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served"
+        )
+        self.in_flight.set((), 0)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = self.in_flight.values
+        in_flight[()] += 1
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            in_flight[()] -= 1
+            # The router stores the matched route in the shared scope; the
+            # template keeps label cardinality bounded (no raw ids or 404 paths).
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status),
+            )
+            self.durations.labels(labels).observe(elapsed)
+
+
+def request_counter(durations: Histogram) -> Callable[[], List[Family]]:
+    def collect() -> List[Family]:
+        samples = [
+            (
+                "http_requests_total",
+                dict(zip(durations.labelnames, labels)),
+                sum(series.counts),
+            )
+            for labels, series in durations.series.items()
+        ]
+        return [("http_requests_total", "counter", "HTTP requests", samples)]
+
+    return collect
+
+
+def add_metrics(app: FastAPI, registry: MetricsRegistry) -> None:
+    app.state.metrics = registry
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+    app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
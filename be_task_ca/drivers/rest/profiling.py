@@ -0,0 +1,186 @@
+import asyncio
+import hmac
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from be_task_ca.adapters.profiling.request_profiler import RequestProfiler
+from be_task_ca.adapters.profiling.sampler import StackSampler
+from be_task_ca.adapters.profiling.stacks import collapse
+
+ADMIN_TOKEN_HEADER = "x-admin-token"
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+
+
+def is_admin(token: str, presented: Optional[str]) -> bool:
+    return presented is not None and hmac.compare_digest(
+        presented.encode(), token.encode()
+    )
+
+
+def unauthorized() -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"error": "unauthorized", "message": "Admin token required"},
+    )
+
+
+class ProfileStore:
+    def __init__(self, capacity: int = 32):
+        self.capacity = capacity
+        self._profiles: "OrderedDict[str, str]" = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> str:
+        return str(next(self._ids))
+
+    def put(self, profile_id: str, profile: str) -> None:
+        self._profiles[profile_id] = profile
+        while len(self._profiles) > self.capacity:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[str]:
+        return self._profiles.get(profile_id)
+
+
+class ProfilingMiddleware:
+    # Profiles a single request when it carries `X-Profile: 1` and the admin
+    # token. The profile id goes out in a response header and the collapsed
+    # stacks (microseconds of CPU per stack) are stored before the final body
+    # chunk is sent, so the id can be fetched as soon as the response arrives.
+    def __init__(self, app: Any, token: str, store: ProfileStore):
+        self.app = app
+        self.token = token.encode()
+        self.store = store
+        self.active: Optional[RequestProfiler] = None
+
+    def wants_profile(self, scope: dict) -> bool:
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_HEADER.encode()) != b"1":
+            return False
+        presented = headers.get(ADMIN_TOKEN_HEADER.encode())
+        return presented is not None and hmac.compare_digest(presented, self.token)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not self.wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if self.active is not None:
+            # sys.setprofile is per thread, so profiles cannot overlap.
+            await self.app(scope, receive, self.marked(send, b"busy"))
+            return
+
+        profile_id = self.store.next_id()
+        profiler = RequestProfiler(asyncio.current_task())
+        self.active = profiler
+
+        def finish() -> None:
+            if self.active is profiler:
+                self.active = None
+                stacks = profiler.stop()
+                for stack in stacks:
+                    stacks[stack] //= 1000
+                self.store.put(profile_id, collapse(stacks))
+
+        async def send_profiled(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER.encode(), profile_id.encode()),
+                ]
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finish()
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_profiled)
+        finally:
+            finish()
+
+    def marked(self, send: Callable, value: bytes) -> Callable:
+        async def send_marked(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_HEADER.encode(), value),
+                ]
+            await send(message)
+
+        return send_marked
+
+
+def add_profiling(app: FastAPI, token: str, max_seconds: float) -> None:
+    store = ProfileStore()
+    app.state.profiles = store
+    app.add_middleware(ProfilingMiddleware, token=token, store=store)
+    running = threading.Lock()
+
+    async def profile(
+        request: Request,
+        seconds: float = 5.0,
+        interval_ms: float = 5.0,
+        all_threads: bool = False,
+    ) -> Response:
+        if not is_admin(token, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return unauthorized()
+        if not 0 < seconds <= max_seconds or interval_ms <= 0:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "error": "invalid_profile",
+                    "message": f"seconds must be in (0, {max_seconds}] and "
+                    "interval_ms positive",
+                },
+            )
+        if not running.acquire(blocking=False):
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={
+                    "error": "profile_running",
+                    "message": "A profile is already running on this worker",
+                },
+            )
+        try:
+            sampler = StackSampler(
+                None if all_threads else threading.get_ident(), interval_ms / 1000
+            )
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                samples = sampler.stop()
+        finally:
+            running.release()
+        return PlainTextResponse(collapse(samples))
+
+    async def stored_profile(request: Request, profile_id: str) -> Response:
+        if not is_admin(token, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return unauthorized()
+        profile = store.get(profile_id)
+        if profile is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={
+                    "error": "profile_not_found",
+                    "message": f"Profile {profile_id} not found",
+                },
+            )
+        return PlainTextResponse(profile)
+
+    app.add_api_route(
+        "/admin/profile", profile, methods=["GET"], include_in_schema=False
+    )
+    app.add_api_route(
+        "/admin/profiles/{profile_id}",
+        stored_profile,
+        methods=["GET"],
+        include_in_schema=False,
+    )
@@ -0,0 +1,133 @@
+import json
+import math
+import re
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+from fastapi import FastAPI
+
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+from be_task_ca.adapters.rate_limit.buckets import (
+    InMemoryTokenBuckets,
+    SharedTokenBuckets,
+    TokenBuckets,
+)
+from be_task_ca.drivers.rest.settings import Settings
+
+# (method, route template, rate per second, burst)
+RateLimit = Tuple[str, str, float, float]
+Rule = Tuple[str, str, Pattern, float, float]
+
+STORES: Dict[str, Callable[[Settings], TokenBuckets]] = {
+    "memory": lambda settings: InMemoryTokenBuckets(settings.rate_limit_max_keys),
+    # Created while the app is built, so before `serve` forks its workers.
+    "shared": lambda settings: SharedTokenBuckets(settings.rate_limit_max_keys),
+}
+
+
+def build_buckets(settings: Settings) -> TokenBuckets:
+    store = settings.rate_limit_store
+    if store not in STORES:
+        raise ValueError(f"Unknown rate limit store '{store}'")
+    return STORES[store](settings)
+
+
+def template_pattern(template: str) -> Pattern:
+    # "/users/{user_id}/cart/" -> ^/users/(?P<user_id>[^/]+)/cart/$
+    parts = re.split(r"\{([^}]+)\}", template)
+    pattern = "".join(
+        f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part)
+        for index, part in enumerate(parts)
+    )
+    return re.compile(f"^{pattern}$")
+
+
+def client_key(scope: dict) -> str:
+    # The peer address. Requests are not authenticated, so nothing else the
+    # client sends can be trusted: a user id in the path or a credential
+    # header would let a caller cycle values to dodge its limit, or spend
+    # someone else's. Not X-Forwarded-For either, which any client can set.
+    client = scope.get("client")
+    return f"client:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    # Matches the request against the configured routes before routing and
+    # spends a token from the bucket of (route template, client). Requests
+    # with no rule pass through after one method comparison per rule.
+    def __init__(
+        self,
+        app: Any,
+        rules: Sequence[Rule],
+        buckets: TokenBuckets,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        self.app = app
+        self.rules = rules
+        self.buckets = buckets
+        self.limited = (
+            registry.counter(
+                "http_rate_limited_total",
+                "Requests rejected by rate limits",
+                ("route",),
+            )
+            if registry is not None
+            else None
+        )
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "http":
+            method, path = scope["method"], scope["path"]
+            for rule_method, template, pattern, rate, burst in self.rules:
+                if rule_method != method:
+                    continue
+                if pattern.match(path) is None:
+                    continue
+                wait = self.buckets.take(
+                    f"{template}|{client_key(scope)}", rate, burst, monotonic()
+                )
+                if wait:
+                    if self.limited is not None:
+                        self.limited.inc((template,))
+                    await too_many_requests(send, wait)
+                    return
+                break
+        await self.app(scope, receive, send)
+
+
+async def too_many_requests(send: Callable, wait: float) -> None:
+    body = json.dumps(
+        {"error": "rate_limited", "message": "Too many requests, retry later"}
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(wait))).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def build_rules(limits: Sequence[RateLimit]) -> List[Rule]:
+    return [
+        (method.upper(), template, template_pattern(template), rate, burst)
+        for method, template, rate, burst in limits
+    ]
+
+
+def add_rate_limiting(
+    app: FastAPI,
+    limits: Sequence[RateLimit],
+    buckets: TokenBuckets,
+    registry: Optional[MetricsRegistry] = None,
+) -> None:
+    rules = build_rules(limits)
+    app.state.rate_limit_buckets = buckets
+    app.add_middleware(
+        RateLimitMiddleware, rules=rules, buckets=buckets, registry=registry
+    )
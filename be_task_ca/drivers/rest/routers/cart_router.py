@@ -5,14 +5,21 @@ from fastapi import APIRouter, Depends, status
 
 from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
 from be_task_ca.use_cases.get_user_cart import GetUserCartUseCase
+from be_task_ca.use_cases.get_user_cart_totals import GetUserCartTotalsUseCase
+from be_task_ca.use_cases.get_user_cart_summary import GetUserCartSummaryUseCase
 from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
 from be_task_ca.drivers.rest.dependencies import (
     get_add_item_to_cart_use_case,
     get_user_cart_use_case,
+    get_user_cart_totals_use_case,
+    get_user_cart_summary_use_case,
 )
 from be_task_ca.drivers.rest.schemas.cart_schemas import (
     AddToCartRequest,
     CartItemResponse,
+    CartLineResponse,
+    CartSummaryResponse,
+    CartTotalsResponse,
 )
 
 router = APIRouter(
@@ -57,3 +64,51 @@ async def get_cart(
         )
         for cart_item in cart_items
     ]
+
+
+@router.get(
+    "/totals", response_model=CartTotalsResponse, status_code=status.HTTP_200_OK
+)
+async def get_cart_totals(
+    user_id: UUID,
+    use_case: Annotated[
+        GetUserCartTotalsUseCase, Depends(get_user_cart_totals_use_case)
+    ],
+) -> CartTotalsResponse:
+    totals = await use_case(user_id)
+
+    return CartTotalsResponse(
+        user_id=totals.user_id,
+        lines=[
+            CartLineResponse(
+                item_id=line.item_id,
+                name=line.name,
+                unit_price=line.unit_price_cents / 100,
+                quantity=line.quantity,
+                line_total=line.line_total_cents / 100,
+            )
+            for line in totals.lines
+        ],
+        subtotal=totals.subtotal_cents / 100,
+        item_count=totals.item_count,
+        total=totals.total_cents / 100,
+    )
+
+
+@router.get(
+    "/summary", response_model=CartSummaryResponse, status_code=status.HTTP_200_OK
+)
+async def get_cart_summary(
+    user_id: UUID,
+    use_case: Annotated[
+        GetUserCartSummaryUseCase, Depends(get_user_cart_summary_use_case)
+    ],
+) -> CartSummaryResponse:
+    summary = await use_case(user_id)
+
+    return CartSummaryResponse(
+        user_id=summary.user_id,
+        line_count=summary.line_count,
+        item_count=summary.item_count,
+        total=summary.total_cents / 100,
+    )
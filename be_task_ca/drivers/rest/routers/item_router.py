@@ -1,15 +1,28 @@
 from typing import Annotated, List
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from be_task_ca.use_cases.create_item import CreateItemUseCase
 from be_task_ca.use_cases.get_all_items import GetAllItemsUseCase
-from be_task_ca.use_cases.commands.item_commands import CreateItemCommand
+from be_task_ca.use_cases.get_item_changes import GetItemChangesUseCase
+from be_task_ca.use_cases.update_item_price import UpdateItemPriceUseCase
+from be_task_ca.use_cases.commands.item_commands import (
+    CreateItemCommand,
+    UpdateItemPriceCommand,
+)
 from be_task_ca.drivers.rest.dependencies import (
     get_create_item_use_case,
     get_all_items_use_case,
+    get_item_changes_use_case,
+    get_update_item_price_use_case,
+)
+from be_task_ca.drivers.rest.schemas.item_schemas import (
+    CreateItemRequest,
+    ItemChangesResponse,
+    ItemResponse,
+    UpdateItemPriceRequest,
 )
-from be_task_ca.drivers.rest.schemas.item_schemas import CreateItemRequest, ItemResponse
 
 router = APIRouter(
     prefix="/items",
@@ -56,3 +69,49 @@ async def get_all_items(
         )
         for item in items
     ]
+
+
+@router.get(
+    "/changes", response_model=ItemChangesResponse, status_code=status.HTTP_200_OK
+)
+async def get_item_changes(
+    use_case: Annotated[GetItemChangesUseCase, Depends(get_item_changes_use_case)],
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 500,
+) -> ItemChangesResponse:
+    changes = await use_case(since, limit)
+
+    return ItemChangesResponse(
+        items=[
+            ItemResponse(
+                id=item.id,
+                name=item.name,
+                description=item.description,
+                price=item.price,
+                quantity=item.quantity,
+            )
+            for item in changes.items
+        ],
+        next_since=changes.next_since,
+        has_more=changes.has_more,
+        resync=changes.resync,
+    )
+
+
+@router.patch("/{item_id}", response_model=ItemResponse, status_code=status.HTTP_200_OK)
+async def update_item_price(
+    item_id: UUID,
+    request: UpdateItemPriceRequest,
+    use_case: Annotated[
+        UpdateItemPriceUseCase, Depends(get_update_item_price_use_case)
+    ],
+) -> ItemResponse:
+    item = await use_case(UpdateItemPriceCommand(item_id=item_id, price=request.price))
+
+    return ItemResponse(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        quantity=item.quantity,
+    )
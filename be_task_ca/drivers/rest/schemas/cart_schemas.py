@@ -1,3 +1,4 @@
+from typing import List
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -11,3 +12,26 @@ class CartItemResponse(BaseModel):
     user_id: UUID
     item_id: UUID
     quantity: int
+
+
+class CartLineResponse(BaseModel):
+    item_id: UUID
+    name: str
+    unit_price: float
+    quantity: int
+    line_total: float
+
+
+class CartTotalsResponse(BaseModel):
+    user_id: UUID
+    lines: List[CartLineResponse]
+    subtotal: float
+    item_count: int
+    total: float
+
+
+class CartSummaryResponse(BaseModel):
+    user_id: UUID
+    line_count: int
+    item_count: int
+    total: float
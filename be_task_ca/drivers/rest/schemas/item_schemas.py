@@ -1,3 +1,4 @@
+from typing import List
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -9,9 +10,20 @@ class CreateItemRequest(BaseModel):
     quantity: int = Field(..., ge=0)
 
 
+class UpdateItemPriceRequest(BaseModel):
+    price: float = Field(..., gt=0)
+
+
 class ItemResponse(BaseModel):
     id: UUID
     name: str
     description: str
     price: float
     quantity: int
+
+
+class ItemChangesResponse(BaseModel):
+    items: List[ItemResponse]
+    next_since: int
+    has_more: bool
+    resync: bool
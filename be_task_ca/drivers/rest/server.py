@@ -0,0 +1,222 @@
+import gc
+import importlib.util
+import logging
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from collections import deque
+from dataclasses import replace
+from typing import Deque, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI
+
+from be_task_ca.drivers.rest.app import OPENAPI_DISABLED, create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def pick_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def pick_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload(settings: Settings) -> FastAPI:
+    # Build and warm everything import- or first-request-shaped in the parent
+    # so forked workers share those pages instead of each paying for them.
+    # The container is not built here: it owns thread pools, which do not
+    # survive a fork, so each worker builds its own in the lifespan hook.
+    import be_task_ca.drivers.rest.container  # noqa: F401
+
+    app = create_app(settings)
+    if settings.openapi != OPENAPI_DISABLED:
+        app.openapi()
+    app.middleware_stack = app.build_middleware_stack()
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def build_config(app: FastAPI, settings: Settings) -> uvicorn.Config:
+    return uvicorn.Config(
+        app,
+        loop=pick_loop(),
+        http=pick_http(),
+        lifespan="on",
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.keep_alive_s,
+    )
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def spawn_worker(config: uvicorn.Config, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    gc.enable()
+    # The child must never return into the supervisor loop, whatever happens.
+    code = 1
+    try:
+        run_worker(config, sock)
+        code = 0
+    except Exception:
+        logger.exception("Worker %s crashed", os.getpid())
+    finally:
+        os._exit(code)
+
+
+class RestartPolicy:
+    # Exits of a worker slot within the last `window` seconds double its
+    # restart delay; more than `max_restarts` of them means the worker cannot
+    # stay up (bad settings, a crash on boot) and the server gives up.
+    def __init__(
+        self,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        max_restarts: int = 5,
+        window: float = 60.0,
+    ):
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_restarts = max_restarts
+        self.window = window
+        self._exits: Dict[int, Deque[float]] = {}
+
+    def delay(self, slot: int, now: float) -> Optional[float]:
+        exits = self._exits.setdefault(slot, deque())
+        exits.append(now)
+        while exits[0] <= now - self.window:
+            exits.popleft()
+        if len(exits) > self.max_restarts:
+            return None
+        return min(self.max_backoff, self.backoff * 2 ** (len(exits) - 1))
+
+
+def supervise(
+    config: uvicorn.Config,
+    sock: socket.socket,
+    workers: int,
+    graceful_timeout: float,
+    policy: Optional[RestartPolicy] = None,
+) -> int:
+    policy = policy or RestartPolicy()
+    children: Dict[int, int] = {}
+    restarts: Dict[int, float] = {}
+    deadline: Optional[float] = None
+    killed = False
+    gave_up = False
+
+    def stop(signum, frame) -> None:
+        nonlocal deadline
+        if deadline is None:
+            deadline = time.monotonic() + graceful_timeout
+            restarts.clear()
+            logger.info("Draining %d workers", len(children))
+            for pid in children:
+                os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for slot in range(workers):
+        children[spawn_worker(config, sock)] = slot
+
+    while children or restarts:
+        now = time.monotonic()
+        for slot, due in list(restarts.items()):
+            if due <= now:
+                del restarts[slot]
+                children[spawn_worker(config, sock)] = slot
+        pid, status = os.waitpid(-1, os.WNOHANG) if children else (0, 0)
+        if pid:
+            slot = children.pop(pid)
+            if deadline is None:
+                delay = policy.delay(slot, time.monotonic())
+                if delay is None:
+                    logger.error(
+                        "Worker %s exited (%s), more than %d restarts within "
+                        "%.0fs; giving up",
+                        pid,
+                        status,
+                        policy.max_restarts,
+                        policy.window,
+                    )
+                    gave_up = True
+                    stop(None, None)
+                else:
+                    logger.warning(
+                        "Worker %s exited (%s), restarting in %.2fs", pid, status, delay
+                    )
+                    restarts[slot] = time.monotonic() + delay
+            continue
+        if deadline is not None and not killed and time.monotonic() > deadline:
+            logger.warning("Drain timed out, killing %d workers", len(children))
+            for child in children:
+                os.kill(child, signal.SIGKILL)
+            killed = True
+        time.sleep(0.05)
+    return 1 if killed or gave_up else 0
+
+
+def serve(settings: Optional[Settings] = None) -> int:
+    gc.disable()
+    settings = settings or Settings.from_env()
+    workers = settings.workers or os.cpu_count() or 1
+    invalidation_dir = None
+    if settings.cache_reads and workers > 1 and not settings.cache_invalidation_dir:
+        # Workers find each other through the sockets they bind in here.
+        invalidation_dir = tempfile.mkdtemp(prefix="be-task-ca-")
+        settings = replace(settings, cache_invalidation_dir=invalidation_dir)
+    sock = bind_socket(settings.host, settings.port, settings.backlog)
+    config = build_config(preload(settings), settings)
+    logger.info(
+        "Serving on %s:%d with %d workers (loop=%s, http=%s)",
+        settings.host,
+        sock.getsockname()[1],
+        workers,
+        config.loop,
+        config.http,
+    )
+    try:
+        if workers == 1:
+            gc.enable()
+            run_worker(config, sock)
+            return 0
+        return supervise(
+            config,
+            sock,
+            workers,
+            settings.graceful_timeout_s,
+            RestartPolicy(
+                settings.worker_restart_backoff_s,
+                settings.worker_restart_backoff_max_s,
+                settings.worker_max_restarts,
+                settings.worker_restart_window_s,
+            ),
+        )
+    finally:
+        sock.close()
+        if invalidation_dir is not None:
+            shutil.rmtree(invalidation_dir, ignore_errors=True)
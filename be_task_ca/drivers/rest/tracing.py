@@ -0,0 +1,90 @@
+import re
+from typing import Any, Callable, Dict, Optional
+
+from be_task_ca.adapters.tracing.exporters import (
+    JsonLinesExporter,
+    OtlpHttpExporter,
+    RingBufferExporter,
+)
+from be_task_ca.adapters.tracing.tracer import RemoteParent, SpanExporter, Tracer
+from be_task_ca.drivers.rest.settings import Settings
+
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+EXPORTERS: Dict[str, Callable[[Settings], SpanExporter]] = {
+    "ring": lambda settings: RingBufferExporter(settings.tracing_ring_size),
+    "jsonl": lambda settings: JsonLinesExporter(settings.tracing_jsonl_path),
+    "otlp": lambda settings: OtlpHttpExporter(settings.tracing_otlp_endpoint),
+}
+
+
+def build_tracer(settings: Settings) -> Tracer:
+    exporter = settings.tracing_exporter
+    if exporter not in EXPORTERS:
+        raise ValueError(f"Unknown tracing exporter '{exporter}'")
+    return Tracer(EXPORTERS[exporter](settings), settings.tracing_sample_rate)
+
+
+def parse_traceparent(headers: list) -> Optional[RemoteParent]:
+    for name, value in headers:
+        if name == b"traceparent":
+            match = TRACEPARENT.match(value.decode("latin-1").strip())
+            if match is None:
+                return None
+            trace_id, parent_id, flags = match.groups()
+            return trace_id, parent_id, bool(int(flags, 16) & 1)
+    return None
+
+
+class TracingMiddleware:
+    # Opens the root span of each request (continuing an incoming W3C
+    # traceparent) and returns the trace id in a traceparent response header.
+    def __init__(self, app: Any, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        span = self.tracer.start("http", parse_traceparent(scope["headers"]))
+        token = self.tracer.activate(span)
+        if not span.sampled:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.tracer.finish(span, token, None)
+            return
+
+        status = 500
+        traceparent = f"00-{span.trace_id}-{span.span_id}-01".encode()
+
+        async def send_traced(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"traceparent", traceparent),
+                ]
+            await send(message)
+
+        error: Optional[BaseException] = None
+        try:
+            await self.app(scope, receive, send_traced)
+        except BaseException as raised:
+            error = raised
+            raise
+        finally:
+            route = scope.get("route")
+            template = route.path if route is not None else "unmatched"
+            span.name = f"{scope['method']} {template}"
+            span.attributes.update(
+                {
+                    "http.method": scope["method"],
+                    "http.route": template,
+                    "http.status_code": status,
+                }
+            )
+            self.tracer.finish(span, token, error)
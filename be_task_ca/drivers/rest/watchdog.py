@@ -0,0 +1,130 @@
+import logging
+from time import perf_counter
+from typing import Any, Callable, List, Optional
+
+from fastapi import FastAPI
+
+from be_task_ca.adapters.metrics.registry import Family, MetricsRegistry
+from be_task_ca.adapters.profiling.loop_monitor import LoopMonitor
+
+logger = logging.getLogger("be_task_ca.watchdog")
+
+LAG_QUANTILES = (0.5, 0.9, 0.99, 1.0)
+STACK_DEPTH = 20
+
+
+class SlowRequestMiddleware:
+    # Logs requests slower than `threshold` seconds with a timing breakdown
+    # and the stacks the loop monitor captured while the loop was blocked
+    # during the request. Fast requests pay for two perf_counter calls.
+    def __init__(
+        self,
+        app: Any,
+        monitor: LoopMonitor,
+        threshold: float,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        self.app = app
+        self.monitor = monitor
+        self.threshold = threshold
+        self.slow = (
+            registry.counter("http_slow_requests_total", "Requests over threshold")
+            if registry is not None
+            else None
+        )
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        responded: Optional[float] = None
+
+        async def send_timed(message: dict) -> None:
+            nonlocal status, responded
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                responded = perf_counter()
+            await send(message)
+
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            ended = perf_counter()
+            if ended - started >= self.threshold:
+                self.report(scope, status, started, responded, ended)
+
+    def report(
+        self,
+        scope: dict,
+        status: int,
+        started: float,
+        responded: Optional[float],
+        ended: float,
+    ) -> None:
+        if self.slow is not None:
+            self.slow.inc()
+        route = scope.get("route")
+        stalls = self.monitor.stalls_between(started, ended)
+        handler_end = responded if responded is not None else ended
+        lines = [
+            f"Slow request {scope['method']} "
+            f"{route.path if route is not None else scope['path']} -> {status}: "
+            f"total {(ended - started) * 1e3:.0f} ms, "
+            f"handler {(handler_end - started) * 1e3:.0f} ms, "
+            f"response {(ended - handler_end) * 1e3:.0f} ms, "
+            f"loop blocked "
+            f"{sum(s.overlap(started, ended) for s in stalls) * 1e3:.0f} ms"
+        ]
+        for stall in stalls:
+            lines.append(
+                f"  loop blocked {stall.overlap(started, ended) * 1e3:.0f} ms in:"
+            )
+            lines.extend(f"    {frame}" for frame in stall.stack[-STACK_DEPTH:])
+        logger.warning("\n".join(lines))
+
+
+def lag_collector(monitor: LoopMonitor) -> Callable[[], List[Family]]:
+    def collect() -> List[Family]:
+        return [
+            (
+                "event_loop_lag_seconds",
+                "gauge",
+                "Event loop scheduling lag over the recent window",
+                [
+                    (
+                        "event_loop_lag_seconds",
+                        {"quantile": str(quantile)},
+                        monitor.percentile(quantile),
+                    )
+                    for quantile in LAG_QUANTILES
+                ],
+            ),
+            (
+                "event_loop_stalls_total",
+                "counter",
+                "Times the loop was blocked beyond the threshold",
+                [("event_loop_stalls_total", {}, monitor.stall_count)],
+            ),
+        ]
+
+    return collect
+
+
+def add_watchdog(
+    app: FastAPI,
+    monitor: LoopMonitor,
+    slow_request: float,
+    registry: Optional[MetricsRegistry] = None,
+) -> None:
+    app.state.loop_monitor = monitor
+    app.add_middleware(
+        SlowRequestMiddleware,
+        monitor=monitor,
+        threshold=slow_request,
+        registry=registry,
+    )
+    if registry is not None:
+        registry.add_collector(lag_collector(monitor))
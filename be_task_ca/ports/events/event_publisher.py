@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from be_task_ca.domain.events import DomainEvent
+
+
+class EventPublisher(ABC):
+    # Publishing hands the event over and returns without waiting for any
+    # handler. It only suspends when the publisher's buffer is full, so slow
+    # handlers push back on the use cases instead of losing events.
+    @abstractmethod
+    async def publish(self, event: DomainEvent) -> None:
+        pass
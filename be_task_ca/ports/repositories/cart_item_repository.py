@@ -19,3 +19,7 @@ class CartItemRepository(ABC):
         self, user_id: UUID, item_id: UUID
     ) -> Optional[CartItem]:
         pass
+
+    @abstractmethod
+    async def list_user_ids(self) -> List[UUID]:
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_summary import CartSummary
+
+
+class CartSummaryRepository(ABC):
+    @abstractmethod
+    async def find_by_user_id(self, user_id: UUID) -> Optional[CartSummary]:
+        pass
+
+    @abstractmethod
+    async def add_line(
+        self, user_id: UUID, item_id: UUID, quantity: int, unit_price_cents: int
+    ) -> CartSummary:
+        pass
+
+    @abstractmethod
+    async def reprice(self, item_id: UUID, unit_price_cents: int) -> int:
+        pass
+
+    @abstractmethod
+    async def rebuild(
+        self, user_id: UUID, lines: List[Tuple[UUID, int, int]]
+    ) -> CartSummary:
+        pass
+
+    @abstractmethod
+    async def list_user_ids(self) -> List[UUID]:
+        pass
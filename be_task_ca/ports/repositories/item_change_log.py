@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from be_task_ca.domain.entities.item_changes import ItemChangeSet
+
+
+class ItemChangeLog(ABC):
+    @abstractmethod
+    async def record(self, item_ids: List[UUID]) -> int:
+        pass
+
+    @abstractmethod
+    async def changes_since(self, since: int, limit: int) -> ItemChangeSet:
+        pass
@@ -10,6 +10,10 @@ class ItemRepository(ABC):
     async def save(self, item: Item) -> Item:
         pass
 
+    @abstractmethod
+    async def save_many(self, items: List[Item]) -> List[Item]:
+        pass
+
     @abstractmethod
     async def list_all(self) -> List[Item]:
         pass
@@ -21,3 +25,31 @@ class ItemRepository(ABC):
     @abstractmethod
     async def find_by_id(self, item_id: UUID) -> Optional[Item]:
         pass
+
+    @abstractmethod
+    async def find_by_ids(self, item_ids: List[UUID]) -> List[Item]:
+        pass
+
+    @abstractmethod
+    async def reserve_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    async def release_stock(self, item_id: UUID, quantity: int) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    async def update_price(self, item_id: UUID, price: float) -> Optional[Item]:
+        pass
+
+    @abstractmethod
+    async def start_flash_sale(self, item_id: UUID, shards: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def end_flash_sale(self, item_id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    async def merge_cold_flash_sales(self, idle_for: float) -> List[UUID]:
+        pass
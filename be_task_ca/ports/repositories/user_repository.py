@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from abc import ABC, abstractmethod
 
 from be_task_ca.domain.entities.user import User
@@ -10,6 +10,10 @@ class UserRepository(ABC):
     async def save(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    async def save_many(self, users: List[User]) -> List[User]:
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[User]:
         pass
@@ -17,3 +21,7 @@ class UserRepository(ABC):
     @abstractmethod
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
         pass
+
+    @abstractmethod
+    async def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class PasswordHasherOverloadedError(Exception):
+    def __init__(self, pending: int):
+        self.pending = pending
+        super().__init__(f"Password hashing queue is full ({pending} pending)")
+
+
+class PasswordHasher(ABC):
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        pass
@@ -1,14 +1,25 @@
+from typing import Tuple
+
 from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.cart_totals import to_cents
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.events import ItemAddedToCart
+from be_task_ca.ports.events.event_publisher import EventPublisher
 from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
 from be_task_ca.ports.repositories.item_repository import ItemRepository
 from be_task_ca.ports.repositories.user_repository import UserRepository
 from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
+from be_task_ca.use_cases.concurrent_lookups import ConcurrentLookups
 from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
 from be_task_ca.use_cases.exceptions.item_exceptions import (
     ItemNotFoundError,
     InsufficientStockError,
 )
 from be_task_ca.use_cases.exceptions.cart_exceptions import ItemAlreadyInCartError
+from be_task_ca.use_cases.keyed_locks import KeyedLocks
 
 
 class AddItemToCartUseCase:
@@ -17,33 +28,83 @@ class AddItemToCartUseCase:
         cart_item_repository: CartItemRepository,
         user_repository: UserRepository,
         item_repository: ItemRepository,
+        cart_summary_repository: CartSummaryRepository,
+        event_publisher: EventPublisher,
     ):
         self.cart_item_repository = cart_item_repository
         self.user_repository = user_repository
         self.item_repository = item_repository
+        self.cart_summary_repository = cart_summary_repository
+        self.event_publisher = event_publisher
+        self.cart_line_locks = KeyedLocks()
 
     async def __call__(self, command: AddToCartCommand) -> CartItem:
-        user = await self.user_repository.find_by_id(command.user_id)
-        if user is None:
-            raise UserNotFoundError(user_id=command.user_id)
+        # The lookups yield, so the duplicate check and the save only count as
+        # one step while the lock for this user and item is held.
+        async with self.cart_line_locks.hold((command.user_id, command.item_id)):
+            item, saved_cart_item = await self._add_line(command)
 
-        item = await self.item_repository.find_by_id(command.item_id)
-        if item is None:
-            raise ItemNotFoundError(item_id=command.item_id)
+        await self.cart_summary_repository.add_line(
+            saved_cart_item.user_id,
+            saved_cart_item.item_id,
+            saved_cart_item.quantity,
+            to_cents(item.price),
+        )
 
-        if item.quantity < command.quantity:
-            raise InsufficientStockError(
-                item_id=command.item_id,
-                requested=command.quantity,
-                available=item.quantity,
+        await self.event_publisher.publish(
+            ItemAddedToCart(
+                user_id=saved_cart_item.user_id,
+                item_id=saved_cart_item.item_id,
+                quantity=saved_cart_item.quantity,
             )
+        )
+
+        return saved_cart_item
 
-        existing = await self.cart_item_repository.find_by_user_and_item(
-            command.user_id, command.item_id
+    async def _add_line(self, command: AddToCartCommand) -> Tuple[Item, CartItem]:
+        async with ConcurrentLookups() as lookups:
+            user_lookup = lookups.start(
+                self.user_repository.find_by_id(command.user_id)
+            )
+            item_lookup = lookups.start(
+                self.item_repository.find_by_id(command.item_id)
+            )
+            existing_lookup = lookups.start(
+                self.cart_item_repository.find_by_user_and_item(
+                    command.user_id, command.item_id
+                )
+            )
+
+            user = await user_lookup
+            if user is None:
+                raise UserNotFoundError(user_id=command.user_id)
+
+            item = await item_lookup
+            if item is None:
+                raise ItemNotFoundError(item_id=command.item_id)
+
+            if item.quantity < command.quantity:
+                raise InsufficientStockError(
+                    item_id=command.item_id,
+                    requested=command.quantity,
+                    available=item.quantity,
+                )
+
+            existing = await existing_lookup
+            if existing:
+                raise ItemAlreadyInCartError(
+                    user_id=command.user_id, item_id=command.item_id
+                )
+
+        reserved = await self.item_repository.reserve_stock(
+            command.item_id, command.quantity
         )
-        if existing:
-            raise ItemAlreadyInCartError(
-                user_id=command.user_id, item_id=command.item_id
+        if reserved is None:
+            current = await self.item_repository.find_by_id(command.item_id)
+            raise InsufficientStockError(
+                item_id=command.item_id,
+                requested=command.quantity,
+                available=current.quantity if current else 0,
             )
 
         cart_item = CartItem(
@@ -52,6 +113,10 @@ class AddItemToCartUseCase:
             quantity=command.quantity,
         )
 
-        saved_cart_item = await self.cart_item_repository.save(cart_item)
+        try:
+            saved_cart_item = await self.cart_item_repository.save(cart_item)
+        except BaseException:
+            await self.item_repository.release_stock(command.item_id, command.quantity)
+            raise
 
-        return saved_cart_item
+        return item, saved_cart_item
@@ -0,0 +1,66 @@
+from typing import List, Optional
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_summary import CartSummary, CartSummaryMismatch
+from be_task_ca.domain.entities.cart_totals import to_cents
+from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+
+
+class CheckCartSummariesUseCase:
+    def __init__(
+        self,
+        cart_item_repository: CartItemRepository,
+        item_repository: ItemRepository,
+        cart_summary_repository: CartSummaryRepository,
+    ):
+        self.cart_item_repository = cart_item_repository
+        self.item_repository = item_repository
+        self.cart_summary_repository = cart_summary_repository
+
+    async def __call__(
+        self, user_ids: Optional[List[UUID]] = None, repair: bool = False
+    ) -> List[CartSummaryMismatch]:
+        # Recomputes each summary the way the totals endpoint does. A write
+        # landing mid-check can show up as a mismatch, so a reported user is
+        # only suspect until a second check agrees. Without `user_ids` it
+        # checks every user with cart lines, which catches carts the view has
+        # no summary for, and every user with a summary, which catches
+        # summaries left behind with no lines.
+        if user_ids is None:
+            user_ids = list(
+                dict.fromkeys(
+                    await self.cart_item_repository.list_user_ids()
+                    + await self.cart_summary_repository.list_user_ids()
+                )
+            )
+        mismatches = []
+        for user_id in user_ids:
+            cart_items = await self.cart_item_repository.find_cart_items_for_user_id(
+                user_id
+            )
+            items = await self.item_repository.find_by_ids(
+                [cart_item.item_id for cart_item in cart_items]
+            )
+            prices = {item.id: to_cents(item.price) for item in items}
+            lines = [
+                (cart_item.item_id, cart_item.quantity, prices[cart_item.item_id])
+                for cart_item in cart_items
+                if cart_item.item_id in prices
+            ]
+            expected = CartSummary(
+                user_id=user_id,
+                line_count=len({item_id for item_id, _, _ in lines}),
+                item_count=sum(quantity for _, quantity, _ in lines),
+                total_cents=sum(quantity * price for _, quantity, price in lines),
+            )
+            actual = await self.cart_summary_repository.find_by_user_id(user_id)
+            if actual == expected or (actual is None and not lines):
+                continue
+            mismatches.append(CartSummaryMismatch(expected=expected, actual=actual))
+            if repair:
+                await self.cart_summary_repository.rebuild(user_id, lines)
+        return mismatches
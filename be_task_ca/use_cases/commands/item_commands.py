@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 
 @dataclass(frozen=True)
@@ -7,3 +8,9 @@ class CreateItemCommand:
     description: str
     price: float
     quantity: int
+
+
+@dataclass(frozen=True)
+class UpdateItemPriceCommand:
+    item_id: UUID
+    price: float
@@ -0,0 +1,27 @@
+import asyncio
+from typing import Any, Awaitable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class ConcurrentLookups:
+    _tasks: List["asyncio.Future[Any]"]
+
+    def __init__(self):
+        self._tasks = []
+
+    def start(self, lookup: Awaitable[T]) -> "asyncio.Future[T]":
+        task = asyncio.ensure_future(lookup)
+        self._tasks.append(task)
+        return task
+
+    async def __aenter__(self) -> "ConcurrentLookups":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Lookups are awaited in a fixed order by the caller, so whichever
+        # check fails first still wins; anything left over is abandoned.
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
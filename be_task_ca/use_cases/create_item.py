@@ -1,25 +1,44 @@
 from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.events import ItemCreated
+from be_task_ca.ports.events.event_publisher import EventPublisher
 from be_task_ca.ports.repositories.item_repository import ItemRepository
 from be_task_ca.use_cases.commands.item_commands import CreateItemCommand
 from be_task_ca.use_cases.exceptions.item_exceptions import ItemAlreadyExistsError
+from be_task_ca.use_cases.keyed_locks import KeyedLocks
 
 
 class CreateItemUseCase:
-    def __init__(self, item_repository: ItemRepository):
+    def __init__(
+        self, item_repository: ItemRepository, event_publisher: EventPublisher
+    ):
         self.item_repository = item_repository
+        self.event_publisher = event_publisher
+        self.name_locks = KeyedLocks()
 
     async def __call__(self, command: CreateItemCommand) -> Item:
-        existing_item = await self.item_repository.find_by_name(command.name)
-        if existing_item is not None:
-            raise ItemAlreadyExistsError(item_name=command.name)
+        # Held until the save returns, which with batched writes is when the
+        # group commit holding it has landed.
+        async with self.name_locks.hold(command.name.lower()):
+            existing_item = await self.item_repository.find_by_name(command.name)
+            if existing_item is not None:
+                raise ItemAlreadyExistsError(item_name=command.name)
 
-        item = Item(
-            name=command.name,
-            description=command.description,
-            price=float(command.price),
-            quantity=command.quantity,
-        )
+            item = Item(
+                name=command.name,
+                description=command.description,
+                price=float(command.price),
+                quantity=command.quantity,
+            )
+
+            saved_item = await self.item_repository.save(item)
 
-        saved_item = await self.item_repository.save(item)
+        await self.event_publisher.publish(
+            ItemCreated(
+                item_id=saved_item.id,
+                name=saved_item.name,
+                price=saved_item.price,
+                quantity=saved_item.quantity,
+            )
+        )
 
         return saved_item
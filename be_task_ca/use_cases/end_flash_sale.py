@@ -0,0 +1,27 @@
+from typing import List
+from uuid import UUID
+
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.use_cases.exceptions.item_exceptions import ItemNotFoundError
+
+
+class EndFlashSaleUseCase:
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+
+    async def __call__(self, item_id: UUID) -> bool:
+        if await self.item_repository.find_by_id(item_id) is None:
+            raise ItemNotFoundError(item_id=item_id)
+
+        return await self.item_repository.end_flash_sale(item_id)
+
+
+class EndColdFlashSalesUseCase:
+    # Merges the shards of every flash sale that has not reserved stock for
+    # `idle_for` seconds back into a single counter.
+    def __init__(self, item_repository: ItemRepository, idle_for: float):
+        self.item_repository = item_repository
+        self.idle_for = idle_for
+
+    async def __call__(self) -> List[UUID]:
+        return await self.item_repository.merge_cold_flash_sales(self.idle_for)
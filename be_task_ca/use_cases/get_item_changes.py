@@ -0,0 +1,26 @@
+from be_task_ca.domain.entities.item_changes import ItemChanges
+from be_task_ca.ports.repositories.item_change_log import ItemChangeLog
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+
+
+class GetItemChangesUseCase:
+    def __init__(self, item_change_log: ItemChangeLog, item_repository: ItemRepository):
+        self.item_change_log = item_change_log
+        self.item_repository = item_repository
+
+    async def __call__(self, since: int, limit: int) -> ItemChanges:
+        change_set = await self.item_change_log.changes_since(since, limit)
+        if change_set.resync or not change_set.item_ids:
+            return ItemChanges(
+                next_since=change_set.next_since, resync=change_set.resync
+            )
+
+        # Items are returned as they are now, so an item changed several
+        # times since `since` comes back once with its latest state.
+        items = await self.item_repository.find_by_ids(change_set.item_ids)
+
+        return ItemChanges(
+            next_since=change_set.next_since,
+            items=items,
+            has_more=change_set.has_more,
+        )
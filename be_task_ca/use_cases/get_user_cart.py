@@ -4,6 +4,7 @@ from uuid import UUID
 from be_task_ca.domain.entities.cart_item import CartItem
 from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
 from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.use_cases.concurrent_lookups import ConcurrentLookups
 from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
 
 
@@ -17,12 +18,16 @@ class GetUserCartUseCase:
         self.user_repository = user_repository
 
     async def __call__(self, user_id: UUID) -> List[CartItem]:
-        user = await self.user_repository.find_by_id(user_id)
-        if user is None:
-            raise UserNotFoundError(user_id=user_id)
+        async with ConcurrentLookups() as lookups:
+            user_lookup = lookups.start(self.user_repository.find_by_id(user_id))
+            cart_items_lookup = lookups.start(
+                self.cart_item_repository.find_cart_items_for_user_id(user_id)
+            )
 
-        cart_items = await self.cart_item_repository.find_cart_items_for_user_id(
-            user_id
-        )
+            user = await user_lookup
+            if user is None:
+                raise UserNotFoundError(user_id=user_id)
+
+            cart_items = await cart_items_lookup
 
         return cart_items
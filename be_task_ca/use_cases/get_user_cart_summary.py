@@ -0,0 +1,29 @@
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_summary import CartSummary
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
+from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
+
+
+class GetUserCartSummaryUseCase:
+    def __init__(
+        self,
+        cart_summary_repository: CartSummaryRepository,
+        user_repository: UserRepository,
+    ):
+        self.cart_summary_repository = cart_summary_repository
+        self.user_repository = user_repository
+
+    async def __call__(self, user_id: UUID) -> CartSummary:
+        summary = await self.cart_summary_repository.find_by_user_id(user_id)
+        if summary is not None:
+            return summary
+
+        # Only users without a cart pay for the existence check.
+        user = await self.user_repository.find_by_id(user_id)
+        if user is None:
+            raise UserNotFoundError(user_id=user_id)
+        return CartSummary(user_id=user_id)
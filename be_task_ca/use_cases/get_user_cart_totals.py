@@ -0,0 +1,73 @@
+from operator import mul
+from uuid import UUID
+
+from be_task_ca.domain.entities.cart_totals import CartLine, CartTotals, to_cents
+from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.use_cases.concurrent_lookups import ConcurrentLookups
+from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
+
+
+class GetUserCartTotalsUseCase:
+    def __init__(
+        self,
+        cart_item_repository: CartItemRepository,
+        user_repository: UserRepository,
+        item_repository: ItemRepository,
+    ):
+        self.cart_item_repository = cart_item_repository
+        self.user_repository = user_repository
+        self.item_repository = item_repository
+
+    async def __call__(self, user_id: UUID) -> CartTotals:
+        async with ConcurrentLookups() as lookups:
+            user_lookup = lookups.start(self.user_repository.find_by_id(user_id))
+            cart_items_lookup = lookups.start(
+                self.cart_item_repository.find_cart_items_for_user_id(user_id)
+            )
+
+            user = await user_lookup
+            if user is None:
+                raise UserNotFoundError(user_id=user_id)
+
+            cart_items = await cart_items_lookup
+        if not cart_items:
+            return CartTotals(user_id=user_id)
+
+        items = await self.item_repository.find_by_ids(
+            [cart_item.item_id for cart_item in cart_items]
+        )
+        items_by_id = {item.id: item for item in items}
+
+        # Lines whose item no longer exists are dropped instead of failing the read.
+        priced = [
+            (cart_item, items_by_id[cart_item.item_id])
+            for cart_item in cart_items
+            if cart_item.item_id in items_by_id
+        ]
+        unit_prices = [to_cents(item.price) for _, item in priced]
+        quantities = [cart_item.quantity for cart_item, _ in priced]
+        line_totals = list(map(mul, unit_prices, quantities))
+
+        lines = [
+            CartLine(
+                item_id=item.id,
+                name=item.name,
+                unit_price_cents=unit_price,
+                quantity=quantity,
+                line_total_cents=line_total,
+            )
+            for (_, item), unit_price, quantity, line_total in zip(
+                priced, unit_prices, quantities, line_totals
+            )
+        ]
+        subtotal = sum(line_totals)
+
+        return CartTotals(
+            user_id=user_id,
+            lines=lines,
+            subtotal_cents=subtotal,
+            item_count=sum(quantities),
+            total_cents=subtotal,
+        )
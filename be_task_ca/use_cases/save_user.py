@@ -1,30 +1,47 @@
-import hashlib
-
 from be_task_ca.domain.entities.user import User
+from be_task_ca.domain.events import UserRegistered
+from be_task_ca.ports.events.event_publisher import EventPublisher
 from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.ports.security.password_hasher import PasswordHasher
 from be_task_ca.use_cases.commands.user_commands import CreateUserCommand
 from be_task_ca.use_cases.exceptions.user_exceptions import EmailAlreadyExistsError
+from be_task_ca.use_cases.keyed_locks import KeyedLocks
 
 
 class CreateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        event_publisher: EventPublisher,
+    ):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
+        self.event_publisher = event_publisher
+        self.email_locks = KeyedLocks()
 
     async def __call__(self, command: CreateUserCommand) -> User:
-        existing_user = await self.user_repository.find_by_email(command.email)
-        if existing_user is not None:
-            raise EmailAlreadyExistsError(email=command.email)
-
-        hashed_password = hashlib.sha256(command.password.encode()).hexdigest()
-
-        user = User(
-            email=command.email,
-            first_name=command.first_name,
-            last_name=command.last_name,
-            hashed_password=hashed_password,
-            shipping_address=command.shipping_address or "",
+        # Hashing yields for milliseconds between the check and the save, so
+        # signups for one email are serialized until the first is committed.
+        async with self.email_locks.hold(command.email.lower()):
+            existing_user = await self.user_repository.find_by_email(command.email)
+            if existing_user is not None:
+                raise EmailAlreadyExistsError(email=command.email)
+
+            hashed_password = await self.password_hasher.hash(command.password)
+
+            user = User(
+                email=command.email,
+                first_name=command.first_name,
+                last_name=command.last_name,
+                hashed_password=hashed_password,
+                shipping_address=command.shipping_address or "",
+            )
+
+            saved_user = await self.user_repository.save(user)
+
+        await self.event_publisher.publish(
+            UserRegistered(user_id=saved_user.id, email=saved_user.email)
         )
 
-        saved_user = await self.user_repository.save(user)
-
         return saved_user
@@ -0,0 +1,14 @@
+from uuid import UUID
+
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.use_cases.exceptions.item_exceptions import ItemNotFoundError
+
+
+class StartFlashSaleUseCase:
+    def __init__(self, item_repository: ItemRepository, shards: int):
+        self.item_repository = item_repository
+        self.shards = shards
+
+    async def __call__(self, item_id: UUID) -> None:
+        if not await self.item_repository.start_flash_sale(item_id, self.shards):
+            raise ItemNotFoundError(item_id=item_id)
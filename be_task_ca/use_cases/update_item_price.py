@@ -0,0 +1,42 @@
+from be_task_ca.domain.entities.cart_totals import to_cents
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.events import ItemPriceChanged
+from be_task_ca.ports.events.event_publisher import EventPublisher
+from be_task_ca.ports.repositories.cart_summary_repository import (
+    CartSummaryRepository,
+)
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.use_cases.commands.item_commands import UpdateItemPriceCommand
+from be_task_ca.use_cases.exceptions.item_exceptions import ItemNotFoundError
+from be_task_ca.use_cases.keyed_locks import KeyedLocks
+
+
+class UpdateItemPriceUseCase:
+    def __init__(
+        self,
+        item_repository: ItemRepository,
+        cart_summary_repository: CartSummaryRepository,
+        event_publisher: EventPublisher,
+    ):
+        self.item_repository = item_repository
+        self.cart_summary_repository = cart_summary_repository
+        self.event_publisher = event_publisher
+        self.price_locks = KeyedLocks()
+
+    async def __call__(self, command: UpdateItemPriceCommand) -> Item:
+        # Held across both writes, so concurrent updates of one item reprice
+        # the cart summaries in the order the item took their prices.
+        async with self.price_locks.hold(command.item_id):
+            item = await self.item_repository.update_price(
+                command.item_id, float(command.price)
+            )
+            if item is None:
+                raise ItemNotFoundError(item_id=command.item_id)
+
+            await self.cart_summary_repository.reprice(item.id, to_cents(item.price))
+
+        await self.event_publisher.publish(
+            ItemPriceChanged(item_id=item.id, price=item.price)
+        )
+
+        return item
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import time
+
+from be_task_ca.adapters.invalidation.broadcaster import InvalidationBroadcaster
+
+
+def echo(directory: str, ready) -> None:
+    # A second worker that sends every key it receives straight back.
+    async def run() -> None:
+        broadcaster = InvalidationBroadcaster(directory, window=0, name="echo")
+        done = asyncio.Event()
+
+        def reply(keys):
+            if "stop" in keys:
+                done.set()
+            broadcaster.publish(keys)
+
+        broadcaster.subscribe(reply)
+        broadcaster.start()
+        ready.set()
+        await done.wait()
+        broadcaster.close()
+
+    asyncio.run(run())
+
+
+async def round_trips(directory: str, window: float, messages: int) -> None:
+    broadcaster = InvalidationBroadcaster(directory, window=window, name="origin")
+    arrived = asyncio.Event()
+    broadcaster.subscribe(lambda keys: arrived.set())
+    broadcaster.start()
+
+    latencies = []
+    for index in range(messages):
+        arrived.clear()
+        started = time.perf_counter()
+        broadcaster.publish([f"item:{index}"])
+        await arrived.wait()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    print(
+        f"window {window * 1e3:4.1f} ms  round trip "
+        f"p50={statistics.median(latencies) * 1e6:7.1f} us "
+        f"p99={latencies[int(len(latencies) * 0.99)] * 1e6:7.1f} us"
+    )
+
+    keys = [f"item:{index % 100}" for index in range(messages * 10)]
+    sent = broadcaster.sent
+    started = time.perf_counter()
+    for key in keys:
+        broadcaster.publish([key])
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(window + 0.01)
+    print(
+        f"{'':<14}burst of {len(keys)} writes: "
+        f"{elapsed / len(keys) * 1e6:.2f} us/publish, "
+        f"{broadcaster.sent - sent} datagrams sent"
+    )
+    broadcaster.publish(["stop"])
+    broadcaster.flush()
+    broadcaster.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Invalidation latency between two worker processes."
+    )
+    parser.add_argument("--windows-ms", default="0,1,5")
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    for window in (float(window) / 1000 for window in args.windows_ms.split(",")):
+        with tempfile.TemporaryDirectory() as directory:
+            ready = multiprocessing.Event()
+            peer = multiprocessing.Process(target=echo, args=(directory, ready))
+            peer.start()
+            ready.wait()
+            asyncio.run(round_trips(directory, window, args.messages))
+            peer.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import asyncio
+import random
+
+from be_task_ca.drivers.rest.container import Container
+from be_task_ca.drivers.rest.settings import Settings
+from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
+from be_task_ca.use_cases.exceptions.item_exceptions import InsufficientStockError
+
+from benchmarks.dataset import DatasetSpec, item_id, populate, user_id
+from benchmarks.metrics_overhead import per_call
+
+
+async def run(users: int, items: int, calls: int, seed: int) -> None:
+    container = Container.build(Settings(metrics=False, events=False))
+    spec = DatasetSpec(users=users, items=items, cart_fraction=0.0, seed=seed)
+    await populate(
+        spec,
+        (
+            container.user_repository,
+            container.item_repository,
+            container.cart_item_repository,
+        ),
+    )
+    # Carts go through the use case so the summaries are maintained.
+    rng = random.Random(seed)
+    for index in range(users):
+        for item_index in rng.sample(range(items), 3):
+            try:
+                await container.add_item_to_cart(
+                    AddToCartCommand(
+                        user_id=user_id(seed, index),
+                        item_id=item_id(seed, item_index),
+                        quantity=1,
+                    )
+                )
+            except InsufficientStockError:
+                pass
+    shopper = user_id(seed, rng.randrange(users))
+
+    totals = await per_call(lambda: container.get_user_cart_totals(shopper), calls)
+    summary = await per_call(lambda: container.get_user_cart_summary(shopper), calls)
+    mismatches = await container.check_cart_summaries()
+    print(
+        f"{users:>7} carts  totals {totals * 1e6:9.1f} us  "
+        f"summary {summary * 1e6:6.2f} us  mismatches {len(mismatches)}"
+    )
+    await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Cart summary reads against recomputing the cart totals."
+    )
+    parser.add_argument("--users", default="100,1000,10000")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for users in (int(users) for users in args.users.split(",")):
+        asyncio.run(run(users, args.items, args.calls, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import random
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+from benchmarks.asgi import lifespan, request
+from benchmarks.dataset import DatasetSpec, item_id, populate
+from benchmarks.metrics_overhead import per_call
+
+
+async def run(items: int, changes: int, requests: int, seed: int) -> None:
+    app = create_app(
+        Settings(metrics=False, events=False, loop_monitor=False, openapi="disabled")
+    )
+    async with lifespan(app):
+        container = app.state.container
+        spec = DatasetSpec(users=0, items=items, cart_fraction=0.0, seed=seed)
+        await populate(spec, (None, container.item_repository, None))
+        # The client has just fetched the whole catalog.
+        since = container.item_change_log.sequence
+        rng = random.Random(seed)
+        for index in rng.sample(range(items), changes):
+            await request(
+                app,
+                "PATCH",
+                f"/items/{item_id(seed, index)}",
+                json_body={"price": round(rng.uniform(1, 100), 2)},
+            )
+
+        full = await request(app, "GET", "/items/")
+        delta = await request(app, "GET", f"/items/changes?since={since}")
+        full_time = await per_call(lambda: request(app, "GET", "/items/"), requests)
+        delta_time = await per_call(
+            lambda: request(app, "GET", f"/items/changes?since={since}"), requests
+        )
+    print(
+        f"{items:>7} items, {changes} changed  "
+        f"full {full_time * 1e3:8.2f} ms {len(full.body) / 1024:8.0f} KiB  "
+        f"delta {delta_time * 1e3:6.3f} ms {len(delta.body) / 1024:5.1f} KiB "
+        f"({len(delta.json()['items'])} items)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Full catalog reads against delta syncs from the change log."
+    )
+    parser.add_argument("--items", default="1000,100000")
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for items in (int(items) for items in args.items.split(",")):
+        asyncio.run(run(items, args.changes, args.requests, args.seed))
+
+
+if __name__ == "__main__":
+    main()
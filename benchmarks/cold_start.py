@@ -0,0 +1,128 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PHASES = ("import", "create_app", "startup", "first_response", "first_openapi")
+
+
+def child() -> None:
+    # Runs in a fresh interpreter; nothing from the app may be imported before
+    # the clock starts.
+    timings = {}
+    started = time.perf_counter()
+    from be_task_ca.drivers.rest.app import create_app
+
+    timings["import"] = time.perf_counter() - started
+
+    mark = time.perf_counter()
+    app = create_app()
+    timings["create_app"] = time.perf_counter() - mark
+
+    import asyncio
+
+    from benchmarks.asgi import lifespan, request
+
+    async def serve() -> None:
+        mark = time.perf_counter()
+        async with lifespan(app):
+            timings["startup"] = time.perf_counter() - mark
+            mark = time.perf_counter()
+            response = await request(app, "GET", "/")
+            assert response.status == 200, response.status
+            timings["first_response"] = time.perf_counter() - mark
+            if app.openapi_url:
+                mark = time.perf_counter()
+                response = await request(app, "GET", app.openapi_url)
+                assert response.status == 200, response.status
+                timings["first_openapi"] = time.perf_counter() - mark
+
+    asyncio.run(serve())
+    print(json.dumps(timings))
+
+
+def export_schema(path: str) -> None:
+    from be_task_ca.drivers.rest.app import create_app
+    from be_task_ca.drivers.rest.settings import Settings
+
+    with open(path, "w") as schema_file:
+        json.dump(create_app(Settings()).openapi(), schema_file)
+
+
+def measure(env: dict, runs: int) -> dict:
+    samples: dict = {phase: [] for phase in PHASES + ("process", "ready")}
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cold_start", "--child"],
+            env={**os.environ, **env},
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples["process"].append(time.perf_counter() - started)
+        timings = json.loads(output)
+        for phase, elapsed in timings.items():
+            samples[phase].append(elapsed)
+        samples["ready"].append(
+            sum(timings[phase] for phase in PHASES[:4] if phase in timings)
+        )
+    return {
+        phase: statistics.median(values) for phase, values in samples.items() if values
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import time and time-to-first-response in a fresh interpreter."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail if import + startup + first response exceeds this (median)",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        schema_path = os.path.join(directory, "openapi.json")
+        export_schema(schema_path)
+        scenarios = {
+            "lazy openapi": {"BE_TASK_CA_OPENAPI": "lazy"},
+            "openapi at startup": {"BE_TASK_CA_OPENAPI": "startup"},
+            "precomputed openapi": {
+                "BE_TASK_CA_OPENAPI": "lazy",
+                "BE_TASK_CA_OPENAPI_SCHEMA_PATH": schema_path,
+            },
+            "openapi disabled": {"BE_TASK_CA_OPENAPI": "disabled"},
+        }
+        header = "".join(f"{phase:>15}" for phase in PHASES + ("ready", "process"))
+        print(f"{'scenario':<22}{header}   (median ms over {args.runs} runs)")
+        over_budget = False
+        for name, env in scenarios.items():
+            result = measure(env, args.runs)
+            row = "".join(
+                f"{result[phase] * 1e3:>15.1f}" if phase in result else f"{'-':>15}"
+                for phase in PHASES + ("ready", "process")
+            )
+            print(f"{name:<22}{row}")
+            if args.budget_ms is not None and result["ready"] * 1e3 > args.budget_ms:
+                over_budget = True
+
+    if over_budget:
+        print(f"cold start exceeded the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import bisect
+import hashlib
+import itertools
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from uuid import UUID
+
+from be_task_ca.adapters.security.pooled_password_hasher import (
+    DEFAULT_COST,
+    PBKDF2,
+    hash_password,
+)
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+
+FIRST_NAMES = (
+    "Anna",
+    "Ben",
+    "Clara",
+    "David",
+    "Emma",
+    "Felix",
+    "Greta",
+    "Hannah",
+    "Jonas",
+    "Lea",
+    "Lukas",
+    "Maria",
+    "Max",
+    "Mia",
+    "Noah",
+    "Paul",
+    "Sophie",
+    "Tom",
+)
+LAST_NAMES = (
+    "Bauer",
+    "Becker",
+    "Fischer",
+    "Hoffmann",
+    "Koch",
+    "Meyer",
+    "Müller",
+    "Richter",
+    "Schmidt",
+    "Schneider",
+    "Schulz",
+    "Wagner",
+    "Weber",
+    "Wolf",
+    "Zimmermann",
+)
+DOMAINS = ("example.com", "example.org", "mail.example.net")
+ADJECTIVES = (
+    "Classic",
+    "Compact",
+    "Deluxe",
+    "Eco",
+    "Heavy",
+    "Light",
+    "Mini",
+    "Modern",
+    "Pro",
+    "Smart",
+    "Solid",
+    "Ultra",
+    "Vintage",
+    "Wireless",
+)
+NOUNS = (
+    "Backpack",
+    "Bottle",
+    "Chair",
+    "Desk",
+    "Headphones",
+    "Jacket",
+    "Kettle",
+    "Lamp",
+    "Mug",
+    "Notebook",
+    "Shoes",
+    "Speaker",
+    "Tent",
+    "Watch",
+)
+PASSWORD = "password123"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    users: int = 1_000
+    items: int = 1_000
+    cart_fraction: float = 0.3
+    mean_cart_size: float = 3.0
+    zipf_exponent: float = 1.1
+    name_collision_rate: float = 0.01
+    seed: int = 0
+    chunk_size: int = 10_000
+
+
+def _digest(seed: int, kind: str, index: int) -> bytes:
+    return hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16).digest()
+
+
+def user_id(seed: int, index: int) -> UUID:
+    return UUID(bytes=_digest(seed, "user", index), version=4)
+
+
+def item_id(seed: int, index: int) -> UUID:
+    return UUID(bytes=_digest(seed, "item", index), version=4)
+
+
+def item_name(seed: int, index: int) -> str:
+    pick = int.from_bytes(_digest(seed, "item-name", index), "big")
+    adjective = ADJECTIVES[pick % len(ADJECTIVES)]
+    noun = NOUNS[pick // len(ADJECTIVES) % len(NOUNS)]
+    return f"{adjective} {noun} {index}"
+
+
+@lru_cache
+def _hashed_password() -> str:
+    # One real hash shared by every generated user; deriving a key per user
+    # would dominate generation time.
+    return hash_password(PBKDF2, PASSWORD, DEFAULT_COST[PBKDF2])
+
+
+@lru_cache(maxsize=4)
+def _zipf_cumulative(items: int, exponent: float) -> List[float]:
+    return list(
+        itertools.accumulate(1 / rank**exponent for rank in range(1, items + 1))
+    )
+
+
+def _chunk_rng(spec: DatasetSpec, kind: str, start: int) -> random.Random:
+    return random.Random(f"{spec.seed}:{kind}:{start}")
+
+
+def generate_users(spec: DatasetSpec, start: int, stop: int) -> List[User]:
+    rng = _chunk_rng(spec, "users", start)
+    hashed_password = _hashed_password()
+    users = []
+    for index in range(start, stop):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        users.append(
+            User(
+                email=f"{first_name}.{last_name}.{index}@{rng.choice(DOMAINS)}".lower(),
+                first_name=first_name,
+                last_name=last_name,
+                hashed_password=hashed_password,
+                shipping_address=f"{rng.randint(1, 200)} Main St",
+                id=user_id(spec.seed, index),
+            )
+        )
+    return users
+
+
+def generate_items(spec: DatasetSpec, start: int, stop: int) -> List[Item]:
+    rng = _chunk_rng(spec, "items", start)
+    items = []
+    for index in range(start, stop):
+        name_index = index
+        if index and rng.random() < spec.name_collision_rate:
+            name_index = rng.randrange(index)
+        items.append(
+            Item(
+                name=item_name(spec.seed, name_index),
+                description=f"Synthetic item {index}",
+                price=round(max(0.5, rng.lognormvariate(3.0, 1.0)), 2),
+                quantity=rng.randint(0, 500),
+                id=item_id(spec.seed, index),
+            )
+        )
+    return items
+
+
+def cart_size(rng: random.Random, spec: DatasetSpec) -> int:
+    if rng.random() >= spec.cart_fraction:
+        return 0
+    # 1 + geometric, so carts that exist have the requested mean size.
+    extra = spec.mean_cart_size - 1
+    if extra <= 0:
+        return 1
+    p = 1 / (1 + extra)
+    return 1 + int(math.log(1 - rng.random()) / math.log(1 - p))
+
+
+def generate_cart_items(spec: DatasetSpec, start: int, stop: int) -> List[CartItem]:
+    # Carts for users [start, stop); items are drawn by Zipfian popularity,
+    # item 0 being the most popular.
+    if not spec.items:
+        return []
+    rng = _chunk_rng(spec, "carts", start)
+    cumulative = _zipf_cumulative(spec.items, spec.zipf_exponent)
+    total = cumulative[-1]
+    cart_items = []
+    for index in range(start, stop):
+        size = min(cart_size(rng, spec), spec.items)
+        chosen: Dict[int, None] = {}
+        while len(chosen) < size:
+            chosen[bisect.bisect_left(cumulative, rng.random() * total)] = None
+        owner = user_id(spec.seed, index)
+        cart_items.extend(
+            CartItem(
+                user_id=owner,
+                item_id=item_id(spec.seed, item_index),
+                quantity=1 + int(rng.expovariate(1.0)),
+            )
+            for item_index in chosen
+        )
+    return cart_items
+
+
+GENERATORS: Dict[str, Tuple[Callable[..., List[Any]], str]] = {
+    "user": (generate_users, "users"),
+    "item": (generate_items, "items"),
+    "cart_item": (generate_cart_items, "users"),
+}
+
+
+def _generate(args: Tuple[str, DatasetSpec, int, int]) -> List[Any]:
+    kind, spec, start, stop = args
+    return GENERATORS[kind][0](spec, start, stop)
+
+
+def chunks(spec: DatasetSpec, kind: str, workers: int = 1) -> Iterator[List[Any]]:
+    # Chunk boundaries, not the worker count, decide each chunk's random
+    # stream, so the dataset is identical however many workers generate it.
+    count = getattr(spec, GENERATORS[kind][1])
+    tasks = [
+        (kind, spec, start, min(start + spec.chunk_size, count))
+        for start in range(0, count, spec.chunk_size)
+    ]
+    if workers <= 1:
+        yield from map(_generate, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generate, tasks)
+
+
+async def save_all(repository: Any, entities: List[Any]) -> None:
+    if hasattr(repository, "save_many"):
+        await repository.save_many(entities)
+        return
+    for entity in entities:
+        await repository.save(entity)
+
+
+async def populate(
+    spec: DatasetSpec, repositories: Tuple[Any, Any, Any], workers: int = 1
+) -> Dict[str, int]:
+    counts = {}
+    for kind, repository in zip(("user", "item", "cart_item"), repositories):
+        counts[kind] = 0
+        for chunk in chunks(spec, kind, workers):
+            await save_all(repository, chunk)
+            counts[kind] += len(chunk)
+    return counts
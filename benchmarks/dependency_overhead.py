@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import time
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends, FastAPI
+
+from be_task_ca.adapters.security.sha256_password_hasher import Sha256PasswordHasher
+from be_task_ca.drivers.rest.container import Container
+from be_task_ca.drivers.rest.dependencies import get_add_item_to_cart_use_case
+from be_task_ca.drivers.rest.settings import Settings
+from be_task_ca.ports.repositories.cart_item_repository import CartItemRepository
+from be_task_ca.ports.repositories.item_repository import ItemRepository
+from be_task_ca.ports.repositories.user_repository import UserRepository
+from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
+
+from benchmarks.asgi import request
+
+
+def build_app(container: Container) -> FastAPI:
+    # The per-request graph this project used before the container: cached
+    # repository providers plus a use case built on every call, all sync.
+    @lru_cache
+    def get_user_repository() -> UserRepository:
+        return container.user_repository
+
+    @lru_cache
+    def get_item_repository() -> ItemRepository:
+        return container.item_repository
+
+    @lru_cache
+    def get_cart_item_repository() -> CartItemRepository:
+        return container.cart_item_repository
+
+    def get_per_request_use_case(
+        cart_repo: Annotated[CartItemRepository, Depends(get_cart_item_repository)],
+        user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+        item_repo: Annotated[ItemRepository, Depends(get_item_repository)],
+    ) -> AddItemToCartUseCase:
+        return AddItemToCartUseCase(
+            cart_repo,
+            user_repo,
+            item_repo,
+            container.cart_summary_repository,
+            container.event_publisher,
+        )
+
+    app = FastAPI()
+    app.state.container = container
+
+    @app.get("/bare")
+    async def bare():
+        return None
+
+    @app.get("/per-request")
+    async def per_request(
+        use_case: Annotated[AddItemToCartUseCase, Depends(get_per_request_use_case)],
+    ):
+        return None
+
+    @app.get("/container")
+    async def from_container(
+        use_case: Annotated[
+            AddItemToCartUseCase, Depends(get_add_item_to_cart_use_case)
+        ],
+    ):
+        return None
+
+    return app
+
+
+async def time_route(app: FastAPI, path: str, requests: int) -> float:
+    for _ in range(min(requests, 200)):
+        await request(app, "GET", path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request(app, "GET", path)
+    return (time.perf_counter() - started) / requests
+
+
+async def run(requests: int) -> None:
+    container = Container.build(Settings(), password_hasher=Sha256PasswordHasher())
+    app = build_app(container)
+
+    bare = await time_route(app, "/bare", requests)
+    print(f"{'bare route':<26} {bare * 1e6:>8.1f} us/request")
+    for name, path in (
+        ("per-request construction", "/per-request"),
+        ("app-scoped container", "/container"),
+    ):
+        elapsed = await time_route(app, path, requests)
+        print(
+            f"{name:<26} {elapsed * 1e6:>8.1f} us/request  "
+            f"dependency overhead={(elapsed - bare) * 1e6:>7.1f} us"
+        )
+    await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-request dependency resolution cost, old graph vs container."
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.asgi import lifespan, request
+from benchmarks.dataset import DatasetSpec, item_id, populate, user_id
+
+DEFAULT_MIX = "signup=1,create_item=1,catalog=6,cart_add=3,cart_read=3"
+PASSWORD = "load-test-password"
+
+
+class InProcessTarget:
+    def __init__(self, app: Any):
+        self.app = app
+        self._lifespan = lifespan(app)
+
+    async def __aenter__(self) -> "InProcessTarget":
+        await self._lifespan.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._lifespan.__aexit__(*exc_info)
+
+    def repositories(self) -> Tuple[Any, Any, Any]:
+        container = self.app.state.container
+        return (
+            container.user_repository,
+            container.item_repository,
+            container.cart_item_repository,
+        )
+
+    async def request(
+        self, method: str, path: str, body: Any = None
+    ) -> Tuple[int, Any]:
+        response = await request(self.app, method, path, json_body=body)
+        return response.status, response.json() if response.body else None
+
+
+class HttpTarget:
+    def __init__(self, base_url: str, connections: int):
+        try:
+            import httpx
+        except ImportError as error:
+            raise SystemExit("--url needs httpx installed") from error
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(max_connections=connections),
+            timeout=30.0,
+        )
+
+    async def __aenter__(self) -> "HttpTarget":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._client.aclose()
+
+    async def request(
+        self, method: str, path: str, body: Any = None
+    ) -> Tuple[int, Any]:
+        response = await self._client.request(method, path, json=body)
+        return response.status_code, response.json() if response.content else None
+
+
+class Load:
+    def __init__(self, target: Any, rng: random.Random):
+        self.target = target
+        self.rng = rng
+        self.user_ids: List[str] = []
+        self.item_ids: List[str] = []
+        self._sequence = itertools.count()
+
+    async def signup(self) -> int:
+        number = next(self._sequence)
+        status, body = await self.target.request(
+            "POST",
+            "/users/",
+            {
+                "email": f"load-{number}-{self.rng.getrandbits(32)}@example.com",
+                "first_name": "Load",
+                "last_name": "Test",
+                "password": PASSWORD,
+                "shipping_address": "1 Main St",
+            },
+        )
+        if status == 201:
+            self.user_ids.append(body["id"])
+        return status
+
+    async def create_item(self) -> int:
+        number = next(self._sequence)
+        status, body = await self.target.request(
+            "POST",
+            "/items/",
+            {
+                "name": f"load-item-{number}-{self.rng.getrandbits(32)}",
+                "description": "Created by the load harness",
+                "price": round(self.rng.uniform(1, 100), 2),
+                "quantity": 1_000_000,
+            },
+        )
+        if status == 201:
+            self.item_ids.append(body["id"])
+        return status
+
+    async def catalog(self) -> int:
+        status, _ = await self.target.request("GET", "/items/")
+        return status
+
+    async def cart_add(self) -> int:
+        status, _ = await self.target.request(
+            "POST",
+            f"/users/{self.rng.choice(self.user_ids)}/cart/",
+            {"item_id": self.rng.choice(self.item_ids), "quantity": 1},
+        )
+        return status
+
+    async def cart_read(self) -> int:
+        status, _ = await self.target.request(
+            "GET", f"/users/{self.rng.choice(self.user_ids)}/cart/totals"
+        )
+        return status
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1e3
+
+    return {
+        "p50_ms": at(0.50),
+        "p90_ms": at(0.90),
+        "p99_ms": at(0.99),
+        "max_ms": ordered[-1] * 1e3,
+    }
+
+
+async def probe_loop_lag(lags: List[float], stop: asyncio.Event, interval: float):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run(
+    target: Any,
+    mix: Dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed_users: int,
+    seed_items: int,
+    seed: int,
+    dataset: Optional[DatasetSpec] = None,
+) -> Dict[str, Any]:
+    load = Load(target, random.Random(seed))
+    if dataset is not None:
+        await populate(dataset, target.repositories(), os.cpu_count() or 1)
+        load.user_ids = [str(user_id(dataset.seed, i)) for i in range(dataset.users)]
+        load.item_ids = [str(item_id(dataset.seed, i)) for i in range(dataset.items)]
+    for _ in range(seed_users):
+        await load.signup()
+    for _ in range(seed_items):
+        await load.create_item()
+    if not load.user_ids or not load.item_ids:
+        raise SystemExit("seeding failed: no users or items were created")
+
+    scenarios: Dict[str, Callable] = {name: getattr(load, name) for name in mix}
+    names, weights = list(mix), list(mix.values())
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    outcomes: Dict[str, Counter] = defaultdict(Counter)
+    lags: List[float] = []
+    stop = asyncio.Event()
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            name = load.rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                status = await scenarios[name]()
+            except Exception:
+                status = 0
+            latencies[name].append(time.perf_counter() - started)
+            outcomes[name][status] += 1
+
+    probe = asyncio.create_task(probe_loop_lag(lags, stop, 0.01))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    def summary(samples: List[float], statuses: Counter) -> Dict[str, Any]:
+        total = sum(statuses.values())
+        server_errors = sum(n for s, n in statuses.items() if s == 0 or s >= 500)
+        client_errors = sum(n for s, n in statuses.items() if 400 <= s < 500)
+        return {
+            "requests": total,
+            "rps": total / elapsed,
+            "client_error_rate": client_errors / total if total else 0.0,
+            "error_rate": server_errors / total if total else 0.0,
+            "statuses": {str(s): n for s, n in sorted(statuses.items())},
+            **percentiles(samples),
+        }
+
+    return {
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "total": summary(
+            [sample for samples in latencies.values() for sample in samples],
+            sum(outcomes.values(), Counter()),
+        ),
+        "scenarios": {name: summary(latencies[name], outcomes[name]) for name in names},
+        "loop_lag": percentiles(lags),
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'scenario':<12} {'requests':>9} {'rps':>9} {'p50 ms':>8} {'p90 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'4xx':>7} {'errors':>7}"
+    )
+    rows = list(report["scenarios"].items()) + [("total", report["total"])]
+    for name, row in rows:
+        if not row["requests"]:
+            continue
+        print(
+            f"{name:<12} {row['requests']:>9} {row['rps']:>9.0f} "
+            f"{row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{row['max_ms']:>8.1f} {row['client_error_rate']:>7.1%} "
+            f"{row['error_rate']:>7.1%}"
+        )
+    lag = report["loop_lag"]
+    if lag:
+        print(
+            f"event-loop lag: p50={lag['p50_ms']:.1f}ms p99={lag['p99_ms']:.1f}ms "
+            f"max={lag['max_ms']:.1f}ms"
+        )
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    target: Any
+    dataset = None
+    if args.dataset_users or args.dataset_items:
+        dataset = DatasetSpec(
+            users=args.dataset_users, items=args.dataset_items, seed=args.seed
+        )
+    if args.url:
+        target = HttpTarget(args.url, args.concurrency)
+    else:
+        from be_task_ca.drivers.rest.app import create_app
+
+        target = InProcessTarget(create_app())
+    async with target:
+        return await run(
+            target,
+            parse_mix(args.mix),
+            args.concurrency,
+            args.duration,
+            args.seed_users,
+            args.seed_items,
+            args.seed,
+            dataset,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Mixed HTTP load against the app, in-process or over the network."
+    )
+    parser.add_argument(
+        "--url", help="base URL of a running server; in-process ASGI when omitted"
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help=f"scenario weights (default {DEFAULT_MIX})"
+    )
+    parser.add_argument("--seed-users", type=int, default=50)
+    parser.add_argument("--seed-items", type=int, default=200)
+    parser.add_argument(
+        "--dataset-users",
+        type=int,
+        default=0,
+        help="pre-fill this many synthetic users directly (in-process only)",
+    )
+    parser.add_argument(
+        "--dataset-items",
+        type=int,
+        default=0,
+        help="pre-fill this many synthetic items directly (in-process only)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if args.url and (args.dataset_users or args.dataset_items):
+        parser.error("--dataset-* fills repositories directly; not with --url")
+    unknown = set(parse_mix(args.mix)) - set(parse_mix(DEFAULT_MIX))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+from be_task_ca.adapters.metrics.instrumented import (
+    InstrumentedRepository,
+    InstrumentedUseCase,
+)
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.metrics import MetricsMiddleware
+from be_task_ca.drivers.rest.settings import Settings
+from be_task_ca.use_cases.get_all_items import GetAllItemsUseCase
+
+from benchmarks.asgi import lifespan, request
+
+
+async def per_call(call: Callable[[], Awaitable[Any]], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - started) / calls
+
+
+async def paired(
+    plain: Callable[[], Awaitable[Any]],
+    metered: Callable[[], Awaitable[Any]],
+    calls: int,
+    rounds: int,
+) -> float:
+    # Interleaved rounds and the median difference, so drift and GC pauses
+    # do not land on one side only.
+    differences = []
+    for _ in range(rounds):
+        off = await per_call(plain, calls)
+        on = await per_call(metered, calls)
+        differences.append(on - off)
+    return statistics.median(differences)
+
+
+async def components(calls: int, rounds: int) -> None:
+    registry = MetricsRegistry()
+
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": "/"}
+    middleware = MetricsMiddleware(endpoint, registry)
+
+    repository = InMemoryItemRepository()
+    item = await repository.save(Item(name="Lamp", description="", price=1, quantity=1))
+    instrumented = InstrumentedRepository(
+        repository,
+        "item",
+        registry.histogram("repo_seconds", "", ("repository", "method")),
+        registry.counter("repo_errors_total", "", ("repository", "method")),
+    )
+    use_case = GetAllItemsUseCase(repository)
+    timed_use_case = InstrumentedUseCase(
+        use_case, "get_all_items", registry.histogram("uc_seconds", "", ("u", "o"))
+    )
+
+    for name, plain, metered in (
+        (
+            "http middleware",
+            lambda: endpoint(scope, receive, send),
+            lambda: middleware(scope, receive, send),
+        ),
+        (
+            "repository proxy",
+            lambda: repository.find_by_id(item.id),
+            lambda: instrumented.find_by_id(item.id),
+        ),
+        ("use case proxy", use_case, timed_use_case),
+    ):
+        overhead = await paired(plain, metered, calls, rounds)
+        print(f"{name:<18} +{overhead * 1e6:5.2f} us/call")
+
+
+async def end_to_end(requests: int, rounds: int) -> None:
+    plain = create_app(Settings(metrics=False, openapi="disabled"))
+    metered = create_app(Settings(metrics=True, openapi="disabled"))
+    async with lifespan(plain), lifespan(metered):
+        for path in ("/", "/items/"):
+            overhead = await paired(
+                lambda path=path: request(plain, "GET", path),
+                lambda path=path: request(metered, "GET", path),
+                requests,
+                rounds,
+            )
+            baseline = await per_call(
+                lambda path=path: request(plain, "GET", path), requests
+            )
+            print(
+                f"GET {path:<14} +{overhead * 1e6:5.2f} us/request "
+                f"(of {baseline * 1e6:.0f} us)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-request cost of the metrics middleware and proxies."
+    )
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=21)
+    args = parser.parse_args()
+
+    asyncio.run(components(args.calls, args.rounds))
+    asyncio.run(end_to_end(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
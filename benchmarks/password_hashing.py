@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+from be_task_ca.adapters.events.null_event_publisher import NullEventPublisher
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from be_task_ca.adapters.security.pooled_password_hasher import (
+    DEFAULT_COST,
+    PBKDF2,
+    SCRYPT,
+    PooledPasswordHasher,
+    hash_password,
+    verify_password,
+)
+from be_task_ca.ports.security.password_hasher import PasswordHasher
+from be_task_ca.use_cases.commands.user_commands import CreateUserCommand
+from be_task_ca.use_cases.get_all_items import GetAllItemsUseCase
+from be_task_ca.use_cases.save_user import CreateUserUseCase
+
+
+class InlinePasswordHasher(PasswordHasher):
+    # What CreateUserUseCase would do with an expensive KDF and no pool.
+    def __init__(self, kdf: str, cost: Tuple[int, ...]):
+        self.kdf = kdf
+        self.cost = cost
+
+    async def hash(self, password: str) -> str:
+        return hash_password(self.kdf, password, self.cost)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return verify_password(password, hashed_password)
+
+    def close(self) -> None:
+        pass
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def probe_reads(
+    use_case: GetAllItemsUseCase, interval: float, stop: asyncio.Event
+) -> List[float]:
+    latencies = []
+    while not stop.is_set():
+        scheduled = time.perf_counter()
+        await asyncio.sleep(interval)
+        await use_case()
+        latencies.append(time.perf_counter() - scheduled - interval)
+    return latencies
+
+
+async def run(name: str, hasher: PasswordHasher, signups: int, interval: float) -> None:
+    create_user = CreateUserUseCase(
+        InMemoryUserRepository(), hasher, NullEventPublisher()
+    )
+    get_all_items = GetAllItemsUseCase(InMemoryItemRepository())
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_reads(get_all_items, interval, stop))
+    await asyncio.sleep(interval * 5)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            create_user(
+                CreateUserCommand(
+                    email=f"user{i}@example.com",
+                    first_name="Load",
+                    last_name="Test",
+                    password="password123",
+                )
+            )
+            for i in range(signups)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    latencies = [latency * 1000 for latency in await probe]
+    hasher.close()
+
+    print(
+        f"{name:<18} signups/s={signups / elapsed:>8.1f}  "
+        f"read lag ms p50={statistics.median(latencies):>7.2f} "
+        f"p99={percentile(latencies, 99):>7.2f} max={max(latencies):>7.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Signup throughput and concurrent read latency per hasher."
+    )
+    parser.add_argument("--kdf", choices=[SCRYPT, PBKDF2], default=SCRYPT)
+    parser.add_argument(
+        "--cost",
+        type=int,
+        nargs="+",
+        help="scrypt: N r p, pbkdf2: iterations (defaults to production cost)",
+    )
+    parser.add_argument("--signups", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--read-interval-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    cost = tuple(args.cost) if args.cost else DEFAULT_COST[args.kdf]
+    interval = args.read_interval_ms / 1000
+    hashers = [
+        ("inline", InlinePasswordHasher(args.kdf, cost)),
+        (
+            "thread pool",
+            PooledPasswordHasher(
+                args.kdf, cost, max_workers=args.workers, max_pending=args.signups
+            ),
+        ),
+        (
+            "process pool",
+            PooledPasswordHasher(
+                args.kdf,
+                cost,
+                max_workers=args.workers,
+                max_pending=args.signups,
+                use_processes=True,
+            ),
+        ),
+    ]
+
+    print(f"kdf={args.kdf} cost={cost} signups={args.signups}")
+    for name, hasher in hashers:
+        asyncio.run(run(name, hasher, args.signups, interval))
+
+
+if __name__ == "__main__":
+    main()
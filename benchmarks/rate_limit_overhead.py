@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import random
+import time
+
+from be_task_ca.adapters.rate_limit.buckets import (
+    InMemoryTokenBuckets,
+    SharedTokenBuckets,
+)
+from be_task_ca.drivers.rest.rate_limit import RateLimitMiddleware, build_rules
+
+from benchmarks.metrics_overhead import paired
+
+
+def take_cost(buckets, keys: int, calls: int) -> float:
+    names = [f"client:{index}" for index in range(keys)]
+    picks = [random.choice(names) for _ in range(calls)]
+    now = time.monotonic()
+    started = time.perf_counter()
+    for key in picks:
+        buckets.take(key, 100.0, 100.0, now)
+    return (time.perf_counter() - started) / calls
+
+
+async def middleware_cost(calls: int, rounds: int) -> None:
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    limits = (
+        ("POST", "/users/{user_id}/cart/", 1e9, 1e9),
+        ("GET", "/items/", 1e9, 1e9),
+    )
+    scopes = {
+        "limited": {"method": "GET", "path": "/items/"},
+        "unlimited": {"method": "GET", "path": "/"},
+    }
+    for store in (InMemoryTokenBuckets(), SharedTokenBuckets()):
+        middleware = RateLimitMiddleware(endpoint, build_rules(limits), store)
+        for name, fields in scopes.items():
+            scope = {"type": "http", "client": ("10.0.0.1", 1234), **fields}
+            overhead = await paired(
+                lambda scope=scope: endpoint(scope, receive, send),
+                lambda scope=scope, middleware=middleware: middleware(
+                    scope, receive, send
+                ),
+                calls,
+                rounds,
+            )
+            print(
+                f"middleware {type(store).__name__:<21} {name:<9} "
+                f"+{overhead * 1e6:5.2f} us/request"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-request cost of token-bucket rate limiting."
+    )
+    parser.add_argument("--keys", default="100,10000,100000")
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=21)
+    args = parser.parse_args()
+
+    for keys in (int(keys) for keys in args.keys.split(",")):
+        for buckets in (InMemoryTokenBuckets(), SharedTokenBuckets(slots=2 * keys)):
+            cost = take_cost(buckets, keys, args.calls)
+            print(
+                f"take {type(buckets).__name__:<21} {keys:>7} keys "
+                f"{cost * 1e6:5.2f} us/call"
+            )
+    asyncio.run(middleware_cost(args.calls // 10, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from be_task_ca.drivers.rest.container import BACKENDS
+from be_task_ca.drivers.rest.settings import Settings
+
+from benchmarks.dataset import DatasetSpec, chunks, save_all
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+CART_SIZE = 4
+
+
+@dataclass
+class Result:
+    backend: str
+    port: str
+    operation: str
+    size: int
+    ops: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    bytes_per_entity: float
+
+
+async def load(
+    spec: DatasetSpec, kind: str, repository: Any
+) -> Tuple[List[Any], float]:
+    tracemalloc.start()
+    entities = [entity for chunk in chunks(spec, kind) for entity in chunk]
+    await save_all(repository, entities)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return entities, allocated / max(1, len(entities))
+
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+def operations(
+    repositories: Tuple[Any, Any, Any], data: Dict[str, List[Any]], rng: random.Random
+) -> List[Tuple[str, str, Operation]]:
+    user_repository, item_repository, cart_item_repository = repositories
+    users, items, cart_items = data["user"], data["item"], data["cart_item"]
+
+    def pick(entities: List[Any]) -> Any:
+        return entities[rng.randrange(len(entities))]
+
+    async def find_cart_line() -> Any:
+        cart_item = pick(cart_items)
+        return await cart_item_repository.find_by_user_and_item(
+            cart_item.user_id, cart_item.item_id
+        )
+
+    return [
+        ("user", "find_by_id", lambda: user_repository.find_by_id(pick(users).id)),
+        (
+            "user",
+            "find_by_email",
+            lambda: user_repository.find_by_email(pick(users).email),
+        ),
+        ("item", "find_by_id", lambda: item_repository.find_by_id(pick(items).id)),
+        (
+            "item",
+            "find_by_name",
+            lambda: item_repository.find_by_name(pick(items).name),
+        ),
+        ("item", "list_all", item_repository.list_all),
+        (
+            "cart_item",
+            "find_cart_items_for_user_id",
+            lambda: cart_item_repository.find_cart_items_for_user_id(
+                pick(cart_items).user_id
+            ),
+        ),
+        ("cart_item", "find_by_user_and_item", find_cart_line),
+    ]
+
+
+def percentile(ordered: List[int], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] / 1e3
+
+
+async def time_operation(operation: Operation, ops: int, max_seconds: float):
+    latencies = []
+    started = time.perf_counter()
+    deadline = started + max_seconds
+    for _ in range(ops):
+        begin = time.perf_counter_ns()
+        await operation()
+        latencies.append(time.perf_counter_ns() - begin)
+        if time.perf_counter() > deadline:
+            break
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return len(latencies), len(latencies) / elapsed, latencies
+
+
+async def run_backend(
+    backend: str, size: int, ops: int, max_seconds: float, seed: int
+) -> List[Result]:
+    rng = random.Random(seed)
+    repositories = BACKENDS[backend](Settings(repository_backend=backend))
+    data: Dict[str, List[Any]] = {}
+    memory: Dict[str, float] = {}
+    for port, repository in zip(("user", "item", "cart_item"), repositories):
+        # Carts come from size / CART_SIZE users so every port holds about
+        # `size` entities.
+        spec = DatasetSpec(
+            users=size if port != "cart_item" else max(1, size // CART_SIZE),
+            items=size,
+            cart_fraction=1.0,
+            mean_cart_size=CART_SIZE,
+            seed=seed,
+        )
+        data[port], memory[port] = await load(spec, port, repository)
+
+    results = []
+    for port, name, operation in operations(repositories, data, rng):
+        count, throughput, latencies = await time_operation(operation, ops, max_seconds)
+        results.append(
+            Result(
+                backend=backend,
+                port=port,
+                operation=name,
+                size=size,
+                ops=count,
+                ops_per_sec=throughput,
+                p50_us=percentile(latencies, 0.50),
+                p99_us=percentile(latencies, 0.99),
+                bytes_per_entity=memory[port],
+            )
+        )
+    return results
+
+
+def result_key(result: Dict[str, Any]) -> Tuple[str, str, str, int]:
+    return result["backend"], result["port"], result["operation"], result["size"]
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], List[str]]]:
+    previous = {result_key(result): result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        before = previous.get(result_key(result))
+        if before is None:
+            continue
+        regressions = []
+        if result["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append("ops/sec")
+        if result["p99_us"] > before["p99_us"] * (1 + threshold):
+            regressions.append("p99")
+        if result["bytes_per_entity"] > before["bytes_per_entity"] * (1 + threshold):
+            regressions.append("memory")
+        rows.append((before, result, regressions))
+    return rows
+
+
+def print_comparison(
+    rows: List[Tuple[Dict[str, Any], Dict[str, Any], List[str]]],
+) -> bool:
+    regressed = False
+    for before, after, regressions in rows:
+        regressed = regressed or bool(regressions)
+        change = after["ops_per_sec"] / before["ops_per_sec"] - 1
+        flag = f"REGRESSION ({', '.join(regressions)})" if regressions else "ok"
+        print(
+            f"{after['backend']:<8} {after['port']:<10} {after['operation']:<28} "
+            f"{after['size']:>9} {change:>+8.1%} ops/sec  "
+            f"p99 {before['p99_us']:>9.1f} -> {after['p99_us']:>9.1f} us  {flag}"
+        )
+    return regressed
+
+
+def print_results(results: List[Result]) -> None:
+    print(
+        f"{'backend':<8} {'port':<10} {'operation':<28} {'size':>9} "
+        f"{'ops/sec':>12} {'p50 us':>10} {'p99 us':>10} {'B/entity':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.backend:<8} {result.port:<10} {result.operation:<28} "
+            f"{result.size:>9} {result.ops_per_sec:>12.0f} {result.p50_us:>10.1f} "
+            f"{result.p99_us:>10.1f} {result.bytes_per_entity:>9.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Repository operation throughput, latency and memory per entity."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated entity counts",
+    )
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=2.0,
+        help="time cap per operation, so linear scans at 1M finish",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    results: List[Result] = []
+    for backend in args.backends.split(","):
+        for size in (int(size) for size in args.sizes.split(",")):
+            results += asyncio.run(
+                run_backend(backend, size, args.ops, args.max_seconds, args.seed)
+            )
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(
+                {
+                    "meta": {
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "python": sys.version.split()[0],
+                        "platform": platform.platform(),
+                        "ops": args.ops,
+                        "max_seconds": args.max_seconds,
+                        "seed": args.seed,
+                    },
+                    "results": [asdict(result) for result in results],
+                },
+                output,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from be_task_ca.adapters.events.null_event_publisher import NullEventPublisher
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import (
+    InMemoryCartItemRepository,
+)
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import (
+    InMemoryCartSummaryRepository,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
+from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
+from be_task_ca.use_cases.exceptions.item_exceptions import InsufficientStockError
+
+
+class YieldingUserRepository(InMemoryUserRepository):
+    # Suspends on every lookup so concurrent requests interleave between the
+    # stock pre-check and the reservation, as they would against real I/O.
+    async def find_by_id(self, user_id: UUID):
+        await asyncio.sleep(0)
+        return await super().find_by_id(user_id)
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    accepted: int
+    elapsed: float
+    stock: int
+    remaining: int
+
+    @property
+    def oversold(self) -> int:
+        return max(0, self.accepted - self.stock) + max(0, -self.remaining)
+
+    def report(self) -> str:
+        return (
+            f"{self.scenario:<10} requests={self.requests:<7} "
+            f"accepted={self.accepted:<6} rejected={self.requests - self.accepted:<7} "
+            f"throughput={self.requests / self.elapsed:>10.0f} req/s  "
+            f"remaining={self.remaining:<5} oversold={self.oversold}"
+        )
+
+
+async def run_use_case(requests: int, stock: int) -> Result:
+    user_repository = YieldingUserRepository()
+    item_repository = InMemoryItemRepository()
+    use_case = AddItemToCartUseCase(
+        InMemoryCartItemRepository(),
+        user_repository,
+        item_repository,
+        InMemoryCartSummaryRepository(),
+        NullEventPublisher(),
+    )
+    item = await item_repository.save(
+        Item(name="Drop", description="Limited", price=99.0, quantity=stock)
+    )
+    users = [
+        await user_repository.save(
+            User(
+                email=f"buyer{i}@example.com",
+                first_name="Buyer",
+                last_name=str(i),
+                hashed_password="",
+                shipping_address="",
+            )
+        )
+        for i in range(requests)
+    ]
+
+    async def add_to_cart(user: User) -> bool:
+        try:
+            await use_case(
+                AddToCartCommand(user_id=user.id, item_id=item.id, quantity=1)
+            )
+        except InsufficientStockError:
+            return False
+        return True
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(add_to_cart(user) for user in users))
+    elapsed = time.perf_counter() - started
+
+    return Result("use_case", requests, sum(outcomes), elapsed, stock, item.quantity)
+
+
+def run_threads(requests: int, stock: int, threads: int, shards: int = 0) -> Result:
+    item_repository = InMemoryItemRepository()
+    item = Item(name="Drop", description="Limited", price=99.0, quantity=stock)
+    asyncio.run(item_repository.save(item))
+    if shards:
+        asyncio.run(item_repository.start_flash_sale(item.id, shards))
+    per_thread = requests // threads
+    accepted = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        async def reserve_many() -> int:
+            reserved = 0
+            for _ in range(per_thread):
+                if await item_repository.reserve_stock(item.id, 1) is not None:
+                    reserved += 1
+            return reserved
+
+        barrier.wait()
+        accepted[index] = asyncio.run(reserve_many())
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if shards:
+        asyncio.run(item_repository.end_flash_sale(item.id))
+
+    return Result(
+        f"sharded/{shards}" if shards else "threads",
+        per_thread * threads,
+        sum(accepted),
+        elapsed,
+        stock,
+        item.quantity,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Concurrent add-to-cart against a single item."
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--stock", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--shards", type=int, default=8)
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run_use_case(args.requests, args.stock)),
+        run_threads(args.requests * 10, args.stock * 10, args.threads),
+        run_threads(args.requests * 10, args.stock * 10, args.threads, args.shards),
+    ]
+    for result in results:
+        print(result.report())
+
+    if any(result.oversold for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+from benchmarks.asgi import lifespan, request
+from benchmarks.metrics_overhead import paired, per_call
+
+
+async def end_to_end(requests: int, rounds: int, sample_rates: list) -> None:
+    plain = create_app(Settings(metrics=False, openapi="disabled"))
+    async with lifespan(plain):
+        for path in ("/", "/items/"):
+            baseline = await per_call(
+                lambda path=path: request(plain, "GET", path), requests
+            )
+            print(f"GET {path:<10} untraced {baseline * 1e6:.0f} us/request")
+            for rate in sample_rates:
+                traced = create_app(
+                    Settings(
+                        metrics=False,
+                        openapi="disabled",
+                        tracing_exporter="ring",
+                        tracing_sample_rate=rate,
+                    )
+                )
+                async with lifespan(traced):
+                    overhead = await paired(
+                        lambda path=path: request(plain, "GET", path),
+                        lambda path=path, traced=traced: request(traced, "GET", path),
+                        requests,
+                        rounds,
+                    )
+                print(f"  sample rate {rate:<5} +{overhead * 1e6:5.2f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-request cost of tracing at different sample rates."
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=21)
+    parser.add_argument("--sample-rates", default="0,0.1,1")
+    args = parser.parse_args()
+
+    rates = [float(rate) for rate in args.sample_rates.split(",")]
+    asyncio.run(end_to_end(args.requests, args.rounds, rates))
+
+
+if __name__ == "__main__":
+    main()
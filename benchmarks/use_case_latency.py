@@ -0,0 +1,213 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List
+
+from be_task_ca.adapters.events.null_event_publisher import NullEventPublisher
+from be_task_ca.adapters.repositories.batching import (
+    BatchingItemRepository,
+    BatchingUserRepository,
+)
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import (
+    InMemoryCartItemRepository,
+)
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import (
+    InMemoryCartSummaryRepository,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.use_cases.add_cart_item_to_cart import AddItemToCartUseCase
+from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
+from be_task_ca.use_cases.get_user_cart import GetUserCartUseCase
+from be_task_ca.use_cases.get_user_cart_totals import GetUserCartTotalsUseCase
+
+
+class DelayedRepository:
+    # Stands in for an I/O-backed adapter: every port call costs one round-trip.
+    def __init__(self, inner: Any, delay: float):
+        self._inner = inner
+        self._delay = delay
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._inner, name)
+        if not asyncio.iscoroutinefunction(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(self._delay)
+            return await attribute(*args, **kwargs)
+
+        return call
+
+
+async def measure(
+    name: str,
+    invoke: Callable[[int], Awaitable[Any]],
+    repositories: List[DelayedRepository],
+    iterations: int,
+    delay: float,
+) -> None:
+    latencies = []
+    calls_before = sum(repository.calls for repository in repositories)
+    for i in range(iterations):
+        started = time.perf_counter()
+        await invoke(i)
+        latencies.append(time.perf_counter() - started)
+    calls = sum(repository.calls for repository in repositories) - calls_before
+
+    median = statistics.median(latencies)
+    serial = calls / iterations * delay
+    print(
+        f"{name:<14} p50={median * 1000:>7.2f} ms  "
+        f"serial={serial * 1000:>7.2f} ms  "
+        f"round-trips={median / delay:>4.1f} of {calls / iterations:.0f} calls"
+    )
+
+
+async def run(iterations: int, delay: float, cart_size: int) -> None:
+    users = DelayedRepository(InMemoryUserRepository(), delay)
+    items = DelayedRepository(InMemoryItemRepository(), delay)
+    cart_items = DelayedRepository(InMemoryCartItemRepository(), delay)
+
+    shoppers = [
+        await users._inner.save(
+            User(
+                email=f"user{i}@example.com",
+                first_name="Bench",
+                last_name=str(i),
+                hashed_password="",
+                shipping_address="",
+            )
+        )
+        for i in range(iterations)
+    ]
+    catalog = [
+        await items._inner.save(
+            Item(name=f"Item {i}", description="", price=9.99, quantity=10**9)
+        )
+        for i in range(cart_size)
+    ]
+    for shopper in shoppers:
+        for item in catalog:
+            await cart_items._inner.save(
+                CartItem(user_id=shopper.id, item_id=item.id, quantity=1)
+            )
+    hot_item = await items._inner.save(
+        Item(name="Hot", description="", price=1.0, quantity=10**9)
+    )
+
+    add_to_cart = AddItemToCartUseCase(
+        cart_items, users, items, InMemoryCartSummaryRepository(), NullEventPublisher()
+    )
+    get_cart = GetUserCartUseCase(cart_items, users)
+    get_totals = GetUserCartTotalsUseCase(cart_items, users, items)
+    repositories = [users, items, cart_items]
+
+    await measure(
+        "add_to_cart",
+        lambda i: add_to_cart(
+            AddToCartCommand(user_id=shoppers[i].id, item_id=hot_item.id, quantity=1)
+        ),
+        repositories,
+        iterations,
+        delay,
+    )
+    await measure(
+        "get_cart",
+        lambda i: get_cart(shoppers[i].id),
+        repositories,
+        iterations,
+        delay,
+    )
+    await measure(
+        "get_totals",
+        lambda i: get_totals(shoppers[i].id),
+        repositories,
+        iterations,
+        delay,
+    )
+
+
+async def run_concurrent(concurrency: int, delay: float, window_us: int) -> None:
+    for batched in (False, True):
+        users = DelayedRepository(InMemoryUserRepository(), delay)
+        items = DelayedRepository(InMemoryItemRepository(), delay)
+        cart_items = DelayedRepository(InMemoryCartItemRepository(), delay)
+        shoppers = [
+            await users._inner.save(
+                User(
+                    email=f"user{i}@example.com",
+                    first_name="Bench",
+                    last_name=str(i),
+                    hashed_password="",
+                    shipping_address="",
+                )
+            )
+            for i in range(concurrency)
+        ]
+        hot_item = await items._inner.save(
+            Item(name="Hot", description="", price=1.0, quantity=10**9)
+        )
+        user_repository: Any = users
+        item_repository: Any = items
+        if batched:
+            user_repository = BatchingUserRepository(users, window_us)
+            item_repository = BatchingItemRepository(items, window_us)
+        add_to_cart = AddItemToCartUseCase(
+            cart_items,
+            user_repository,
+            item_repository,
+            InMemoryCartSummaryRepository(),
+            NullEventPublisher(),
+        )
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                add_to_cart(
+                    AddToCartCommand(
+                        user_id=shopper.id, item_id=hot_item.id, quantity=1
+                    )
+                )
+                for shopper in shoppers
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+        name = "batched" if batched else "unbatched"
+        print(
+            f"{name:<14} {concurrency} concurrent add_to_cart in "
+            f"{elapsed * 1000:>7.2f} ms  user calls={users.calls:<5} "
+            f"item calls={items.calls}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Use case latency against repositories with injected I/O delay."
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=2.0)
+    parser.add_argument("--cart-size", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--batch-window-us", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations, args.delay_ms / 1000, args.cart_size))
+    asyncio.run(
+        run_concurrent(args.concurrency, args.delay_ms / 1000, args.batch_window_us)
+    )
+
+
+if __name__ == "__main__":
+    main()
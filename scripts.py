@@ -1,9 +1,119 @@
+import argparse
+import json
 import subprocess
+import sys
+import time
 import uvicorn
 
 
 def start():
-    uvicorn.run("be_task_ca.drivers.rest.app:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "be_task_ca.drivers.rest.app:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+    )
+
+
+def serve():
+    from be_task_ca.drivers.rest.server import serve
+
+    sys.exit(serve())
+
+
+def compare_benchmarks():
+    from benchmarks.repositories import compare, print_comparison
+
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark results with a stored baseline."
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="tolerated relative change"
+    )
+    args = parser.parse_args()
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        rows = compare(json.load(baseline), json.load(current), args.threshold)
+    sys.exit(1 if print_comparison(rows) else 0)
+
+
+def seed():
+    import asyncio
+    import os
+    from dataclasses import replace
+
+    from benchmarks.dataset import DatasetSpec, populate
+    from be_task_ca.drivers.rest.container import build_backend
+    from be_task_ca.drivers.rest.settings import Settings
+
+    # Every backend so far keeps its data in the process that builds it, so
+    # the dataset is gone when this command exits: it measures how fast
+    # populate() fills a backend and seeds nothing a server can see.
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time filling a repository backend with a synthetic dataset. The "
+            "in-memory backend lives in this process, so nothing persists and "
+            "running servers are not affected."
+        )
+    )
+    parser.add_argument("--users", type=int, default=DatasetSpec.users)
+    parser.add_argument("--items", type=int, default=DatasetSpec.items)
+    parser.add_argument(
+        "--cart-fraction", type=float, default=DatasetSpec.cart_fraction
+    )
+    parser.add_argument(
+        "--mean-cart-size", type=float, default=DatasetSpec.mean_cart_size
+    )
+    parser.add_argument(
+        "--zipf-exponent", type=float, default=DatasetSpec.zipf_exponent
+    )
+    parser.add_argument(
+        "--name-collision-rate", type=float, default=DatasetSpec.name_collision_rate
+    )
+    parser.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    parser.add_argument("--chunk-size", type=int, default=DatasetSpec.chunk_size)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--backend",
+        default=None,
+        help="repository backend (default: BE_TASK_CA_REPOSITORY_BACKEND)",
+    )
+    args = parser.parse_args()
+
+    spec = DatasetSpec(
+        users=args.users,
+        items=args.items,
+        cart_fraction=args.cart_fraction,
+        mean_cart_size=args.mean_cart_size,
+        zipf_exponent=args.zipf_exponent,
+        name_collision_rate=args.name_collision_rate,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+    settings = Settings.from_env()
+    if args.backend:
+        settings = replace(settings, repository_backend=args.backend)
+    started = time.perf_counter()
+    counts = asyncio.run(populate(spec, build_backend(settings), args.workers))
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(
+        f"filled a throwaway {settings.repository_backend} backend: "
+        + ", ".join(f"{count} {kind}s" for kind, count in counts.items())
+        + f" in {elapsed:.1f}s ({total / elapsed:.0f} entities/s)"
+    )
+
+
+def export_openapi():
+    from be_task_ca.drivers.rest.app import create_app
+    from be_task_ca.drivers.rest.settings import Settings
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    with open(path, "w") as schema_file:
+        json.dump(create_app(Settings()).openapi(), schema_file)
 
 
 def auto_format():
@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+import pytest
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+@pytest.mark.asyncio
+async def test_full_router_answers_503_with_retry_after():
+    app = create_app(
+        Settings(
+            admission_limits=(("items", 1, 0), ("users", 1, 0)), loop_monitor=False
+        )
+    )
+    release = asyncio.Event()
+
+    @app.get("/items/held")
+    async def held():
+        await release.wait()
+        return {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        holding = asyncio.create_task(client.get("/items/held"))
+        await asyncio.sleep(0.05)
+
+        shed = await client.get("/items/")
+        other_router = await client.get(
+            "/users/00000000-0000-0000-0000-000000000000/cart/"
+        )
+        release.set()
+        assert (await holding).status_code == 200
+        after = await client.get("/items/")
+        metrics = (await client.get("/metrics")).text
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert shed.json()["error"] == "overloaded"
+    assert other_router.status_code == 404
+    assert after.status_code == 200
+    assert 'admission_rejected_total{group="items"} 1' in metrics
+    assert 'http_requests_total{method="GET",route="unmatched",status="503"}' in metrics
+
+
+def test_unknown_admission_group_is_rejected():
+    with pytest.raises(ValueError):
+        create_app(Settings(admission_limits=(("orders", 1, 1),)))
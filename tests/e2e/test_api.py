@@ -1,13 +1,13 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from uuid import UUID
 
-from be_task_ca.drivers.rest.app import app
-from be_task_ca.drivers.rest.dependencies import (
-    get_user_repository,
-    get_item_repository,
-    get_cart_item_repository,
-)
+from be_task_ca.drivers.rest.app import app, create_app
+from be_task_ca.drivers.rest.container import Container
+from be_task_ca.drivers.rest.dependencies import get_container
+from be_task_ca.drivers.rest.settings import Settings
 from be_task_ca.adapters.repositories.user.in_memory_user_repository import (
     InMemoryUserRepository,
 )
@@ -35,10 +35,18 @@ def cart_item_repository():
 
 
 @pytest.fixture
-def client(user_repository, item_repository, cart_item_repository):
-    app.dependency_overrides[get_user_repository] = lambda: user_repository
-    app.dependency_overrides[get_item_repository] = lambda: item_repository
-    app.dependency_overrides[get_cart_item_repository] = lambda: cart_item_repository
+def container(user_repository, item_repository, cart_item_repository):
+    container = Container.build(
+        Settings(),
+        repositories=(user_repository, item_repository, cart_item_repository),
+    )
+    yield container
+    asyncio.run(container.close())
+
+
+@pytest.fixture
+def client(container):
+    app.dependency_overrides[get_container] = lambda: container
 
     yield TestClient(app)
 
@@ -137,3 +145,63 @@ def test_complete_shopping_flow(client):
     cart = get_cart_response.json()
     assert len(cart) == 1
     assert cart[0]["quantity"] == 2
+
+
+def test_get_cart_totals(client):
+    user_id = client.post(
+        "/users/",
+        json={
+            "email": "totals@example.com",
+            "first_name": "Tom",
+            "last_name": "Tally",
+            "password": "password123",
+        },
+    ).json()["id"]
+    keyboard_id = client.post(
+        "/items/",
+        json={
+            "name": "Keyboard",
+            "description": "Mechanical keyboard",
+            "price": 149.99,
+            "quantity": 20,
+        },
+    ).json()["id"]
+    mouse_id = client.post(
+        "/items/",
+        json={
+            "name": "Mouse",
+            "description": "A mouse",
+            "price": 29.99,
+            "quantity": 50,
+        },
+    ).json()["id"]
+    client.post(f"/users/{user_id}/cart", json={"item_id": keyboard_id, "quantity": 2})
+    client.post(f"/users/{user_id}/cart", json={"item_id": mouse_id, "quantity": 3})
+
+    response = client.get(f"/users/{user_id}/cart/totals")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [line["name"] for line in data["lines"]] == ["Keyboard", "Mouse"]
+    assert data["lines"][0]["line_total"] == 299.98
+    assert data["subtotal"] == 389.95
+    assert data["total"] == 389.95
+    assert data["item_count"] == 5
+
+
+def test_get_cart_totals_user_not_found(client):
+    response = client.get(f"/users/{UUID(int=0)}/cart/totals")
+    assert response.status_code == 404
+
+
+def test_lifespan_builds_container_from_settings(monkeypatch):
+    monkeypatch.setenv("BE_TASK_CA_COALESCE_READS", "true")
+
+    configured = create_app()
+    with TestClient(configured) as client:
+        container = configured.state.container
+        response = client.get("/items/")
+
+    assert response.status_code == 200
+    assert container.settings.coalesce_reads
+    assert container.closers == []
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_create_app_serves_openapi_lazily_by_default():
+    app = create_app(Settings())
+
+    with TestClient(app) as client:
+        assert app.openapi_schema is None
+        response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert "/users/" in response.json()["paths"]
+
+
+def test_create_app_builds_openapi_at_startup():
+    app = create_app(Settings(openapi="startup"))
+
+    with TestClient(app):
+        assert app.openapi_schema is not None
+        assert "/items/" in app.openapi_schema["paths"]
+
+
+def test_create_app_disables_openapi_and_docs():
+    app = create_app(Settings(openapi="disabled"))
+
+    with TestClient(app) as client:
+        assert client.get("/openapi.json").status_code == 404
+        assert client.get("/docs").status_code == 404
+        assert client.get("/").status_code == 200
+
+
+def test_create_app_loads_precomputed_openapi(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps({"openapi": "3.1.0", "paths": {"/precomputed": {}}}))
+    app = create_app(Settings(openapi_schema_path=str(path)))
+
+    with TestClient(app) as client:
+        response = client.get("/openapi.json")
+
+    assert response.json()["paths"] == {"/precomputed": {}}
+
+
+def test_create_app_rejects_unknown_openapi_mode():
+    with pytest.raises(ValueError):
+        create_app(Settings(openapi="eager"))
+
+
+def test_create_app_reads_settings_from_env(monkeypatch):
+    monkeypatch.setenv("BE_TASK_CA_OPENAPI", "disabled")
+
+    app = create_app()
+
+    assert app.state.settings.openapi == "disabled"
+    assert app.openapi_url is None
@@ -0,0 +1,94 @@
+from uuid import UUID, uuid4
+
+from fastapi.testclient import TestClient
+
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def sign_up(client: TestClient) -> str:
+    return client.post(
+        "/users/",
+        json={
+            "email": "summary@example.com",
+            "first_name": "Sam",
+            "last_name": "Doe",
+            "password": "secret-password",
+            "shipping_address": "1 Main St",
+        },
+    ).json()["id"]
+
+
+def create_item(client: TestClient, name: str, price: float) -> str:
+    return client.post(
+        "/items/",
+        json={"name": name, "description": "", "price": price, "quantity": 10},
+    ).json()["id"]
+
+
+def test_summary_follows_cart_and_price_changes():
+    with TestClient(create_app(Settings(admin_token="secret"))) as client:
+        user_id = sign_up(client)
+        empty = client.get(f"/users/{user_id}/cart/summary").json()
+        lamp = create_item(client, "Lamp", 10.0)
+        desk = create_item(client, "Desk", 2.5)
+        client.post(f"/users/{user_id}/cart/", json={"item_id": lamp, "quantity": 2})
+        client.post(f"/users/{user_id}/cart/", json={"item_id": desk, "quantity": 1})
+        before = client.get(f"/users/{user_id}/cart/summary").json()
+        patched = client.patch(f"/items/{lamp}", json={"price": 12.0})
+        after = client.get(f"/users/{user_id}/cart/summary").json()
+        totals = client.get(f"/users/{user_id}/cart/totals").json()
+        check = client.post("/admin/cart-summaries/check", headers=ADMIN)
+
+    assert empty == {"user_id": user_id, "line_count": 0, "item_count": 0, "total": 0}
+    assert before == {
+        "user_id": user_id,
+        "line_count": 2,
+        "item_count": 3,
+        "total": 22.5,
+    }
+    assert patched.status_code == 200
+    assert patched.json()["price"] == 12.0
+    assert after["total"] == totals["total"] == 26.5
+    assert check.json() == {"mismatches": [], "repaired": 0}
+
+
+def test_summary_and_price_update_errors():
+    with TestClient(create_app(Settings(admin_token="secret"))) as client:
+        missing_user = client.get(f"/users/{uuid4()}/cart/summary")
+        missing_item = client.patch(f"/items/{uuid4()}", json={"price": 1.0})
+        invalid_price = client.patch(f"/items/{uuid4()}", json={"price": 0})
+        unauthorized = client.post("/admin/cart-summaries/check")
+
+    assert missing_user.status_code == 404
+    assert missing_item.status_code == 404
+    assert invalid_price.status_code == 422
+    assert unauthorized.status_code == 401
+
+
+def test_check_reports_and_repairs_a_drifted_summary():
+    app = create_app(Settings(admin_token="secret"))
+    with TestClient(app) as client:
+        user_id = sign_up(client)
+        lamp = create_item(client, "Lamp", 10.0)
+        client.post(f"/users/{user_id}/cart/", json={"item_id": lamp, "quantity": 1})
+        # Add a line behind the view's back, under the metrics proxy.
+        backend = app.state.container.cart_item_repository.inner
+        backend.cart_items.append(
+            CartItem(user_id=UUID(user_id), item_id=UUID(lamp), quantity=1)
+        )
+
+        first = client.post("/admin/cart-summaries/check?repair=true", headers=ADMIN)
+        second = client.post("/admin/cart-summaries/check", headers=ADMIN)
+        summary = client.get(f"/users/{user_id}/cart/summary").json()
+
+    (mismatch,) = first.json()["mismatches"]
+    assert mismatch["user_id"] == user_id
+    assert mismatch["actual"]["total"] == 10.0
+    assert mismatch["expected"]["total"] == 20.0
+    assert first.json()["repaired"] == 1
+    assert second.json()["mismatches"] == []
+    assert summary["total"] == 20.0
@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.adapters.events.null_event_publisher import NullEventPublisher
+from be_task_ca.domain.events import ItemAddedToCart, ItemCreated, UserRegistered
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_use_cases_publish_events_to_subscribers():
+    app = create_app(Settings(events=True))
+    received = []
+
+    async def handle(event):
+        received.append(event)
+
+    with TestClient(app) as client:
+        bus = app.state.container.event_publisher
+        bus.subscribe((UserRegistered, ItemCreated, ItemAddedToCart), handle)
+        user = client.post(
+            "/users/",
+            json={
+                "email": "events@example.com",
+                "first_name": "Eve",
+                "last_name": "Doe",
+                "password": "secret-password",
+                "shipping_address": "1 Main St",
+            },
+        ).json()
+        item = client.post(
+            "/items/",
+            json={"name": "Lamp", "description": "", "price": 10.0, "quantity": 5},
+        ).json()
+        client.post(
+            f"/users/{user['id']}/cart/", json={"item_id": item["id"], "quantity": 2}
+        )
+        client.post(
+            "/items/",
+            json={"name": "Lamp", "description": "", "price": 10.0, "quantity": 5},
+        )
+
+    assert [type(event) for event in received] == [
+        UserRegistered,
+        ItemCreated,
+        ItemAddedToCart,
+    ]
+    assert str(received[1].item_id) == item["id"]
+    assert received[2].quantity == 2
+    assert bus.stats()["backlog"] == 0
+
+
+def test_events_are_off_by_default():
+    app = create_app()
+
+    with TestClient(app):
+        assert isinstance(app.state.container.event_publisher, NullEventPublisher)
@@ -0,0 +1,76 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def create_item(client: TestClient) -> str:
+    return client.post(
+        "/items/",
+        json={"name": "Drop", "description": "", "price": 99.0, "quantity": 10},
+    ).json()["id"]
+
+
+def sign_up(client: TestClient) -> str:
+    return client.post(
+        "/users/",
+        json={
+            "email": "drop@example.com",
+            "first_name": "Sam",
+            "last_name": "Doe",
+            "password": "secret-password",
+            "shipping_address": "1 Main St",
+        },
+    ).json()["id"]
+
+
+def test_admin_starts_and_ends_a_flash_sale_through_every_decorator():
+    settings = Settings(
+        admin_token="secret",
+        flash_sale_shards=4,
+        cache_reads=True,
+        coalesce_reads=True,
+        batch_reads_window_us=0,
+        batch_writes_window_ms=1.0,
+    )
+    with TestClient(create_app(settings)) as client:
+        item_id = create_item(client)
+        user_id = sign_up(client)
+        started = client.post(f"/admin/items/{item_id}/flash-sale", headers=ADMIN)
+        client.post(f"/users/{user_id}/cart/", json={"item_id": item_id, "quantity": 3})
+        during = client.get("/items/").json()
+        ended = client.delete(f"/admin/items/{item_id}/flash-sale", headers=ADMIN)
+        again = client.delete(f"/admin/items/{item_id}/flash-sale", headers=ADMIN)
+        after = client.get("/items/").json()
+        unauthorized = client.post(f"/admin/items/{item_id}/flash-sale")
+        missing = client.post(
+            "/admin/items/00000000-0000-0000-0000-000000000000/flash-sale",
+            headers=ADMIN,
+        )
+
+    assert started.json() == {"item_id": item_id, "shards": 4}
+    assert during[0]["quantity"] == 7
+    assert ended.json() == {"item_id": item_id, "ended": True}
+    assert again.json() == {"item_id": item_id, "ended": False}
+    assert after[0]["quantity"] == 7
+    assert unauthorized.status_code == 401
+    assert missing.status_code == 404
+
+
+def test_idle_flash_sales_are_merged_in_the_background():
+    settings = Settings(
+        admin_token="secret",
+        flash_sale_idle_s=0.0,
+        flash_sale_cool_down_interval_s=0.01,
+    )
+    with TestClient(create_app(settings)) as client:
+        item_id = create_item(client)
+        client.post(f"/admin/items/{item_id}/flash-sale", headers=ADMIN)
+        time.sleep(0.2)
+        ended = client.delete(f"/admin/items/{item_id}/flash-sale", headers=ADMIN)
+
+    assert ended.json()["ended"] is False
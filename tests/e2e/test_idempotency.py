@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.idempotency import MAX_BODY_BYTES
+from be_task_ca.drivers.rest.settings import Settings
+
+LAMP = {"name": "Lamp", "description": "", "price": 10.0, "quantity": 5}
+AUTH = {"Authorization": "Bearer client-a"}
+
+
+def test_retried_post_is_replayed_without_running_the_use_case():
+    app = create_app()
+
+    with TestClient(app, headers=AUTH) as client:
+        first = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k1"})
+        retry = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k1"})
+        without_key = client.post("/items/", json=LAMP)
+        items = client.get("/items/").json()
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert without_key.status_code == 409
+    assert len(items) == 1
+
+
+def test_reusing_a_key_with_another_body_is_rejected():
+    app = create_app()
+
+    with TestClient(app, headers=AUTH) as client:
+        client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k1"})
+        reused = client.post(
+            "/items/", json={**LAMP, "name": "Desk"}, headers={"Idempotency-Key": "k1"}
+        )
+        too_long = client.post(
+            "/items/", json=LAMP, headers={"Idempotency-Key": "k" * 256}
+        )
+
+    assert reused.status_code == 422
+    assert reused.json()["error"] == "idempotency_key_reused"
+    assert too_long.status_code == 400
+
+
+def test_error_responses_are_replayed_too():
+    app = create_app()
+
+    with TestClient(app, headers=AUTH) as client:
+        client.post("/items/", json=LAMP)
+        conflict = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+        replayed = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+
+    assert conflict.status_code == replayed.status_code == 409
+    assert replayed.headers["idempotent-replayed"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_execution():
+    app = create_app(Settings(loop_monitor=False))
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://test", headers=AUTH
+    ) as client:
+        container = app.state.container
+        create_item = container.create_item
+        calls = 0
+
+        async def slow_create_item(command):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return await create_item(command)
+
+        container.create_item = slow_create_item
+        responses = await asyncio.gather(
+            *(
+                client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+                for _ in range(3)
+            )
+        )
+        metrics = (await client.get("/metrics")).text
+
+    assert calls == 1
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert 'idempotency_coalesced_total{cache="responses"} 2' in metrics
+
+
+def test_rate_limited_requests_are_not_stored():
+    app = create_app(Settings(rate_limits=(("POST", "/items/", 20, 1),)))
+
+    with TestClient(app, headers=AUTH) as client:
+        client.post("/items/", json={**LAMP, "name": "Desk"})
+        limited = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+        time.sleep(0.1)
+        retry = client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+
+    assert limited.status_code == 429
+    assert retry.status_code == 201
+    assert "idempotent-replayed" not in retry.headers
+
+
+def test_keys_are_scoped_per_credential_and_ignored_without_one():
+    app = create_app()
+
+    with TestClient(app) as client:
+        first = client.post(
+            "/items/",
+            json=LAMP,
+            headers={"Idempotency-Key": "k", "Authorization": "Bearer a"},
+        )
+        other_credential = client.post(
+            "/items/",
+            json=LAMP,
+            headers={"Idempotency-Key": "k", "Authorization": "Bearer b"},
+        )
+        anonymous = [
+            client.post("/items/", json=LAMP, headers={"Idempotency-Key": "k"})
+            for _ in range(2)
+        ]
+        replayed = client.post(
+            "/items/",
+            json=LAMP,
+            headers={"Idempotency-Key": "k", "Authorization": "Bearer a"},
+        )
+
+    assert first.status_code == 201
+    assert other_credential.status_code == 409
+    assert "idempotent-replayed" not in other_credential.headers
+    assert [response.status_code for response in anonymous] == [409, 409]
+    assert all("idempotent-replayed" not in r.headers for r in anonymous)
+    assert replayed.headers["idempotent-replayed"] == "true"
+
+
+def test_oversized_bodies_are_rejected_before_buffering_them_all():
+    app = create_app()
+
+    with TestClient(app, headers=AUTH) as client:
+        response = client.post(
+            "/items/",
+            json={**LAMP, "description": "x" * (MAX_BODY_BYTES + 1)},
+            headers={"Idempotency-Key": "k"},
+        )
+
+    assert response.status_code == 413
+    assert response.json()["error"] == "request_too_large"
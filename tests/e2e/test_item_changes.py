@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def create_item(client: TestClient, name: str) -> str:
+    return client.post(
+        "/items/",
+        json={"name": name, "description": "", "price": 10.0, "quantity": 10},
+    ).json()["id"]
+
+
+def sign_up(client: TestClient) -> str:
+    return client.post(
+        "/users/",
+        json={
+            "email": "sync@example.com",
+            "first_name": "Sam",
+            "last_name": "Doe",
+            "password": "secret-password",
+            "shipping_address": "1 Main St",
+        },
+    ).json()["id"]
+
+
+def test_delta_sync_returns_only_items_changed_since():
+    with TestClient(create_app(Settings())) as client:
+        lamp = create_item(client, "Lamp")
+        desk = create_item(client, "Desk")
+        create_item(client, "Chair")
+        initial = client.get("/items/changes").json()
+        user_id = sign_up(client)
+        client.post(f"/users/{user_id}/cart/", json={"item_id": lamp, "quantity": 3})
+        client.patch(f"/items/{desk}", json={"price": 12.0})
+        delta = client.get(f"/items/changes?since={initial['next_since']}").json()
+        idle = client.get(f"/items/changes?since={delta['next_since']}").json()
+
+    assert len(initial["items"]) == 3
+    assert initial["resync"] is False
+    assert [
+        (item["id"], item["quantity"], item["price"]) for item in delta["items"]
+    ] == [
+        (lamp, 7, 10.0),
+        (desk, 10, 12.0),
+    ]
+    assert delta["has_more"] is False
+    assert idle == {
+        "items": [],
+        "next_since": delta["next_since"],
+        "has_more": False,
+        "resync": False,
+    }
+
+
+def test_delta_sync_pages_and_signals_a_resync_after_compaction():
+    with TestClient(create_app(Settings(item_change_log_capacity=2))) as client:
+        lamp = create_item(client, "Lamp")
+        desk = create_item(client, "Desk")
+        page = client.get("/items/changes?since=0&limit=1").json()
+        chair = create_item(client, "Chair")
+        rest = client.get(f"/items/changes?since={page['next_since']}").json()
+        behind = client.get("/items/changes?since=0").json()
+        invalid = client.get("/items/changes?since=-1")
+
+    assert [item["id"] for item in page["items"]] == [lamp]
+    assert page["has_more"] is True
+    assert [item["id"] for item in rest["items"]] == [desk, chair]
+    assert behind == {"items": [], "next_since": 3, "has_more": False, "resync": True}
+    assert invalid.status_code == 422
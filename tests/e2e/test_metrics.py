@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.adapters.metrics.instrumented import InstrumentedUseCase
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_metrics_endpoint_reports_requests_use_cases_and_repositories():
+    app = create_app(Settings(coalesce_reads=True))
+
+    with TestClient(app) as client:
+        client.get("/items/")
+        client.get("/users/00000000-0000-0000-0000-000000000000/cart/")
+        client.get("/does-not-exist")
+        response = client.get("/metrics")
+
+    body = response.text
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/items/",status="200"} 1' in body
+    assert (
+        'http_requests_total{method="GET",route="/users/{user_id}/cart/",status="404"} 1'
+        in body
+    )
+    assert 'route="unmatched",status="404"' in body
+    assert "http_requests_in_flight 1" in body
+    assert (
+        'use_case_duration_seconds_count{use_case="get_all_items",outcome="ok"} 1'
+        in body
+    )
+    assert (
+        'use_case_duration_seconds_count{use_case="get_user_cart",outcome="error"} 1'
+        in body
+    )
+    assert (
+        'repository_call_duration_seconds_count{repository="item",method="list_all"} 1'
+        in body
+    )
+    assert 'cache_hit_ratio{cache="single_flight_item"}' in body
+
+
+def test_metrics_can_be_disabled():
+    app = create_app(Settings(metrics=False))
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+        container = app.state.container
+
+    assert response.status_code == 404
+    assert not isinstance(container.get_all_items, InstrumentedUseCase)
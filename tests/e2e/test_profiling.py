@@ -0,0 +1,66 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+ADMIN = {"x-admin-token": "secret"}
+
+
+def test_profile_endpoint_requires_the_admin_token():
+    app = create_app(Settings(admin_token="secret"))
+
+    with TestClient(app) as client:
+        missing = client.get("/admin/profile", params={"seconds": 0.01})
+        wrong = client.get(
+            "/admin/profile",
+            params={"seconds": 0.01},
+            headers={"x-admin-token": "guess"},
+        )
+
+    assert missing.status_code == 401
+    assert wrong.status_code == 401
+
+
+def test_profile_endpoint_returns_collapsed_stacks():
+    app = create_app(Settings(admin_token="secret"))
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/admin/profile",
+            params={"seconds": 0.2, "interval_ms": 1, "all_threads": True},
+            headers=ADMIN,
+        )
+        too_long = client.get("/admin/profile", params={"seconds": 600}, headers=ADMIN)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    stack, count = response.text.splitlines()[0].rsplit(" ", 1)
+    assert ";" in stack
+    assert int(count) > 0
+    assert too_long.status_code == 400
+
+
+def test_profile_header_stores_a_profile_of_the_request():
+    app = create_app(Settings(admin_token="secret"))
+
+    with TestClient(app) as client:
+        response = client.get("/items/", headers={"x-profile": "1", **ADMIN})
+        profile = client.get(
+            f"/admin/profiles/{response.headers['x-profile-id']}", headers=ADMIN
+        )
+        unprofiled = client.get("/items/", headers={"x-profile": "1"})
+        missing = client.get("/admin/profiles/999", headers=ADMIN)
+
+    assert response.status_code == 200
+    assert "item_router:get_all_items" in profile.text
+    assert "x-profile-id" not in unprofiled.headers
+    assert missing.status_code == 404
+
+
+def test_profiling_is_off_without_an_admin_token():
+    app = create_app()
+
+    with TestClient(app) as client:
+        response = client.get("/admin/profile", headers=ADMIN)
+
+    assert response.status_code == 404
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_routes_are_limited_per_route_and_client_address():
+    app = create_app(
+        Settings(
+            rate_limits=(
+                ("GET", "/items/", 0.001, 2),
+                ("GET", "/users/{user_id}/cart/", 0.001, 1),
+            )
+        )
+    )
+    first, second = (
+        "/users/00000000-0000-0000-0000-000000000001/cart/",
+        "/users/00000000-0000-0000-0000-000000000002/cart/",
+    )
+
+    with TestClient(app) as client:
+        items = [client.get("/items/").status_code for _ in range(3)]
+        created = client.post(
+            "/items/",
+            json={"name": "Lamp", "description": "", "price": 1, "quantity": 1},
+        )
+        carts = [client.get(path).status_code for path in (first, second)]
+        credentials = client.get(first, headers={"Authorization": "Bearer other"})
+        limited = client.get("/items/")
+        metrics = client.get("/metrics").text
+    with TestClient(app, client=("10.0.0.2", 50000)) as other_client:
+        other_address = other_client.get(first)
+
+    assert items == [200, 200, 429]
+    assert created.status_code == 201
+    assert carts == [404, 429]
+    assert credentials.status_code == 429
+    assert other_address.status_code == 404
+    assert int(limited.headers["retry-after"]) > 1
+    assert limited.json()["error"] == "rate_limited"
+    assert 'http_rate_limited_total{route="/items/"} 2' in metrics
+
+
+def test_shared_store_is_selectable():
+    app = create_app(
+        Settings(rate_limits=(("GET", "/items/", 1, 1),), rate_limit_store="shared")
+    )
+
+    with TestClient(app) as client:
+        statuses = [client.get("/items/").status_code for _ in range(2)]
+
+    assert statuses == [200, 429]
@@ -0,0 +1,94 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+from be_task_ca.drivers.rest.server import RestartPolicy
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                return json.loads(response.read())
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_serve_runs_workers_and_drains_on_sigterm():
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import scripts; scripts.serve()"],
+        env={
+            **os.environ,
+            "BE_TASK_CA_HOST": "127.0.0.1",
+            "BE_TASK_CA_PORT": str(port),
+            "BE_TASK_CA_WORKERS": "2",
+            "BE_TASK_CA_GRACEFUL_TIMEOUT_S": "5",
+            "BE_TASK_CA_OPENAPI": "disabled",
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        assert wait_for(f"http://127.0.0.1:{port}/")["status"] == "healthy"
+        assert wait_for(f"http://127.0.0.1:{port}/items/") == []
+
+        process.send_signal(signal.SIGTERM)
+
+        assert process.wait(timeout=10) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def test_restart_delay_doubles_and_gives_up_after_a_crash_loop():
+    policy = RestartPolicy(backoff=0.1, max_backoff=0.3, max_restarts=3, window=10.0)
+
+    delays = [policy.delay(0, now) for now in (0.0, 1.0, 2.0, 3.0)]
+
+    assert delays == [0.1, 0.2, 0.3, None]
+    assert policy.delay(1, 3.0) == 0.1
+    assert policy.delay(0, 20.0) == 0.1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_serve_gives_up_when_workers_crash_on_boot():
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import scripts; scripts.serve()"],
+        env={
+            **os.environ,
+            "BE_TASK_CA_HOST": "127.0.0.1",
+            "BE_TASK_CA_PORT": str(free_port()),
+            "BE_TASK_CA_WORKERS": "2",
+            "BE_TASK_CA_OPENAPI": "disabled",
+            "BE_TASK_CA_REPOSITORY_BACKEND": "missing",
+            "BE_TASK_CA_WORKER_RESTART_BACKOFF_S": "0.01",
+            "BE_TASK_CA_WORKER_MAX_RESTARTS": "3",
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        assert process.wait(timeout=30) != 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
@@ -0,0 +1,48 @@
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_request_spans_cover_use_case_and_repository_calls():
+    app = create_app(Settings(tracing_exporter="ring"))
+
+    with TestClient(app) as client:
+        response = client.get("/items/")
+
+    [spans] = app.state.tracer.exporter.traces().values()
+    by_name = {span.name: span for span in spans}
+    root = by_name["GET /items/"]
+    use_case = by_name["use_case.get_all_items"]
+    repository = by_name["repository.item.list_all"]
+    assert response.headers["traceparent"] == f"00-{root.trace_id}-{root.span_id}-01"
+    assert root.attributes["http.status_code"] == 200
+    assert use_case.parent_id == root.span_id
+    assert repository.parent_id == use_case.span_id
+    assert repository.attributes["rows_scanned"] == 0
+
+
+def test_incoming_traceparent_is_continued():
+    app = create_app(Settings(tracing_exporter="ring"))
+    trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+
+    with TestClient(app) as client:
+        client.get("/items/", headers={"traceparent": f"00-{trace_id}-{parent_id}-01"})
+        unsampled = client.get(
+            "/items/", headers={"traceparent": f"00-{trace_id}-{parent_id}-00"}
+        )
+
+    spans = app.state.tracer.exporter.spans
+    assert {span.trace_id for span in spans} == {trace_id}
+    assert len(spans) == 3
+    assert "traceparent" not in unsampled.headers
+
+
+def test_tracing_is_off_by_default():
+    app = create_app()
+
+    with TestClient(app) as client:
+        response = client.get("/items/")
+
+    assert "traceparent" not in response.headers
+    assert not hasattr(app.state, "tracer")
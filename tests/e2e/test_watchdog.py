@@ -0,0 +1,57 @@
+import logging
+import time
+
+from fastapi.testclient import TestClient
+
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def hash_synchronously() -> None:
+    time.sleep(0.2)
+
+
+def test_slow_request_is_logged_with_the_blocking_stack(caplog):
+    app = create_app(
+        Settings(
+            loop_lag_interval_ms=10, loop_block_threshold_ms=30, slow_request_ms=100
+        )
+    )
+
+    @app.get("/blocking")
+    async def blocking():
+        hash_synchronously()
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="be_task_ca.watchdog"):
+        with TestClient(app) as client:
+            client.get("/items/")
+            client.get("/blocking")
+            metrics = client.get("/metrics").text
+
+    [record] = caplog.records
+    message = record.getMessage()
+    assert message.startswith("Slow request GET /blocking -> 200: total")
+    assert "loop blocked" in message
+    assert message.rstrip().endswith("hash_synchronously")
+    assert "http_slow_requests_total 1" in metrics
+    assert 'event_loop_lag_seconds{quantile="0.99"}' in metrics
+    assert "event_loop_stalls_total 1" in metrics
+
+
+def test_loop_monitor_can_be_disabled():
+    app = create_app(Settings(loop_monitor=False))
+
+    with TestClient(app) as client:
+        metrics = client.get("/metrics").text
+
+    assert not hasattr(app.state, "loop_monitor")
+    assert "event_loop_lag_seconds" not in metrics
+
+
+def test_app_lifespan_can_run_twice():
+    app = create_app(Settings())
+
+    for _ in range(2):
+        with TestClient(app) as client:
+            assert client.get("/items/").status_code == 200
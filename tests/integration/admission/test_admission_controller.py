@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from be_task_ca.adapters.admission.controller import READ, WRITE, AdmissionController
+
+
+def later(seconds: float = 10.0) -> float:
+    return asyncio.get_running_loop().time() + seconds
+
+
+async def settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_admits_up_to_the_limit_then_queues():
+    controller = AdmissionController(limit=2, queue_size=4, max_wait=1.0)
+
+    assert await controller.acquire(WRITE, later())
+    assert await controller.acquire(WRITE, later())
+    waiter = asyncio.create_task(controller.acquire(WRITE, later()))
+    await settle()
+
+    assert not waiter.done()
+    assert controller.stats()["queued"] == 1
+
+    controller.release(0.01)
+    assert await waiter
+    assert controller.stats()["in_flight"] == 2
+    assert controller.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_before_earlier_writes():
+    controller = AdmissionController(limit=1, queue_size=4, max_wait=1.0)
+    await controller.acquire(WRITE, later())
+    order = []
+
+    async def request(name: str, priority: int) -> None:
+        if await controller.acquire(priority, later()):
+            order.append(name)
+            controller.release(0.0)
+
+    tasks = [
+        asyncio.create_task(request("write", WRITE)),
+        asyncio.create_task(request("read", READ)),
+    ]
+    await settle()
+    controller.release(0.0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["read", "write"]
+    assert controller.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_writes_and_lets_reads_displace_them():
+    controller = AdmissionController(limit=1, queue_size=1, max_wait=1.0)
+    await controller.acquire(WRITE, later())
+    queued_write = asyncio.create_task(controller.acquire(WRITE, later()))
+    await settle()
+
+    assert not await controller.acquire(WRITE, later())
+    read = asyncio.create_task(controller.acquire(READ, later()))
+    await settle()
+
+    assert await queued_write is False
+    controller.release(0.0)
+    assert await read
+    stats = controller.stats()
+    assert (stats["rejected"], stats["displaced"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_waiters_past_their_deadline_are_shed():
+    controller = AdmissionController(limit=1, queue_size=4, max_wait=1.0)
+    await controller.acquire(WRITE, later())
+
+    assert not await controller.acquire(READ, later(0.01))
+    assert not await controller.acquire(READ, later(-1))
+    assert controller.stats()["shed"] == 2
+    assert controller.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_leave_the_queue():
+    controller = AdmissionController(limit=1, queue_size=4, max_wait=1.0)
+    await controller.acquire(WRITE, later())
+    waiter = asyncio.create_task(controller.acquire(WRITE, later()))
+    await settle()
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    controller.release(0.0)
+
+    assert controller.stats()["queued"] == 0
+    assert controller.stats()["in_flight"] == 0
+
+
+def test_retry_after_follows_the_backlog():
+    controller = AdmissionController(limit=2, queue_size=10, max_wait=1.0)
+
+    assert controller.retry_after() == 1
+    controller.service_time = 0.5
+    controller.queued = 9
+    assert controller.retry_after() == 3
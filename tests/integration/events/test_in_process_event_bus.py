@@ -0,0 +1,178 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.events.in_process_event_bus import InProcessEventBus
+from be_task_ca.domain.events import ItemAddedToCart, ItemCreated, UserRegistered
+
+
+def item_created(name: str = "Lamp") -> ItemCreated:
+    return ItemCreated(item_id=uuid4(), name=name, price=1.0, quantity=1)
+
+
+def collector(received: list):
+    async def handle(event):
+        received.append(event)
+
+    return handle
+
+
+@pytest.mark.asyncio
+async def test_events_reach_only_subscribers_of_their_type_in_order():
+    bus = InProcessEventBus()
+    items, everything = [], []
+    bus.subscribe((ItemCreated,), collector(items))
+    bus.subscribe((ItemCreated, UserRegistered), collector(everything))
+
+    published = [item_created(name) for name in "abc"]
+    for event in published:
+        await bus.publish(event)
+    await bus.publish(UserRegistered(user_id=uuid4(), email="a@example.com"))
+    await bus.publish(ItemAddedToCart(user_id=uuid4(), item_id=uuid4(), quantity=1))
+    await bus.drain()
+
+    assert items == published
+    assert len(everything) == 4
+    assert bus.stats()["handled"] == 7
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_a_slow_handler_does_not_hold_up_the_others():
+    bus = InProcessEventBus(outbox_capacity=100)
+    release = asyncio.Event()
+    received = []
+
+    async def slow(event):
+        await release.wait()
+
+    stuck = bus.subscribe((ItemCreated,), slow)
+    bus.subscribe((ItemCreated,), collector(received))
+    for _ in range(10):
+        await bus.publish(item_created())
+    await asyncio.sleep(0.01)
+
+    assert len(received) == 10
+    assert stuck.handled == 0
+    assert bus.backlog == 10
+
+    release.set()
+    await bus.drain()
+    assert bus.backlog == 0
+    assert stuck.handled == 10
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_a_full_outbox_makes_publishers_wait_instead_of_dropping():
+    bus = InProcessEventBus(outbox_capacity=2)
+    release = asyncio.Event()
+    received = []
+
+    async def slow(event):
+        await release.wait()
+        received.append(event)
+
+    bus.subscribe((ItemCreated,), slow)
+    published = [item_created(name) for name in "abcd"]
+    publishing = asyncio.create_task(
+        asyncio.wait_for(
+            asyncio.gather(*(bus.publish(event) for event in published)), 1.0
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    assert not publishing.done()
+    assert bus.backlog == 2
+    assert bus.stats()["blocked"] == 2
+
+    release.set()
+    await publishing
+    await bus.drain()
+    assert received == published
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_a_failing_handler_is_counted_and_does_not_stop_the_others():
+    bus = InProcessEventBus()
+    received = []
+
+    async def broken(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe((ItemCreated,), broken)
+    bus.subscribe((ItemCreated,), collector(received))
+    await bus.publish(item_created())
+    await bus.publish(item_created())
+    await bus.drain()
+
+    assert bus.stats()["failed"] == 2
+    assert len(received) == 2
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_events_are_journaled_as_json_lines(tmp_path):
+    journal = tmp_path / "events.jsonl"
+    bus = InProcessEventBus(journal_path=str(journal))
+    event = item_created("Desk")
+    await bus.publish(event)
+    await bus.drain()
+    await bus.close()
+
+    record, ack = map(json.loads, journal.read_text().splitlines())
+    assert record["seq"] == 0
+    assert ack == {"acked": 1}
+    assert record["type"] == "ItemCreated"
+    assert record["event_id"] == str(event.event_id)
+    assert record["name"] == "Desk"
+
+
+@pytest.mark.asyncio
+async def test_close_delivers_pending_events():
+    bus = InProcessEventBus()
+    received = []
+    bus.subscribe((ItemCreated,), collector(received))
+    for _ in range(5):
+        await bus.publish(item_created())
+    await bus.close()
+
+    assert len(received) == 5
+    assert bus.backlog == 0
+
+
+@pytest.mark.asyncio
+async def test_undelivered_journal_entries_are_replayed_on_start(tmp_path):
+    journal = str(tmp_path / "events.jsonl")
+    bus = InProcessEventBus(journal_path=journal)
+    release = asyncio.Event()
+
+    async def stuck(event):
+        await release.wait()
+
+    bus.subscribe((ItemCreated,), stuck)
+    published = [item_created(name) for name in "ab"]
+    for event in published:
+        await bus.publish(event)
+    await bus.close(timeout=0.05)
+
+    received = []
+    restarted = InProcessEventBus(journal_path=journal)
+    restarted.subscribe((ItemCreated,), collector(received))
+    restarted.start()
+    await restarted.drain()
+    await restarted.publish(item_created("c"))
+    await restarted.drain()
+    await restarted.close()
+
+    assert received[:2] == published
+    assert received[2].name == "c"
+    assert restarted.stats()["replayed"] == 2
+
+    again = InProcessEventBus(journal_path=journal)
+    again.start()
+    await again.close()
+    assert again.stats()["replayed"] == 0
@@ -0,0 +1,36 @@
+from be_task_ca.adapters.idempotency.cache import IdempotencyCache
+
+
+def store(cache: IdempotencyCache, key: str, now: float) -> None:
+    cache.put(key, "fingerprint", 201, [], b"{}", now)
+
+
+def test_entries_expire_after_the_ttl():
+    cache = IdempotencyCache(ttl=10.0)
+    store(cache, "a", 0.0)
+    store(cache, "b", 5.0)
+
+    assert cache.get("a", 9.9).status == 201
+    assert cache.get("a", 10.0) is None
+    assert cache.get("b", 10.0) is not None
+    assert len(cache) == 1
+
+
+def test_oldest_entries_are_evicted_beyond_max_entries():
+    cache = IdempotencyCache(max_entries=2)
+    for key in "abc":
+        store(cache, key, 0.0)
+
+    assert cache.get("a", 0.0) is None
+    assert cache.get("c", 0.0) is not None
+    assert cache.stats()["entries"] == 2
+
+
+def test_storing_a_key_again_moves_it_to_the_back():
+    cache = IdempotencyCache(ttl=10.0)
+    store(cache, "a", 0.0)
+    store(cache, "b", 1.0)
+    store(cache, "a", 2.0)
+
+    assert cache.get("b", 11.0) is None
+    assert cache.get("a", 11.0) is not None
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import os
+import socket
+
+import pytest
+
+from be_task_ca.adapters.invalidation.broadcaster import (
+    MAX_DATAGRAM,
+    InvalidationBroadcaster,
+    encode,
+)
+
+
+async def received(keys: list, count: int) -> None:
+    for _ in range(200):
+        if len(keys) >= count:
+            return
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_keys_reach_every_other_worker(tmp_path):
+    workers = [InvalidationBroadcaster(str(tmp_path), name=name) for name in "abc"]
+    seen = {name: [] for name in "abc"}
+    for name, worker in zip("abc", workers):
+        worker.subscribe(seen[name].extend)
+        worker.start()
+
+    workers[0].publish(["item:1"])
+    await received(seen["c"], 1)
+    await received(seen["b"], 1)
+
+    assert seen == {"a": [], "b": ["item:1"], "c": ["item:1"]}
+    for worker in workers:
+        worker.close()
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_writes_within_the_window_are_coalesced(tmp_path):
+    sender = InvalidationBroadcaster(str(tmp_path), window=0.01, name="a")
+    receiver = InvalidationBroadcaster(str(tmp_path), name="b")
+    keys = []
+    receiver.subscribe(keys.extend)
+    sender.start()
+    receiver.start()
+
+    for _ in range(100):
+        sender.publish(["item:1", "item-name:lamp"])
+    sender.publish(["user:2"])
+    await received(keys, 3)
+
+    assert sorted(keys) == ["item-name:lamp", "item:1", "user:2"]
+    assert sender.stats()["sent"] == 1
+    assert receiver.stats()["received"] == 1
+    sender.close()
+    receiver.close()
+
+
+@pytest.mark.asyncio
+async def test_sockets_of_dead_workers_are_removed(tmp_path):
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    dead.bind(str(tmp_path / "999.sock"))
+    dead.close()
+    sender = InvalidationBroadcaster(str(tmp_path), name="a")
+    sender.start()
+
+    sender.publish(["item:1"])
+    sender.flush()
+
+    assert sender.stats()["peers_removed"] == 1
+    assert os.listdir(tmp_path) == ["a.sock"]
+    sender.close()
+
+
+@pytest.mark.asyncio
+async def test_close_sends_what_is_still_pending(tmp_path):
+    sender = InvalidationBroadcaster(str(tmp_path), window=10.0, name="a")
+    receiver = InvalidationBroadcaster(str(tmp_path), name="b")
+    keys = []
+    receiver.subscribe(keys.extend)
+    sender.start()
+    receiver.start()
+
+    sender.publish(["item:1"])
+    sender.close()
+    await received(keys, 1)
+
+    assert keys == ["item:1"]
+    receiver.close()
+
+
+def test_large_batches_are_split_into_datagrams():
+    keys = [f"item:{index:036d}" for index in range(2000)]
+
+    datagrams = encode(keys)
+
+    assert len(datagrams) > 1
+    assert all(len(datagram) <= MAX_DATAGRAM for datagram in datagrams)
+    assert [key for datagram in datagrams for key in json.loads(datagram)] == keys
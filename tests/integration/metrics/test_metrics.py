@@ -0,0 +1,137 @@
+import pytest
+
+from be_task_ca.adapters.metrics.instrumented import (
+    InstrumentedRepository,
+    InstrumentedUseCase,
+    hit_ratio_collector,
+    stats_collector,
+)
+from be_task_ca.adapters.metrics.registry import MetricsRegistry
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.domain.entities.item import Item
+
+
+def test_render_counter_gauge_and_histogram():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ("queue",))
+    gauge = registry.gauge("workers", "Workers")
+    histogram = registry.histogram("job_seconds", "Job time", ("queue",), (0.1, 1.0))
+
+    counter.inc(("default",))
+    counter.inc(("default",), 2)
+    gauge.set((), 3)
+    gauge.dec()
+    histogram.observe(("default",), 0.05)
+    histogram.observe(("default",), 0.5)
+    histogram.observe(("default",), 5)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE jobs_total counter" in lines
+    assert 'jobs_total{queue="default"} 3' in lines
+    assert "workers 2" in lines
+    assert 'job_seconds_bucket{queue="default",le="0.1"} 1' in lines
+    assert 'job_seconds_bucket{queue="default",le="1"} 2' in lines
+    assert 'job_seconds_bucket{queue="default",le="+Inf"} 3' in lines
+    assert 'job_seconds_sum{queue="default"} 5.55' in lines
+    assert 'job_seconds_count{queue="default"} 3' in lines
+
+
+def test_render_escapes_label_values():
+    registry = MetricsRegistry()
+    registry.counter("paths_total", "Paths", ("path",)).inc(('a"b\\c',))
+
+    assert 'paths_total{path="a\\"b\\\\c"} 1' in registry.render()
+
+
+def test_registering_a_name_twice_returns_the_same_metric():
+    registry = MetricsRegistry()
+
+    first = registry.histogram("latency_seconds", "Latency")
+    second = registry.histogram("latency_seconds", "Latency")
+
+    assert first is second
+    assert len(registry.metrics) == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_repository_times_calls_and_passes_attributes_through():
+    registry = MetricsRegistry()
+    durations = registry.histogram("calls_seconds", "Calls", ("repository", "method"))
+    errors = registry.counter("errors_total", "Errors", ("repository", "method"))
+    inner = InMemoryItemRepository()
+    repository = InstrumentedRepository(inner, "item", durations, errors)
+    item = Item(name="Lamp", description="", price=1.0, quantity=1)
+
+    await repository.save(item)
+    await repository.find_by_id(item.id)
+    await repository.find_by_id(item.id)
+
+    assert repository.items is inner.items
+    assert durations.series[("item", "save")].counts[-1] == 0
+    assert sum(durations.series[("item", "find_by_id")].counts) == 2
+    assert errors.values == {}
+
+
+@pytest.mark.asyncio
+async def test_instrumented_repository_counts_errors():
+    class Failing:
+        async def find_by_id(self, item_id):
+            raise RuntimeError("down")
+
+    registry = MetricsRegistry()
+    durations = registry.histogram("calls_seconds", "Calls", ("repository", "method"))
+    errors = registry.counter("errors_total", "Errors", ("repository", "method"))
+    repository = InstrumentedRepository(Failing(), "item", durations, errors)
+
+    with pytest.raises(RuntimeError):
+        await repository.find_by_id(1)
+
+    assert errors.values == {("item", "find_by_id"): 1}
+    assert sum(durations.series[("item", "find_by_id")].counts) == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_use_case_records_outcome():
+    calls = []
+
+    async def use_case(value):
+        calls.append(value)
+        if value < 0:
+            raise ValueError(value)
+        return value
+
+    registry = MetricsRegistry()
+    durations = registry.histogram("use_case_seconds", "Use cases", ("name", "outcome"))
+    instrumented = InstrumentedUseCase(use_case, "double", durations)
+
+    assert await instrumented(2) == 2
+    with pytest.raises(ValueError):
+        await instrumented(-1)
+
+    assert sum(durations.series[("double", "ok")].counts) == 1
+    assert sum(durations.series[("double", "error")].counts) == 1
+
+
+def test_stats_and_hit_ratio_collectors():
+    class Source:
+        def stats(self):
+            return {"calls": 10, "coalesced": 4, "in_flight": 1}
+
+    registry = MetricsRegistry()
+    registry.add_collector(
+        stats_collector(
+            "single_flight", "repository", {"user": Source()}, ("in_flight",)
+        )
+    )
+    registry.add_collector(hit_ratio_collector({"users": lambda: (3, 1)}))
+
+    lines = registry.render().splitlines()
+
+    assert 'single_flight_calls_total{repository="user"} 10' in lines
+    assert "# TYPE single_flight_in_flight gauge" in lines
+    assert 'single_flight_in_flight{repository="user"} 1' in lines
+    assert 'cache_requests_total{cache="users",result="hit"} 3' in lines
+    assert 'cache_hit_ratio{cache="users"} 0.75' in lines
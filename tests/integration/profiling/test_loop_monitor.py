@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from be_task_ca.adapters.profiling.loop_monitor import LoopMonitor, Stall
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_stall_overlap_is_clipped_to_the_window():
+    stall = Stall(started=1.0, stack=(), ended=3.0)
+
+    assert stall.overlap(0.0, 2.0) == 1.0
+    assert stall.overlap(2.5, 5.0) == 0.5
+    assert stall.overlap(3.5, 5.0) == 0.0
+    assert Stall(started=1.0, stack=()).overlap(0.0, 4.0) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_lag_and_the_blocking_stack():
+    monitor = LoopMonitor(interval=0.01, block_threshold=0.03)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        block_the_loop(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    [stall] = monitor.stalls
+    assert monitor.stall_count == 1
+    assert stall.ended is not None
+    assert stall.stack[-1].endswith(":block_the_loop")
+    assert monitor.stalls_between(started, time.perf_counter()) == [stall]
+    assert monitor.percentile(1.0) >= 0.15
+    assert monitor.percentile(0.5) < 0.15
+
+
+@pytest.mark.asyncio
+async def test_monitor_can_be_started_again_after_a_stop():
+    monitor = LoopMonitor(interval=0.01, block_threshold=0.03)
+    for _ in range(2):
+        await monitor.start()
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+    assert len(monitor.lags) >= 2
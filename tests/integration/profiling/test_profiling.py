@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from be_task_ca.adapters.profiling.request_profiler import RequestProfiler
+from be_task_ca.adapters.profiling.sampler import StackSampler
+from be_task_ca.adapters.profiling.stacks import collapse
+
+
+def spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_collapse_writes_root_first_stacks_by_count():
+    stacks = Counter({("main", "handler"): 3, ("main",): 5, ("idle",): 0})
+
+    assert collapse(stacks) == "main 5\nmain;handler 3\n"
+
+
+def test_sampler_sees_the_busy_function_of_the_sampled_thread():
+    sampler = StackSampler(threading.get_ident(), interval=0.001)
+    sampler.start()
+    spin(0.2)
+    samples = sampler.stop()
+
+    spinning = sum(n for stack, n in samples.items() if stack[-1].endswith(":spin"))
+    assert spinning > sum(samples.values()) / 2
+
+
+def test_sampler_over_all_threads_prefixes_the_thread_name():
+    stop = threading.Event()
+    worker = threading.Thread(target=stop.wait, name="waiting-worker")
+    worker.start()
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    spin(0.05)
+    samples = sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert "waiting-worker" in {stack[0] for stack in samples}
+
+
+@pytest.mark.asyncio
+async def test_request_profiler_charges_only_its_own_task():
+    async def profiled():
+        await asyncio.sleep(0)
+        spin(0.02)
+
+    async def other():
+        await asyncio.sleep(0)
+        spin(0.02)
+
+    task = asyncio.ensure_future(profiled())
+    profiler = RequestProfiler(task)
+    profiler.start()
+    try:
+        await asyncio.gather(task, other())
+    finally:
+        stacks = profiler.stop()
+
+    functions = {label for stack in stacks for label in stack}
+    assert any(label.endswith(".profiled") for label in functions)
+    assert not any(label.endswith(".other") for label in functions)
+    assert any(
+        stack[-1].endswith(":spin") and any(".profiled" in label for label in stack)
+        for stack in stacks
+    )
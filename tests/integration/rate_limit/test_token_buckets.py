@@ -0,0 +1,85 @@
+import multiprocessing
+
+import pytest
+
+from be_task_ca.adapters.rate_limit.buckets import (
+    InMemoryTokenBuckets,
+    SharedTokenBuckets,
+)
+
+
+@pytest.fixture(params=["memory", "shared"])
+def buckets(request):
+    if request.param == "memory":
+        return InMemoryTokenBuckets()
+    return SharedTokenBuckets(slots=64)
+
+
+def test_burst_is_spent_then_refilled_at_the_rate(buckets):
+    assert [buckets.take("a", 2, 3, 0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert buckets.take("a", 2, 3, 0.0) == pytest.approx(0.5)
+    assert buckets.take("a", 2, 3, 0.5) == 0.0
+    assert buckets.take("b", 2, 3, 0.5) == 0.0
+
+
+def test_refill_is_capped_at_the_burst(buckets):
+    buckets.take("a", 1, 2, 0.0)
+    for _ in range(2):
+        assert buckets.take("a", 1, 2, 100.0) == 0.0
+    assert buckets.take("a", 1, 2, 100.0) > 0
+
+
+def test_idle_buckets_expire_once_full_again():
+    buckets = InMemoryTokenBuckets()
+    buckets.take("a", 1, 2, 0.0)
+    buckets.take("b", 1, 2, 0.5)
+
+    buckets.take("c", 1, 2, 1.2)
+    assert len(buckets) == 2
+    buckets.take("c", 1, 2, 10.0)
+    assert len(buckets) == 1
+
+
+def test_table_size_is_bounded():
+    buckets = InMemoryTokenBuckets(max_keys=2)
+    for key in "abc":
+        buckets.take(key, 1, 1, 0.0)
+
+    assert len(buckets) == 2
+    assert buckets.take("a", 1, 1, 1.0) == 0.0
+
+
+def test_an_evicted_key_gets_no_fresh_burst_and_new_keys_are_unaffected():
+    buckets = InMemoryTokenBuckets(max_keys=2)
+    for _ in range(3):
+        buckets.take("a", 1, 3, 0.0)
+    for key in "bc":
+        buckets.take(key, 1, 3, 0.0)
+
+    assert buckets.take("a", 1, 3, 0.0) == pytest.approx(1.0)
+    assert buckets.take("d", 1, 3, 0.0) == 0.0
+    assert buckets.take("b", 1, 3, 0.0) == 0.0
+
+
+def spend(buckets: SharedTokenBuckets) -> None:
+    buckets.take("a", 1, 2, 0.0)
+    buckets.take("a", 1, 2, 0.0)
+
+
+def test_shared_buckets_are_seen_by_forked_processes():
+    buckets = SharedTokenBuckets(slots=64)
+    process = multiprocessing.get_context("fork").Process(target=spend, args=(buckets,))
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert buckets.take("a", 1, 2, 0.0) == pytest.approx(1.0)
+
+
+def test_shared_table_reuses_the_oldest_slot_when_probes_are_full():
+    buckets = SharedTokenBuckets(slots=1, probes=1)
+    buckets.take("a", 1, 1, 0.0)
+
+    assert buckets.take("b", 1, 1, 0.5) == 0.0
+    assert buckets.take("a", 1, 1, 0.5) == pytest.approx(0.5)
+    assert buckets.take("b", 1, 1, 3.0) == 0.0
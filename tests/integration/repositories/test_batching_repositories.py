@@ -0,0 +1,187 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.batching import (
+    BatchingItemRepository,
+    BatchingUserRepository,
+    BatchLoader,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import InMemoryUserRepository
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+
+
+class RecordingItemRepository(InMemoryItemRepository):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def find_by_ids(self, item_ids):
+        self.batches.append(list(item_ids))
+        return await super().find_by_ids(item_ids)
+
+
+@pytest.fixture
+def backend():
+    return RecordingItemRepository()
+
+
+@pytest.fixture
+def item_repository(backend):
+    return BatchingItemRepository(backend)
+
+
+async def save_items(item_repository, count):
+    return [
+        await item_repository.save(
+            Item(name=f"Item {i}", description="", price=1.0, quantity=1)
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_find_by_id_is_one_backend_call(item_repository, backend):
+    items = await save_items(item_repository, 20)
+
+    found = await asyncio.gather(*(item_repository.find_by_id(item.id) for item in items))
+
+    assert found == items
+    assert len(backend.batches) == 1
+    assert backend.batches[0] == [item.id for item in items]
+    assert item_repository.loader.stats() == {"loads": 20, "batches": 1}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_keys_are_fetched_once(item_repository, backend):
+    [item] = await save_items(item_repository, 1)
+
+    found = await asyncio.gather(*(item_repository.find_by_id(item.id) for _ in range(5)))
+
+    assert found == [item] * 5
+    assert backend.batches == [[item.id]]
+
+
+@pytest.mark.asyncio
+async def test_missing_keys_resolve_to_none(item_repository, backend):
+    [item] = await save_items(item_repository, 1)
+
+    found, missing = await asyncio.gather(
+        item_repository.find_by_id(item.id), item_repository.find_by_id(uuid4())
+    )
+
+    assert found is item
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_sequential_loads_are_separate_batches(item_repository, backend):
+    items = await save_items(item_repository, 2)
+
+    await item_repository.find_by_id(items[0].id)
+    await item_repository.find_by_id(items[1].id)
+
+    assert len(backend.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches(backend):
+    item_repository = BatchingItemRepository(backend, max_batch_size=4)
+    items = await save_items(item_repository, 10)
+
+    found = await asyncio.gather(*(item_repository.find_by_id(item.id) for item in items))
+
+    assert found == items
+    assert [len(batch) for batch in backend.batches] == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_window_collects_loads_across_ticks(backend):
+    item_repository = BatchingItemRepository(backend, window_us=20_000)
+    items = await save_items(item_repository, 2)
+
+    async def load_later(item):
+        await asyncio.sleep(0.005)
+        return await item_repository.find_by_id(item.id)
+
+    found = await asyncio.gather(item_repository.find_by_id(items[0].id), load_later(items[1]))
+
+    assert found == items
+    assert len(backend.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    async def failing(keys):
+        raise RuntimeError("backend down")
+
+    loader = BatchLoader(failing, key_of=lambda value: value)
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_every_caller():
+    started = asyncio.Event()
+
+    async def stuck(keys):
+        started.set()
+        await asyncio.Event().wait()
+
+    loader = BatchLoader(stuck, key_of=lambda value: value)
+    loads = asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    await started.wait()
+    for task in asyncio.all_tasks():
+        if task.get_coro().__qualname__ == "BatchLoader._run":
+            task.cancel()
+
+    results = await asyncio.wait_for(loads, timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_base_exceptions_reach_every_caller():
+    class Fatal(BaseException):
+        pass
+
+    async def fatal(keys):
+        raise Fatal()
+
+    loader = BatchLoader(fatal, key_of=lambda value: value)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, Fatal) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_user_repository_batches_find_by_id():
+    user_repository = BatchingUserRepository(InMemoryUserRepository())
+    users = [
+        await user_repository.save(
+            User(
+                email=f"user{i}@example.com",
+                first_name="User",
+                last_name=str(i),
+                hashed_password="hashed",
+                shipping_address="",
+            )
+        )
+        for i in range(3)
+    ]
+
+    found = await asyncio.gather(*(user_repository.find_by_id(user.id) for user in users))
+
+    assert found == users
+    assert user_repository.loader.batches == 1
@@ -0,0 +1,149 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.caching import (
+    CachingItemRepository,
+    CachingUserRepository,
+    EntityCache,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import InMemoryUserRepository
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+
+
+class CountingItemRepository(InMemoryItemRepository):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def find_by_id(self, item_id):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return await super().find_by_id(item_id)
+
+    async def find_by_ids(self, item_ids):
+        self.reads += 1
+        return await super().find_by_ids(item_ids)
+
+
+def lamp(quantity=5):
+    return Item(name="Lamp", description="", price=10.0, quantity=quantity)
+
+
+def test_entity_cache_expires_and_evicts_least_recently_used():
+    cache = EntityCache(max_entries=2, ttl=10.0)
+    cache.put("a", 1, cache.epoch, 0.0)
+    cache.put("b", 2, cache.epoch, 0.0)
+    assert cache.get("a", 1.0) == 1
+    cache.put("c", 3, cache.epoch, 0.0)
+
+    assert cache.get("b", 1.0) is None
+    assert cache.get("a", 10.0) is None
+    assert cache.get("c", 9.0) == 3
+    assert cache.stats()["hits"] == 2
+
+
+def test_fills_that_started_before_an_invalidation_are_dropped():
+    cache = EntityCache()
+    epoch = cache.epoch
+    cache.invalidate(["a"])
+    cache.put("a", "stale", epoch, 0.0)
+
+    assert cache.get("a", 0.0) is None
+    assert cache.stats()["stale_fills"] == 1
+
+
+@pytest.mark.asyncio
+async def test_item_reads_are_served_from_the_cache_until_a_write():
+    backend = CountingItemRepository()
+    published = []
+    repository = CachingItemRepository(backend, EntityCache(), published.extend)
+    item = await repository.save(lamp())
+
+    await repository.find_by_id(item.id)
+    await repository.find_by_id(item.id)
+    assert backend.reads == 1
+
+    await repository.reserve_stock(item.id, 2)
+    found = await repository.find_by_id(item.id)
+
+    assert found.quantity == 3
+    assert backend.reads == 2
+    assert published == [f"item:{item.id}", "item-name:lamp", f"item:{item.id}"]
+
+
+@pytest.mark.asyncio
+async def test_find_by_name_resolves_through_the_id_entry():
+    backend = CountingItemRepository()
+    repository = CachingItemRepository(backend, EntityCache())
+    item = await repository.save(lamp())
+
+    assert await repository.find_by_name("LAMP") is item
+    assert await repository.find_by_name("lamp") is item
+    assert await repository.find_by_name("desk") is None
+    assert backend.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_loads_only_the_missing_entities():
+    backend = CountingItemRepository()
+    repository = CachingItemRepository(backend, EntityCache())
+    first, second = await repository.save_many([lamp(), lamp()])
+    await repository.find_by_id(first.id)
+
+    found = await repository.find_by_ids([second.id, first.id, uuid4(), second.id])
+
+    assert found == [second, first]
+    assert backend.reads == 2
+    assert await repository.find_by_ids([first.id, second.id]) == [first, second]
+    assert backend.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_an_invalidation_from_another_worker_drops_the_entry():
+    backend = CountingItemRepository()
+    cache = EntityCache()
+    repository = CachingItemRepository(backend, cache)
+    item = await repository.save(lamp())
+    await repository.find_by_id(item.id)
+
+    cache.invalidate([f"item:{item.id}"])
+    await repository.find_by_id(item.id)
+
+    assert backend.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_users_are_not_cached():
+    repository = CachingUserRepository(InMemoryUserRepository(), EntityCache())
+
+    assert await repository.find_by_email("ann@example.com") is None
+    user = await repository.save(
+        User(
+            email="Ann@example.com",
+            first_name="Ann",
+            last_name="Lee",
+            hashed_password="x",
+            shipping_address="1 Main St",
+        )
+    )
+
+    assert await repository.find_by_email("ann@example.com") is user
+    assert await repository.find_by_id(user.id) is user
+    assert repository.cache.stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_a_price_update_drops_the_cached_item():
+    backend = CountingItemRepository()
+    repository = CachingItemRepository(backend, EntityCache())
+    item = await repository.save(lamp())
+    await repository.find_by_id(item.id)
+
+    await repository.update_price(item.id, 12.0)
+
+    assert (await repository.find_by_id(item.id)).price == 12.0
+    assert backend.reads == 2
@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import InMemoryCartSummaryRepository
+from be_task_ca.domain.entities.cart_summary import CartSummary
+
+
+@pytest.fixture
+def summaries():
+    return InMemoryCartSummaryRepository()
+
+
+@pytest.mark.asyncio
+async def test_lines_accumulate_into_the_summary(summaries):
+    user_id, lamp, desk = uuid4(), uuid4(), uuid4()
+
+    await summaries.add_line(user_id, lamp, 2, 1000)
+    summary = await summaries.add_line(user_id, desk, 1, 250)
+
+    assert summary == CartSummary(user_id=user_id, line_count=2, item_count=3, total_cents=2250)
+    assert await summaries.find_by_user_id(user_id) == summary
+    assert await summaries.find_by_user_id(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_a_price_change_updates_every_cart_holding_the_item(summaries):
+    first, second, lamp, desk = uuid4(), uuid4(), uuid4(), uuid4()
+    await summaries.add_line(first, lamp, 2, 1000)
+    await summaries.add_line(second, lamp, 1, 1000)
+    await summaries.add_line(second, desk, 1, 500)
+
+    assert await summaries.reprice(lamp, 1200) == 2
+
+    assert (await summaries.find_by_user_id(first)).total_cents == 2400
+    assert (await summaries.find_by_user_id(second)).total_cents == 1700
+    assert await summaries.reprice(lamp, 1200) == 0
+
+
+@pytest.mark.asyncio
+async def test_a_line_read_before_a_price_change_gets_the_new_price(summaries):
+    user_id, lamp = uuid4(), uuid4()
+    await summaries.add_line(uuid4(), lamp, 1, 1000)
+    await summaries.reprice(lamp, 800)
+
+    summary = await summaries.add_line(user_id, lamp, 1, 1000)
+
+    assert summary.total_cents == 800
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replaces_the_lines_of_one_cart_only(summaries):
+    user_id, other, lamp, desk = uuid4(), uuid4(), uuid4(), uuid4()
+    await summaries.add_line(user_id, lamp, 5, 1000)
+    await summaries.add_line(other, lamp, 1, 1000)
+
+    summary = await summaries.rebuild(user_id, [(desk, 2, 300), (lamp, 1, 900)])
+
+    assert summary == CartSummary(user_id=user_id, line_count=2, item_count=3, total_cents=1600)
+    assert (await summaries.find_by_user_id(other)).total_cents == 1000
+    await summaries.reprice(lamp, 900)
+    assert (await summaries.find_by_user_id(user_id)).total_cents == 1500
+    assert (await summaries.find_by_user_id(other)).total_cents == 900
+    assert sorted(await summaries.list_user_ids()) == sorted([user_id, other])
@@ -0,0 +1,180 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import InMemoryCartItemRepository
+from be_task_ca.adapters.repositories.coalescing import (
+    CoalescingCartItemRepository,
+    CoalescingItemRepository,
+    CoalescingUserRepository,
+    SingleFlight,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import InMemoryUserRepository
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+
+
+class SlowItemRepository(InMemoryItemRepository):
+    def __init__(self):
+        super().__init__()
+        self.backend_calls = 0
+
+    async def find_by_id(self, item_id):
+        self.backend_calls += 1
+        await asyncio.sleep(0.01)
+        return await super().find_by_id(item_id)
+
+    async def list_all(self):
+        self.backend_calls += 1
+        await asyncio.sleep(0.01)
+        return await super().list_all()
+
+
+@pytest.fixture
+def backend():
+    return SlowItemRepository()
+
+
+@pytest.fixture
+def item_repository(backend):
+    return CoalescingItemRepository(backend)
+
+
+@pytest.fixture
+def sample_item():
+    return Item(name="Laptop", description="High-performance laptop", price=999.99, quantity=10)
+
+
+@pytest.mark.asyncio
+async def test_thundering_herd_hits_backend_once(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    results = await asyncio.gather(
+        *(item_repository.find_by_id(sample_item.id) for _ in range(100))
+    )
+
+    assert all(result is sample_item for result in results)
+    assert backend.backend_calls == 1
+    assert item_repository.single_flight.stats() == {
+        "calls": 100,
+        "executed": 1,
+        "coalesced": 99,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    await asyncio.gather(
+        item_repository.find_by_id(sample_item.id),
+        item_repository.find_by_id(uuid4()),
+    )
+
+    assert backend.backend_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_reads_are_not_coalesced(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    await item_repository.find_by_id(sample_item.id)
+    await item_repository.find_by_id(sample_item.id)
+
+    assert backend.backend_calls == 2
+    assert item_repository.single_flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_list_all_gives_each_caller_its_own_list(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    first, second = await asyncio.gather(
+        item_repository.list_all(), item_repository.list_all()
+    )
+    first.clear()
+
+    assert second == [sample_item]
+    assert backend.backend_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_with_every_waiter():
+    single_flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", failing) for _ in range(5)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_read(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    impatient = asyncio.ensure_future(item_repository.find_by_id(sample_item.id))
+    patient = asyncio.ensure_future(item_repository.find_by_id(sample_item.id))
+    await asyncio.sleep(0)
+    impatient.cancel()
+
+    assert await patient is sample_item
+
+
+@pytest.mark.asyncio
+async def test_writes_pass_through(item_repository, backend, sample_item):
+    await item_repository.save(sample_item)
+
+    reserved = await item_repository.reserve_stock(sample_item.id, 2)
+
+    assert reserved.quantity == 8
+    assert backend.items == [sample_item]
+
+
+@pytest.mark.asyncio
+async def test_user_repository_coalesces_lookups():
+    user_repository = CoalescingUserRepository(InMemoryUserRepository())
+    user = await user_repository.save(
+        User(
+            email="john@example.com",
+            first_name="John",
+            last_name="Doe",
+            hashed_password="hashed",
+            shipping_address="",
+        )
+    )
+
+    by_id, by_email = await asyncio.gather(
+        user_repository.find_by_id(user.id),
+        user_repository.find_by_email("john@example.com"),
+    )
+
+    assert by_id is user
+    assert by_email is user
+
+
+@pytest.mark.asyncio
+async def test_cart_item_repository_coalesces_lookups():
+    cart_item_repository = CoalescingCartItemRepository(InMemoryCartItemRepository())
+    user_id = uuid4()
+    item_id = uuid4()
+    cart_item = await cart_item_repository.save(
+        CartItem(user_id=user_id, item_id=item_id, quantity=1)
+    )
+
+    cart, existing = await asyncio.gather(
+        cart_item_repository.find_cart_items_for_user_id(user_id),
+        cart_item_repository.find_by_user_and_item(user_id, item_id),
+    )
+
+    assert cart == [cart_item]
+    assert existing is cart_item
@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.change_log import ChangeLoggingItemRepository
+from be_task_ca.adapters.repositories.item.in_memory_item_change_log import InMemoryItemChangeLog
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.item_changes import ItemChangeSet
+
+
+@pytest.fixture
+def change_log():
+    return InMemoryItemChangeLog(capacity=3)
+
+
+@pytest.mark.asyncio
+async def test_an_item_changed_twice_is_returned_once_at_its_latest_sequence(change_log):
+    lamp, desk = uuid4(), uuid4()
+    await change_log.record([lamp, desk])
+    await change_log.record([lamp])
+
+    assert await change_log.changes_since(0, 10) == ItemChangeSet(next_since=3, item_ids=[desk, lamp])
+    assert await change_log.changes_since(2, 10) == ItemChangeSet(next_since=3, item_ids=[lamp])
+    assert await change_log.changes_since(3, 10) == ItemChangeSet(next_since=3)
+
+
+@pytest.mark.asyncio
+async def test_changes_are_paged_by_sequence(change_log):
+    lamp, desk, chair = uuid4(), uuid4(), uuid4()
+    await change_log.record([lamp, desk, chair])
+
+    first = await change_log.changes_since(0, 2)
+    second = await change_log.changes_since(first.next_since, 2)
+
+    assert first == ItemChangeSet(next_since=2, item_ids=[lamp, desk], has_more=True)
+    assert second == ItemChangeSet(next_since=3, item_ids=[chair])
+
+
+@pytest.mark.asyncio
+async def test_a_client_behind_the_compacted_sequence_must_resync(change_log):
+    items = [uuid4() for _ in range(4)]
+    await change_log.record(items)
+
+    assert change_log.compacted_through == 1
+    assert await change_log.changes_since(0, 10) == ItemChangeSet(next_since=4, resync=True)
+    assert (await change_log.changes_since(1, 10)).item_ids == items[1:]
+
+
+@pytest.mark.asyncio
+async def test_a_sequence_from_the_future_must_resync(change_log):
+    await change_log.record([uuid4()])
+
+    assert await change_log.changes_since(5, 10) == ItemChangeSet(next_since=1, resync=True)
+
+
+@pytest.mark.asyncio
+async def test_change_logging_repository_records_committed_writes_only():
+    change_log = InMemoryItemChangeLog()
+    repository = ChangeLoggingItemRepository(InMemoryItemRepository(), change_log)
+    lamp = await repository.save(Item(name="Lamp", description="", price=10.0, quantity=1))
+    desk, chair = await repository.save_many(
+        [
+            Item(name="Desk", description="", price=50.0, quantity=1),
+            Item(name="Chair", description="", price=20.0, quantity=1),
+        ]
+    )
+
+    await repository.reserve_stock(lamp.id, 1)
+    await repository.reserve_stock(lamp.id, 1)
+    await repository.update_price(uuid4(), 5.0)
+    await repository.update_price(chair.id, 25.0)
+    await repository.find_by_id(desk.id)
+
+    assert change_log.sequence == 5
+    assert (await change_log.changes_since(3, 10)).item_ids == [lamp.id, chair.id]
+
+
+@pytest.mark.asyncio
+async def test_paging_stops_at_the_limit_and_skips_superseded_entries():
+    change_log = InMemoryItemChangeLog(capacity=1000)
+    items = [uuid4() for _ in range(500)]
+    for _ in range(3):
+        await change_log.record(items)
+
+    pages, since, has_more = [], 0, True
+    while has_more:
+        page = await change_log.changes_since(since, 100)
+        pages.append(page.item_ids)
+        since, has_more = page.next_since, page.has_more
+
+    assert [item_id for page in pages for item_id in page] == items
+    assert len(change_log._log) <= 2 * len(items) + 64
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 from uuid import uuid4
 
@@ -219,3 +222,208 @@ async def test_list_all_with_multiple_saves(item_repository):
 
     assert len(all_items) == 3
     assert all(item in all_items for item in items)
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_returns_requested_items(item_repository, sample_item, another_item):
+    await item_repository.save(sample_item)
+    await item_repository.save(another_item)
+
+    found = await item_repository.find_by_ids([another_item.id, sample_item.id])
+
+    assert found == [another_item, sample_item]
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_skips_unknown_and_duplicate_ids(item_repository, sample_item):
+    await item_repository.save(sample_item)
+
+    found = await item_repository.find_by_ids([sample_item.id, uuid4(), sample_item.id])
+
+    assert found == [sample_item]
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_empty(item_repository):
+    found = await item_repository.find_by_ids([])
+
+    assert found == []
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_decrements_quantity(item_repository, sample_item):
+    await item_repository.save(sample_item)
+
+    reserved = await item_repository.reserve_stock(sample_item.id, 3)
+
+    assert reserved is sample_item
+    assert sample_item.quantity == 7
+    assert sample_item.version == 1
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_insufficient(item_repository, sample_item):
+    await item_repository.save(sample_item)
+
+    reserved = await item_repository.reserve_stock(sample_item.id, 11)
+
+    assert reserved is None
+    assert sample_item.quantity == 10
+    assert sample_item.version == 0
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_unknown_item(item_repository):
+    reserved = await item_repository.reserve_stock(uuid4(), 1)
+
+    assert reserved is None
+
+
+@pytest.mark.asyncio
+async def test_release_stock_restores_quantity(item_repository, sample_item):
+    await item_repository.save(sample_item)
+    await item_repository.reserve_stock(sample_item.id, 4)
+
+    released = await item_repository.release_stock(sample_item.id, 4)
+
+    assert released is sample_item
+    assert sample_item.quantity == 10
+    assert sample_item.version == 2
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_never_oversells_across_threads(item_repository, sample_item):
+    sample_item.quantity = 500
+    await item_repository.save(sample_item)
+    successes = []
+
+    def worker():
+        async def reserve_many():
+            return [
+                await item_repository.reserve_stock(sample_item.id, 1)
+                for _ in range(200)
+            ]
+
+        results = asyncio.run(reserve_many())
+        successes.append(sum(result is not None for result in results))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(successes) == 500
+    assert sample_item.quantity == 0
+
+
+@pytest.mark.asyncio
+async def test_flash_sale_reads_report_total_across_shards(item_repository, sample_item):
+    await item_repository.save(sample_item)
+    await item_repository.start_flash_sale(sample_item.id, shards=4)
+
+    await item_repository.reserve_stock(sample_item.id, 3)
+
+    assert (await item_repository.find_by_id(sample_item.id)).quantity == 7
+    assert (await item_repository.find_by_ids([sample_item.id]))[0].quantity == 7
+    assert (await item_repository.find_by_name("Laptop")).quantity == 7
+    assert (await item_repository.list_all())[0].quantity == 7
+
+
+@pytest.mark.asyncio
+async def test_flash_sale_reserves_entire_stock(item_repository, sample_item):
+    await item_repository.save(sample_item)
+    await item_repository.start_flash_sale(sample_item.id, shards=4)
+
+    results = [await item_repository.reserve_stock(sample_item.id, 1) for _ in range(12)]
+
+    assert sum(result is not None for result in results) == 10
+    assert (await item_repository.find_by_id(sample_item.id)).quantity == 0
+
+
+@pytest.mark.asyncio
+async def test_flash_sale_reserves_more_than_one_shard_holds(item_repository, sample_item):
+    await item_repository.save(sample_item)
+    await item_repository.start_flash_sale(sample_item.id, shards=4)
+
+    reserved = await item_repository.reserve_stock(sample_item.id, 9)
+
+    assert reserved is not None
+    assert reserved.quantity == 1
+    assert await item_repository.reserve_stock(sample_item.id, 2) is None
+
+
+@pytest.mark.asyncio
+async def test_end_flash_sale_merges_shards(item_repository, sample_item):
+    await item_repository.save(sample_item)
+    await item_repository.start_flash_sale(sample_item.id, shards=4)
+    await item_repository.reserve_stock(sample_item.id, 5)
+    await item_repository.release_stock(sample_item.id, 2)
+
+    assert await item_repository.end_flash_sale(sample_item.id)
+
+    assert sample_item.quantity == 7
+    assert await item_repository.find_by_id(sample_item.id) is sample_item
+    assert not await item_repository.end_flash_sale(sample_item.id)
+
+
+@pytest.mark.asyncio
+async def test_merge_cold_flash_sales(item_repository, sample_item, another_item):
+    await item_repository.save(sample_item)
+    await item_repository.save(another_item)
+    await item_repository.start_flash_sale(sample_item.id)
+    await item_repository.start_flash_sale(another_item.id)
+
+    merged = await item_repository.merge_cold_flash_sales(idle_for=0)
+
+    assert set(merged) == {sample_item.id, another_item.id}
+    assert await item_repository.merge_cold_flash_sales(idle_for=0) == []
+
+
+@pytest.mark.asyncio
+async def test_flash_sale_never_oversells_across_threads(item_repository, sample_item):
+    sample_item.quantity = 500
+    await item_repository.save(sample_item)
+    await item_repository.start_flash_sale(sample_item.id, shards=8)
+    successes = []
+
+    def worker():
+        async def reserve_many():
+            return [
+                await item_repository.reserve_stock(sample_item.id, 1)
+                for _ in range(200)
+            ]
+
+        results = asyncio.run(reserve_many())
+        successes.append(sum(result is not None for result in results))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    await item_repository.end_flash_sale(sample_item.id)
+    for thread in threads:
+        thread.join()
+
+    assert sum(successes) == 500
+    assert sample_item.quantity == 0
+
+
+@pytest.mark.asyncio
+async def test_save_many_persists_all_items(item_repository, sample_item, another_item):
+    saved = await item_repository.save_many([sample_item, another_item])
+
+    assert saved == [sample_item, another_item]
+    assert item_repository.items == [sample_item, another_item]
+    assert await item_repository.find_by_id(another_item.id) == another_item
+
+
+@pytest.mark.asyncio
+async def test_update_price_changes_only_the_price(item_repository, sample_item):
+    await item_repository.save(sample_item)
+
+    updated = await item_repository.update_price(sample_item.id, 5.0)
+
+    assert updated.price == 5.0
+    assert updated.quantity == sample_item.quantity
+    assert (await item_repository.find_by_id(sample_item.id)).price == 5.0
+    assert await item_repository.update_price(uuid4(), 5.0) is None
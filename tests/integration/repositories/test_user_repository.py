@@ -167,3 +167,29 @@ async def test_find_by_email_with_multiple_users_different_emails(user_repositor
     assert found_alice.email == "alice@example.com"
     assert found_bob.email == "bob@example.com"
     assert found_alice.id != found_bob.id
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_returns_requested_users(user_repository, sample_user, another_user):
+    await user_repository.save(sample_user)
+    await user_repository.save(another_user)
+
+    found = await user_repository.find_by_ids([another_user.id, uuid4(), sample_user.id])
+
+    assert found == [another_user, sample_user]
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_empty(user_repository):
+    found = await user_repository.find_by_ids([])
+
+    assert found == []
+
+
+@pytest.mark.asyncio
+async def test_save_many_persists_all_users(user_repository, sample_user, another_user):
+    saved = await user_repository.save_many([sample_user, another_user])
+
+    assert saved == [sample_user, another_user]
+    assert user_repository.users == [sample_user, another_user]
+    assert await user_repository.find_by_id(another_user.id) == another_user
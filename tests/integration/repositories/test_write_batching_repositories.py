@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import InMemoryUserRepository
+from be_task_ca.adapters.repositories.write_batching import (
+    BatchedWriteItemRepository,
+    BatchedWriteUserRepository,
+)
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+
+
+class RecordingItemRepository(InMemoryItemRepository):
+    def __init__(self, reject_name=None):
+        super().__init__()
+        self.commits = []
+        self.reject_name = reject_name
+
+    async def save(self, item):
+        if item.name == self.reject_name:
+            raise ValueError(f"{item.name} rejected")
+        self.commits.append([item])
+        return await super().save(item)
+
+    async def save_many(self, items):
+        if any(item.name == self.reject_name for item in items):
+            raise ValueError("transaction rolled back")
+        self.commits.append(list(items))
+        return await super().save_many(items)
+
+
+def make_items(count):
+    return [Item(name=f"Item {i}", description="", price=1.0, quantity=1) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_one_group_commit():
+    backend = RecordingItemRepository()
+    item_repository = BatchedWriteItemRepository(backend, window_ms=5)
+    items = make_items(10)
+
+    saved = await asyncio.gather(*(item_repository.save(item) for item in items))
+
+    assert saved == items
+    assert backend.commits == [items]
+    assert await item_repository.list_all() == items
+    assert item_repository.batcher.stats() == {"writes": 10, "batches": 1, "fallbacks": 0}
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_commits_early():
+    backend = RecordingItemRepository()
+    item_repository = BatchedWriteItemRepository(backend, window_ms=1000, max_batch_size=4)
+    items = make_items(8)
+
+    saved = await asyncio.gather(*(item_repository.save(item) for item in items))
+
+    assert saved == items
+    assert [len(commit) for commit in backend.commits] == [4, 4]
+
+
+@pytest.mark.asyncio
+async def test_failed_group_commit_isolates_the_bad_write():
+    backend = RecordingItemRepository(reject_name="Item 2")
+    item_repository = BatchedWriteItemRepository(backend, window_ms=5, atomic_save_many=True)
+    items = make_items(4)
+
+    results = await asyncio.gather(
+        *(item_repository.save(item) for item in items), return_exceptions=True
+    )
+
+    assert isinstance(results[2], ValueError)
+    assert [results[0], results[1], results[3]] == [items[0], items[1], items[3]]
+    assert item_repository.batcher.fallbacks == 1
+    assert backend.items == [items[0], items[1], items[3]]
+
+
+@pytest.mark.asyncio
+async def test_failed_group_commit_is_not_replayed_unless_atomic():
+    class PartialRepository(RecordingItemRepository):
+        async def save_many(self, items):
+            await super().save_many(items[:2])
+            raise ValueError("connection lost")
+
+    backend = PartialRepository()
+    item_repository = BatchedWriteItemRepository(backend, window_ms=5)
+    items = make_items(4)
+
+    results = await asyncio.gather(
+        *(item_repository.save(item) for item in items), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert item_repository.batcher.fallbacks == 0
+    assert backend.items == items[:2]
+
+
+@pytest.mark.asyncio
+async def test_unique_lookups_see_writes_before_they_commit():
+    backend = RecordingItemRepository()
+    item_repository = BatchedWriteItemRepository(backend, window_ms=60_000)
+    [item] = make_items(1)
+
+    pending = asyncio.ensure_future(item_repository.save(item))
+    await asyncio.sleep(0)
+
+    assert backend.items == []
+    assert await item_repository.find_by_name("ITEM 0") is item
+    assert await item_repository.find_by_name("Item 1") is None
+    await item_repository.batcher.close()
+    assert await pending is item
+    assert await item_repository.find_by_name("item 0") is item
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes():
+    backend = RecordingItemRepository()
+    item_repository = BatchedWriteItemRepository(backend, window_ms=60_000)
+    [item] = make_items(1)
+
+    pending = asyncio.ensure_future(item_repository.save(item))
+    await asyncio.sleep(0)
+    await item_repository.batcher.close()
+
+    assert await pending is item
+    assert backend.commits == [[item]]
+
+
+@pytest.mark.asyncio
+async def test_short_group_commit_fails_unmatched_writes():
+    class ShortRepository(InMemoryItemRepository):
+        async def save_many(self, items):
+            return await super().save_many(items[:1])
+
+    item_repository = BatchedWriteItemRepository(ShortRepository(), window_ms=1)
+    items = make_items(2)
+
+    results = await asyncio.gather(
+        *(item_repository.save(item) for item in items), return_exceptions=True
+    )
+
+    assert results[0] is items[0]
+    assert isinstance(results[1], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_user_saves_are_batched():
+    backend = InMemoryUserRepository()
+    user_repository = BatchedWriteUserRepository(backend, window_ms=5)
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            first_name="User",
+            last_name=str(i),
+            hashed_password="hashed",
+            shipping_address="",
+        )
+        for i in range(3)
+    ]
+
+    saved = await asyncio.gather(*(user_repository.save(user) for user in users))
+
+    assert saved == users
+    assert await user_repository.find_by_id(users[1].id) is users[1]
+    assert await user_repository.find_by_email("USER2@example.com") is users[2]
+    assert user_repository.batcher.batches == 1
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from be_task_ca.adapters.security.pooled_password_hasher import (
+    PBKDF2,
+    SCRYPT,
+    PooledPasswordHasher,
+)
+from be_task_ca.adapters.security.sha256_password_hasher import Sha256PasswordHasher
+from be_task_ca.ports.security.password_hasher import PasswordHasherOverloadedError
+
+
+@pytest.fixture
+def scrypt_hasher():
+    hasher = PooledPasswordHasher(kdf=SCRYPT, cost=(2**10, 8, 1), max_workers=2)
+    yield hasher
+    hasher.close()
+
+
+@pytest.fixture
+def pbkdf2_hasher():
+    hasher = PooledPasswordHasher(kdf=PBKDF2, cost=(1_000,), max_workers=2)
+    yield hasher
+    hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_scrypt_hash_round_trip(scrypt_hasher):
+    hashed = await scrypt_hasher.hash("password123")
+
+    assert hashed.startswith("scrypt$1024$8$1$")
+    assert await scrypt_hasher.verify("password123", hashed)
+    assert not await scrypt_hasher.verify("password124", hashed)
+
+
+@pytest.mark.asyncio
+async def test_pbkdf2_hash_round_trip(pbkdf2_hasher):
+    hashed = await pbkdf2_hasher.hash("password123")
+
+    assert hashed.startswith("pbkdf2_sha256$1000$")
+    assert await pbkdf2_hasher.verify("password123", hashed)
+    assert not await pbkdf2_hasher.verify("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_hashes_are_salted(scrypt_hasher):
+    first = await scrypt_hasher.hash("password123")
+    second = await scrypt_hasher.hash("password123")
+
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_verify_uses_cost_stored_in_hash(scrypt_hasher):
+    cheaper = PooledPasswordHasher(kdf=SCRYPT, cost=(2**8, 8, 1), max_workers=1)
+    hashed = await cheaper.hash("password123")
+    cheaper.close()
+
+    assert await scrypt_hasher.verify("password123", hashed)
+
+
+@pytest.mark.asyncio
+async def test_rejects_work_beyond_max_pending():
+    hasher = PooledPasswordHasher(
+        kdf=SCRYPT, cost=(2**12, 8, 1), max_workers=1, max_pending=2
+    )
+
+    results = await asyncio.gather(
+        *(hasher.hash("password123") for _ in range(4)), return_exceptions=True
+    )
+    hasher.close()
+
+    overloaded = [r for r in results if isinstance(r, PasswordHasherOverloadedError)]
+    assert len(overloaded) == 2
+    assert hasher.pending == 0
+
+
+def test_unknown_kdf_is_rejected():
+    with pytest.raises(ValueError):
+        PooledPasswordHasher(kdf="md5")
+
+
+@pytest.mark.asyncio
+async def test_sha256_hasher_matches_legacy_digest():
+    hasher = Sha256PasswordHasher()
+
+    hashed = await hasher.hash("password123")
+
+    assert hashed == "ef92b778bafe771e89245b89ecbc08a44a4e166c06659911881f383d4473e94f"
+    assert await hasher.verify("password123", hashed)
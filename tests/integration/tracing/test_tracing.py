@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.adapters.tracing.exporters import (
+    JsonLinesExporter,
+    RingBufferExporter,
+    otlp_payload,
+)
+from be_task_ca.adapters.tracing.instrumented import TracedRepository, TracedUseCase
+from be_task_ca.adapters.tracing.tracer import Tracer, current_span, record_rows_scanned
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.drivers.rest.tracing import parse_traceparent
+
+
+def test_children_share_the_trace_and_point_at_their_parent():
+    exporter = RingBufferExporter()
+    tracer = Tracer(exporter)
+
+    root = tracer.start("root")
+    root_token = tracer.activate(root)
+    child = tracer.start("child")
+    child_token = tracer.activate(child)
+    assert current_span() is child
+    tracer.finish(child, child_token, None)
+    assert current_span() is root
+    tracer.finish(root, root_token, ValueError("boom"))
+
+    assert current_span() is None
+    assert [span.name for span in exporter.spans] == ["child", "root"]
+    assert child.trace_id == root.trace_id
+    assert child.parent_id == root.span_id
+    assert root.parent_id is None
+    assert root.error == "ValueError: boom"
+    assert child.duration_ns >= 0
+
+
+def test_unsampled_roots_propagate_to_children_and_export_nothing():
+    exporter = RingBufferExporter()
+    tracer = Tracer(exporter, sample_rate=0.0)
+
+    root = tracer.start("root")
+    token = tracer.activate(root)
+    child = tracer.start("child")
+    tracer.finish(root, token, None)
+
+    assert not root.sampled
+    assert not child.sampled
+    assert not exporter.spans
+
+
+def test_remote_parent_is_continued_or_dropped_by_its_sampled_flag():
+    tracer = Tracer(RingBufferExporter())
+
+    span = tracer.start("remote", ("a" * 32, "b" * 16, True))
+    assert (span.trace_id, span.parent_id) == ("a" * 32, "b" * 16)
+    assert not tracer.start("remote", ("a" * 32, "b" * 16, False)).sampled
+
+
+def test_parse_traceparent():
+    header = b"00-" + b"a" * 32 + b"-" + b"b" * 16 + b"-01"
+
+    assert parse_traceparent([(b"traceparent", header)]) == ("a" * 32, "b" * 16, True)
+    assert parse_traceparent([(b"traceparent", b"garbage")]) is None
+    assert parse_traceparent([]) is None
+
+
+@pytest.mark.asyncio
+async def test_traced_repository_records_rows_scanned_and_returned():
+    exporter = RingBufferExporter()
+    tracer = Tracer(exporter)
+    repository = InMemoryItemRepository(on_scan=record_rows_scanned)
+    for name in ("Lamp", "Desk", "Chair"):
+        await repository.save(Item(name=name, description="", price=1, quantity=1))
+    traced = TracedRepository(repository, "item", tracer)
+
+    await traced.find_by_name("Desk")
+    await traced.list_all()
+
+    find, list_all = exporter.spans
+    assert find.name == "repository.item.find_by_name"
+    assert find.attributes == {"rows_scanned": 2}
+    assert list_all.attributes == {"rows_scanned": 3, "rows_returned": 3}
+
+
+@pytest.mark.asyncio
+async def test_traced_use_case_parents_repository_spans_and_records_errors():
+    exporter = RingBufferExporter()
+    tracer = Tracer(exporter)
+    traced = TracedRepository(InMemoryItemRepository(), "item", tracer)
+
+    async def use_case():
+        await traced.list_all()
+        raise LookupError("missing")
+
+    with pytest.raises(LookupError):
+        await TracedUseCase(use_case, "lookup", tracer)()
+
+    repository_span, use_case_span = exporter.spans
+    assert use_case_span.name == "use_case.lookup"
+    assert use_case_span.error == "LookupError: missing"
+    assert repository_span.parent_id == use_case_span.span_id
+
+
+def test_ring_buffer_groups_recent_traces():
+    exporter = RingBufferExporter(capacity=3)
+    tracer = Tracer(exporter)
+    for name in ("first", "second", "third", "fourth"):
+        span = tracer.start(name)
+        tracer.finish(span, tracer.activate(span), None)
+
+    traces = exporter.traces(limit=2)
+
+    assert len(exporter.spans) == 3
+    assert [spans[0].name for spans in traces.values()] == ["fourth", "third"]
+
+
+def test_json_lines_exporter_flushes_on_close(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonLinesExporter(str(path), flush_every=10)
+    tracer = Tracer(exporter)
+    span = tracer.start("request")
+    tracer.finish(span, tracer.activate(span), None)
+
+    assert not path.exists()
+    exporter.close()
+
+    [line] = path.read_text().splitlines()
+    assert json.loads(line)["name"] == "request"
+
+
+def test_otlp_payload_encodes_spans():
+    tracer = Tracer(RingBufferExporter())
+    span = tracer.start("request")
+    span.set_attribute("rows_scanned", 3)
+    tracer.finish(span, tracer.activate(span), None)
+
+    payload = otlp_payload([span], "shop")
+
+    [encoded] = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert encoded["traceId"] == span.trace_id
+    assert encoded["attributes"] == [
+        {"key": "rows_scanned", "value": {"intValue": "3"}}
+    ]
+    assert encoded["status"] == {"code": 1}
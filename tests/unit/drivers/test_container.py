@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from be_task_ca.adapters.repositories.batching import BatchingItemRepository
+from be_task_ca.adapters.repositories.caching import CachingItemRepository, CachingUserRepository
+from be_task_ca.adapters.repositories.change_log import ChangeLoggingItemRepository
+from be_task_ca.adapters.repositories.coalescing import (
+    CoalescingCartItemRepository,
+    CoalescingItemRepository,
+    CoalescingUserRepository,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.write_batching import BatchedWriteItemRepository
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.adapters.security.sha256_password_hasher import Sha256PasswordHasher
+from be_task_ca.adapters.tracing.tracer import record_rows_scanned
+from be_task_ca.drivers.rest.container import Container, in_memory_backend
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_settings_defaults():
+    settings = Settings.from_env({})
+
+    assert settings == Settings()
+    assert settings.repository_backend == "memory"
+    assert settings.batch_reads_window_us is None
+
+
+def test_settings_from_env():
+    settings = Settings.from_env(
+        {
+            "BE_TASK_CA_COALESCE_READS": "yes",
+            "BE_TASK_CA_BATCH_READS_WINDOW_US": "250",
+            "BE_TASK_CA_BATCH_WRITES_WINDOW_MS": "1.5",
+            "BE_TASK_CA_PASSWORD_KDF": "pbkdf2_sha256",
+            "BE_TASK_CA_PASSWORD_COST": "100000",
+            "BE_TASK_CA_ADMISSION_LIMITS": "users=4:32, cart=16",
+            "BE_TASK_CA_RATE_LIMITS": "GET /items/=50:100,POST /users/{user_id}/cart/=5",
+            "UNRELATED": "ignored",
+        }
+    )
+
+    assert settings.coalesce_reads is True
+    assert settings.batch_reads_window_us == 250
+    assert settings.batch_writes_window_ms == 1.5
+    assert settings.password_kdf == "pbkdf2_sha256"
+    assert settings.password_cost == (100000,)
+    assert settings.admission_limits == (("users", 4, 32), ("cart", 16, 0))
+    assert settings.rate_limits == (
+        ("GET", "/items/", 50.0, 100.0),
+        ("POST", "/users/{user_id}/cart/", 5.0, 5.0),
+    )
+
+
+def test_build_uses_in_memory_backend():
+    container = Container.build(Settings(), password_hasher=Sha256PasswordHasher())
+
+    assert isinstance(container.item_repository, ChangeLoggingItemRepository)
+    assert isinstance(container.item_repository.inner, InMemoryItemRepository)
+    assert container.item_repository.change_log is container.item_change_log
+    assert container.get_all_items.item_repository is container.item_repository
+    assert container.add_item_to_cart.item_repository is container.item_repository
+    assert container.create_user.password_hasher is container.password_hasher
+
+
+def test_in_memory_backend_counts_scans_only_when_tracing():
+    plain = in_memory_backend(Settings())
+    traced = in_memory_backend(Settings(tracing_exporter="ring"))
+
+    assert all(repository.on_scan is None for repository in plain)
+    assert all(repository.on_scan is record_rows_scanned for repository in traced)
+
+
+def test_build_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        Container.build(Settings(repository_backend="postgres"))
+
+
+def test_build_layers_optional_decorators():
+    container = Container.build(
+        Settings(
+            coalesce_reads=True, batch_reads_window_us=0, batch_writes_window_ms=1.0
+        ),
+        password_hasher=Sha256PasswordHasher(),
+    )
+
+    assert isinstance(container.user_repository, CoalescingUserRepository)
+    assert isinstance(container.cart_item_repository, CoalescingCartItemRepository)
+    coalescing = container.item_repository
+    assert isinstance(coalescing, CoalescingItemRepository)
+    assert isinstance(coalescing.inner, BatchingItemRepository)
+    assert isinstance(coalescing.inner.inner, BatchedWriteItemRepository)
+    logged = coalescing.inner.inner.inner
+    assert isinstance(logged, ChangeLoggingItemRepository)
+    assert isinstance(logged.inner, InMemoryItemRepository)
+
+
+@pytest.mark.asyncio
+async def test_close_tears_down_resources_once():
+    container = Container.build(Settings(batch_writes_window_ms=1.0, events=True))
+
+    assert len(container.closers) == 4
+    await container.close()
+
+    assert container.closers == []
+    await container.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_are_invalidated_across_workers(tmp_path):
+    settings = Settings(cache_reads=True, cache_invalidation_dir=str(tmp_path))
+    first = Container.build(settings, password_hasher=Sha256PasswordHasher())
+    second = Container.build(settings, password_hasher=Sha256PasswordHasher())
+
+    assert isinstance(first.user_repository, CachingUserRepository)
+    assert isinstance(first.item_repository, CachingItemRepository)
+    # Workers share no data here, so stand in for a shared backend.
+    second.item_repository.inner = first.item_repository.inner
+    item = await first.item_repository.save(
+        Item(name="Lamp", description="", price=1.0, quantity=5)
+    )
+    await second.item_repository.find_by_id(item.id)
+    assert len(second.item_repository.cache) == 1
+
+    await first.item_repository.reserve_stock(item.id, 1)
+    for _ in range(100):
+        if not len(second.item_repository.cache):
+            break
+        await asyncio.sleep(0.001)
+
+    assert len(second.item_repository.cache) == 0
+    await first.close()
+    await second.close()
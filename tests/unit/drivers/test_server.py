@@ -0,0 +1,52 @@
+import gc
+import socket
+
+from be_task_ca.drivers.rest import server
+from be_task_ca.drivers.rest.app import create_app
+from be_task_ca.drivers.rest.settings import Settings
+
+
+def test_pick_loop_and_http_fall_back_without_optional_packages(monkeypatch):
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: None)
+
+    assert server.pick_loop() == "asyncio"
+    assert server.pick_http() == "h11"
+
+
+def test_pick_loop_and_http_prefer_uvloop_and_httptools(monkeypatch):
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: object())
+
+    assert server.pick_loop() == "uvloop"
+    assert server.pick_http() == "httptools"
+
+
+def test_bind_socket_listens_and_is_inheritable():
+    sock = server.bind_socket("127.0.0.1", 0, backlog=16)
+    try:
+        port = sock.getsockname()[1]
+        with socket.create_connection(("127.0.0.1", port), timeout=1):
+            pass
+        assert sock.get_inheritable()
+    finally:
+        sock.close()
+
+
+def test_preload_warms_app_and_freezes_gc():
+    try:
+        app = server.preload(Settings())
+
+        assert app.openapi_schema is not None
+        assert app.middleware_stack is not None
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_build_config_applies_settings():
+    settings = Settings(backlog=64, keep_alive_s=11)
+
+    config = server.build_config(create_app(settings), settings)
+
+    assert config.backlog == 64
+    assert config.timeout_keep_alive == 11
+    assert config.lifespan == "on"
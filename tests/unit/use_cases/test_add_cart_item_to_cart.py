@@ -1,11 +1,16 @@
+import asyncio
 from uuid import uuid4
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import InMemoryCartItemRepository
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import InMemoryCartSummaryRepository
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
 from be_task_ca.domain.entities.cart_item import CartItem
 from be_task_ca.domain.entities.item import Item
 from be_task_ca.domain.entities.user import User
+from be_task_ca.domain.events import ItemAddedToCart
 from be_task_ca.use_cases.commands.cart_commands import AddToCartCommand
 from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
 from be_task_ca.use_cases.exceptions.item_exceptions import (
@@ -32,15 +37,40 @@ def item_repository():
 
 
 @pytest.fixture
-def add_item_to_cart_use_case(cart_item_repository, user_repository, item_repository):
+def cart_summary_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def event_publisher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def add_item_to_cart_use_case(
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    cart_summary_repository,
+    event_publisher,
+):
     return AddItemToCartUseCase(
-        cart_item_repository, user_repository, item_repository
+        cart_item_repository,
+        user_repository,
+        item_repository,
+        cart_summary_repository,
+        event_publisher,
     )
 
 
 @pytest.mark.asyncio
 async def test_add_item_to_cart_successfully(
-    add_item_to_cart_use_case, cart_item_repository, user_repository, item_repository
+    add_item_to_cart_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    cart_summary_repository,
+    event_publisher,
 ):
     user_id = uuid4()
     item_id = uuid4()
@@ -79,6 +109,16 @@ async def test_add_item_to_cart_successfully(
         user_id, item_id
     )
     cart_item_repository.save.assert_called_once()
+    cart_summary_repository.add_line.assert_called_once_with(
+        user_id, item_id, quantity, 1000
+    )
+    event = event_publisher.publish.call_args.args[0]
+    assert isinstance(event, ItemAddedToCart)
+    assert (event.user_id, event.item_id, event.quantity) == (
+        user_id,
+        item_id,
+        quantity,
+    )
 
 
 @pytest.mark.asyncio
@@ -96,8 +136,11 @@ async def test_add_item_to_cart_user_not_found(
         await add_item_to_cart_use_case(command)
 
     user_repository.find_by_id.assert_called_once_with(user_id)
-    item_repository.find_by_id.assert_not_called()
-    cart_item_repository.find_by_user_and_item.assert_not_called()
+    item_repository.find_by_id.assert_called_once_with(item_id)
+    cart_item_repository.find_by_user_and_item.assert_called_once_with(
+        user_id, item_id
+    )
+    item_repository.reserve_stock.assert_not_called()
     cart_item_repository.save.assert_not_called()
 
 
@@ -127,7 +170,7 @@ async def test_add_item_to_cart_item_not_found(
 
     user_repository.find_by_id.assert_called_once_with(user_id)
     item_repository.find_by_id.assert_called_once_with(item_id)
-    cart_item_repository.find_by_user_and_item.assert_not_called()
+    item_repository.reserve_stock.assert_not_called()
     cart_item_repository.save.assert_not_called()
 
 
@@ -161,7 +204,7 @@ async def test_add_item_to_cart_insufficient_stock(
 
     user_repository.find_by_id.assert_called_once_with(user_id)
     item_repository.find_by_id.assert_called_once_with(item_id)
-    cart_item_repository.find_by_user_and_item.assert_not_called()
+    item_repository.reserve_stock.assert_not_called()
     cart_item_repository.save.assert_not_called()
 
 
@@ -242,3 +285,210 @@ async def test_add_item_to_cart_exact_stock_available(
 
     assert result.quantity == quantity
     cart_item_repository.save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_add_item_to_cart_reserves_stock(
+    add_item_to_cart_use_case, cart_item_repository, user_repository, item_repository
+):
+    user_id = uuid4()
+    item_id = uuid4()
+
+    command = AddToCartCommand(user_id=user_id, item_id=item_id, quantity=3)
+
+    user = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+
+    item = Item(
+        id=item_id, name="Item", description="Description", price=10.0, quantity=10
+    )
+
+    user_repository.find_by_id.return_value = user
+    item_repository.find_by_id.return_value = item
+    item_repository.reserve_stock.return_value = item
+    cart_item_repository.find_by_user_and_item.return_value = None
+
+    await add_item_to_cart_use_case(command)
+
+    item_repository.reserve_stock.assert_called_once_with(item_id, 3)
+    item_repository.release_stock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_item_to_cart_reservation_lost_to_concurrent_request(
+    add_item_to_cart_use_case, cart_item_repository, user_repository, item_repository
+):
+    user_id = uuid4()
+    item_id = uuid4()
+
+    command = AddToCartCommand(user_id=user_id, item_id=item_id, quantity=2)
+
+    user = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+
+    item = Item(
+        id=item_id, name="Item", description="Description", price=10.0, quantity=2
+    )
+
+    user_repository.find_by_id.return_value = user
+    item_repository.find_by_id.return_value = item
+    item_repository.reserve_stock.return_value = None
+    cart_item_repository.find_by_user_and_item.return_value = None
+
+    with pytest.raises(InsufficientStockError):
+        await add_item_to_cart_use_case(command)
+
+    cart_item_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_item_to_cart_releases_stock_when_save_fails(
+    add_item_to_cart_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    cart_summary_repository,
+    event_publisher,
+):
+    user_id = uuid4()
+    item_id = uuid4()
+
+    command = AddToCartCommand(user_id=user_id, item_id=item_id, quantity=4)
+
+    user = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+
+    item = Item(
+        id=item_id, name="Item", description="Description", price=10.0, quantity=10
+    )
+
+    user_repository.find_by_id.return_value = user
+    item_repository.find_by_id.return_value = item
+    item_repository.reserve_stock.return_value = item
+    cart_item_repository.find_by_user_and_item.return_value = None
+    cart_item_repository.save.side_effect = RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError):
+        await add_item_to_cart_use_case(command)
+
+    item_repository.release_stock.assert_called_once_with(item_id, 4)
+    cart_summary_repository.add_line.assert_not_called()
+    event_publisher.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_item_to_cart_user_error_wins_over_item_lookup_failure(
+    add_item_to_cart_use_case, cart_item_repository, user_repository, item_repository
+):
+    command = AddToCartCommand(user_id=uuid4(), item_id=uuid4(), quantity=1)
+
+    user_repository.find_by_id.return_value = None
+    item_repository.find_by_id.side_effect = RuntimeError("item backend down")
+
+    with pytest.raises(UserNotFoundError):
+        await add_item_to_cart_use_case(command)
+
+
+@pytest.mark.asyncio
+async def test_add_item_to_cart_runs_lookups_concurrently(
+    add_item_to_cart_use_case, cart_item_repository, user_repository, item_repository
+):
+    user_id = uuid4()
+    item_id = uuid4()
+    in_flight = 0
+    peak = 0
+
+    def slow(result):
+        async def lookup(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        return lookup
+
+    user = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+    item = Item(
+        id=item_id, name="Item", description="Description", price=10.0, quantity=10
+    )
+
+    user_repository.find_by_id.side_effect = slow(user)
+    item_repository.find_by_id.side_effect = slow(item)
+    cart_item_repository.find_by_user_and_item.side_effect = slow(None)
+
+    await add_item_to_cart_use_case(
+        AddToCartCommand(user_id=user_id, item_id=item_id, quantity=1)
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_adds_reserve_stock_once(
+    user_repository, event_publisher
+):
+    user_id = uuid4()
+    item = Item(name="Item", description="Description", price=10.0, quantity=10)
+    item_repository = InMemoryItemRepository()
+    await item_repository.save(item)
+    cart_item_repository = InMemoryCartItemRepository()
+    cart_summary_repository = InMemoryCartSummaryRepository()
+    user_repository.find_by_id.return_value = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+    add_item_to_cart_use_case = AddItemToCartUseCase(
+        cart_item_repository,
+        user_repository,
+        item_repository,
+        cart_summary_repository,
+        event_publisher,
+    )
+    command = AddToCartCommand(user_id=user_id, item_id=item.id, quantity=2)
+
+    results = await asyncio.gather(
+        add_item_to_cart_use_case(command),
+        add_item_to_cart_use_case(command),
+        return_exceptions=True,
+    )
+
+    assert sorted(type(result).__name__ for result in results) == [
+        "CartItem",
+        "ItemAlreadyInCartError",
+    ]
+    assert item.quantity == 8
+    assert len(await cart_item_repository.find_cart_items_for_user_id(user_id)) == 1
+    summary = await cart_summary_repository.find_by_user_id(user_id)
+    assert (summary.line_count, summary.item_count) == (1, 2)
+    assert len(add_item_to_cart_use_case.cart_line_locks) == 0
@@ -0,0 +1,106 @@
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.adapters.repositories.cart_item.in_memory_cart_item_repository import (
+    InMemoryCartItemRepository,
+)
+from be_task_ca.adapters.repositories.cart_summary.in_memory_summary_repository import (
+    InMemoryCartSummaryRepository,
+)
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.cart_summary import CartSummary
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.use_cases.check_cart_summaries import CheckCartSummariesUseCase
+
+
+@pytest.fixture
+def repositories():
+    return (
+        InMemoryCartItemRepository(),
+        InMemoryItemRepository(),
+        InMemoryCartSummaryRepository(),
+    )
+
+
+@pytest.fixture
+def check_cart_summaries_use_case(repositories):
+    return CheckCartSummariesUseCase(*repositories)
+
+
+async def fill_cart(repositories, user_id, quantity=2):
+    cart_items, items, summaries = repositories
+    item = await items.save(Item(name="Lamp", description="", price=10.0, quantity=9))
+    await cart_items.save(CartItem(user_id=user_id, item_id=item.id, quantity=quantity))
+    await summaries.add_line(user_id, item.id, quantity, 1000)
+    return item
+
+
+@pytest.mark.asyncio
+async def test_check_cart_summaries_agrees_with_a_recompute(
+    check_cart_summaries_use_case, repositories
+):
+    await fill_cart(repositories, uuid4())
+
+    assert await check_cart_summaries_use_case() == []
+    assert await check_cart_summaries_use_case([uuid4()]) == []
+
+
+@pytest.mark.asyncio
+async def test_check_cart_summaries_reports_and_repairs_drift(
+    check_cart_summaries_use_case, repositories
+):
+    user_id, other = uuid4(), uuid4()
+    cart_items, items, summaries = repositories
+    item = await fill_cart(repositories, user_id)
+    await summaries.add_line(other, item.id, 1, 1000)
+    await cart_items.save(CartItem(user_id=other, item_id=item.id, quantity=1))
+    # A line the view never heard about.
+    await cart_items.save(CartItem(user_id=user_id, item_id=item.id, quantity=1))
+
+    (mismatch,) = await check_cart_summaries_use_case(repair=True)
+
+    expected = CartSummary(
+        user_id=user_id, line_count=1, item_count=3, total_cents=3000
+    )
+    assert mismatch.expected == expected
+    assert mismatch.actual.total_cents == 2000
+    assert (await summaries.find_by_user_id(other)).total_cents == 1000
+    assert await summaries.find_by_user_id(user_id) == expected
+    assert await check_cart_summaries_use_case() == []
+
+
+@pytest.mark.asyncio
+async def test_check_cart_summaries_finds_carts_missing_from_the_view(
+    check_cart_summaries_use_case, repositories
+):
+    user_id = uuid4()
+    cart_items, items, _ = repositories
+    item = await items.save(Item(name="Desk", description="", price=5.0, quantity=9))
+    await cart_items.save(CartItem(user_id=user_id, item_id=item.id, quantity=1))
+
+    (mismatch,) = await check_cart_summaries_use_case([user_id])
+    (unrequested,) = await check_cart_summaries_use_case()
+
+    assert mismatch.actual is None
+    assert mismatch.expected.total_cents == 500
+    assert unrequested == mismatch
+
+
+@pytest.mark.asyncio
+async def test_check_cart_summaries_finds_summaries_without_cart_lines(
+    check_cart_summaries_use_case, repositories
+):
+    user_id = uuid4()
+    _, _, summaries = repositories
+    await summaries.add_line(user_id, uuid4(), 1, 700)
+
+    (mismatch,) = await check_cart_summaries_use_case(repair=True)
+
+    assert mismatch.expected == CartSummary(user_id=user_id)
+    assert mismatch.actual.total_cents == 700
+    assert await summaries.find_by_user_id(user_id) == CartSummary(user_id=user_id)
+    assert await check_cart_summaries_use_case() == []
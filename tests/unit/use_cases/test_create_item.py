@@ -1,9 +1,14 @@
+import asyncio
 from uuid import uuid4
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from be_task_ca.adapters.repositories.coalescing import CoalescingItemRepository
+from be_task_ca.adapters.repositories.item.in_memory_item_repository import InMemoryItemRepository
+from be_task_ca.adapters.repositories.write_batching import BatchedWriteItemRepository
 from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.events import ItemCreated
 from be_task_ca.use_cases.commands.item_commands import CreateItemCommand
 from be_task_ca.use_cases.exceptions.item_exceptions import ItemAlreadyExistsError
 from be_task_ca.use_cases.create_item import CreateItemUseCase
@@ -15,12 +20,19 @@ def item_repository():
 
 
 @pytest.fixture
-def create_item_use_case(item_repository):
-    return CreateItemUseCase(item_repository)
+def event_publisher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def create_item_use_case(item_repository, event_publisher):
+    return CreateItemUseCase(item_repository, event_publisher)
 
 
 @pytest.mark.asyncio
-async def test_create_item_successfully(create_item_use_case, item_repository):
+async def test_create_item_successfully(
+    create_item_use_case, item_repository, event_publisher
+):
     command = CreateItemCommand(
         name="Laptop",
         description="High-performance laptop",
@@ -47,6 +59,14 @@ async def test_create_item_successfully(create_item_use_case, item_repository):
     assert result.quantity == 10
     item_repository.find_by_name.assert_called_once_with("Laptop")
     item_repository.save.assert_called_once()
+    event = event_publisher.publish.call_args.args[0]
+    assert isinstance(event, ItemCreated)
+    assert (event.item_id, event.name, event.price, event.quantity) == (
+        item.id,
+        "Laptop",
+        999.99,
+        10,
+    )
 
 
 @pytest.mark.asyncio
@@ -102,7 +122,9 @@ async def test_create_item_with_float_price(create_item_use_case, item_repositor
 
 
 @pytest.mark.asyncio
-async def test_create_item_item_already_exists(create_item_use_case, item_repository):
+async def test_create_item_item_already_exists(
+    create_item_use_case, item_repository, event_publisher
+):
     command = CreateItemCommand(
         name="Existing Item",
         description="Item that already exists",
@@ -125,6 +147,7 @@ async def test_create_item_item_already_exists(create_item_use_case, item_reposi
 
     item_repository.find_by_name.assert_called_once_with("Existing Item")
     item_repository.save.assert_not_called()
+    event_publisher.publish.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -151,3 +174,25 @@ async def test_create_item_converts_price_to_float(create_item_use_case, item_re
 
     assert isinstance(result.price, float)
     assert result.price == 100.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_in_one_write_window_create_one_item(event_publisher):
+    backend = InMemoryItemRepository()
+    item_repository = CoalescingItemRepository(
+        BatchedWriteItemRepository(backend, window_ms=5)
+    )
+    create_item_use_case = CreateItemUseCase(item_repository, event_publisher)
+    commands = [
+        CreateItemCommand(name=name, description="", price=1.0, quantity=1)
+        for name in ("Lamp", "lamp", "Desk")
+    ]
+
+    results = await asyncio.gather(
+        *(create_item_use_case(command) for command in commands),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [Item, ItemAlreadyExistsError, Item]
+    assert [item.name for item in backend.items] == ["Lamp", "Desk"]
+    assert len(create_item_use_case.name_locks) == 0
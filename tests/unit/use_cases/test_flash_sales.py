@@ -0,0 +1,60 @@
+from uuid import uuid4
+from unittest.mock import AsyncMock
+
+import pytest
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.use_cases.end_flash_sale import EndColdFlashSalesUseCase, EndFlashSaleUseCase
+from be_task_ca.use_cases.exceptions.item_exceptions import ItemNotFoundError
+from be_task_ca.use_cases.start_flash_sale import StartFlashSaleUseCase
+
+
+@pytest.fixture
+def item_repository():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_start_flash_sale_uses_the_configured_shards(item_repository):
+    item_id = uuid4()
+    item_repository.start_flash_sale.return_value = True
+
+    await StartFlashSaleUseCase(item_repository, shards=4)(item_id)
+
+    item_repository.start_flash_sale.assert_called_once_with(item_id, 4)
+
+
+@pytest.mark.asyncio
+async def test_start_flash_sale_item_not_found(item_repository):
+    item_repository.start_flash_sale.return_value = False
+
+    with pytest.raises(ItemNotFoundError):
+        await StartFlashSaleUseCase(item_repository, shards=4)(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_end_flash_sale(item_repository):
+    item = Item(id=uuid4(), name="Lamp", description="", price=10.0, quantity=1)
+    item_repository.find_by_id.return_value = item
+    item_repository.end_flash_sale.return_value = False
+
+    assert not await EndFlashSaleUseCase(item_repository)(item.id)
+    item_repository.end_flash_sale.assert_called_once_with(item.id)
+
+
+@pytest.mark.asyncio
+async def test_end_flash_sale_item_not_found(item_repository):
+    item_repository.find_by_id.return_value = None
+
+    with pytest.raises(ItemNotFoundError):
+        await EndFlashSaleUseCase(item_repository)(uuid4())
+    item_repository.end_flash_sale.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_end_cold_flash_sales_uses_the_idle_time(item_repository):
+    merged = [uuid4()]
+    item_repository.merge_cold_flash_sales.return_value = merged
+
+    assert await EndColdFlashSalesUseCase(item_repository, idle_for=30.0)() == merged
+    item_repository.merge_cold_flash_sales.assert_called_once_with(30.0)
@@ -0,0 +1,67 @@
+from uuid import uuid4
+from unittest.mock import AsyncMock
+
+import pytest
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.item_changes import ItemChangeSet, ItemChanges
+from be_task_ca.use_cases.get_item_changes import GetItemChangesUseCase
+
+
+@pytest.fixture
+def item_change_log():
+    return AsyncMock()
+
+
+@pytest.fixture
+def item_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def get_item_changes_use_case(item_change_log, item_repository):
+    return GetItemChangesUseCase(item_change_log, item_repository)
+
+
+@pytest.mark.asyncio
+async def test_get_item_changes_loads_only_the_changed_items(
+    get_item_changes_use_case, item_change_log, item_repository
+):
+    lamp = Item(id=uuid4(), name="Lamp", description="", price=10.0, quantity=1)
+    item_change_log.changes_since.return_value = ItemChangeSet(
+        next_since=7, item_ids=[lamp.id], has_more=True
+    )
+    item_repository.find_by_ids.return_value = [lamp]
+
+    result = await get_item_changes_use_case(5, 1)
+
+    assert result == ItemChanges(next_since=7, items=[lamp], has_more=True)
+    item_change_log.changes_since.assert_called_once_with(5, 1)
+    item_repository.find_by_ids.assert_called_once_with([lamp.id])
+    item_repository.list_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_item_changes_up_to_date(
+    get_item_changes_use_case, item_change_log, item_repository
+):
+    item_change_log.changes_since.return_value = ItemChangeSet(next_since=7)
+
+    result = await get_item_changes_use_case(7, 100)
+
+    assert result == ItemChanges(next_since=7)
+    item_repository.find_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_item_changes_resync(
+    get_item_changes_use_case, item_change_log, item_repository
+):
+    item_change_log.changes_since.return_value = ItemChangeSet(
+        next_since=9, resync=True
+    )
+
+    result = await get_item_changes_use_case(0, 100)
+
+    assert result == ItemChanges(next_since=9, resync=True)
+    item_repository.find_by_ids.assert_not_called()
@@ -94,7 +94,7 @@ async def test_get_user_cart_user_not_found(
         await get_user_cart_use_case(user_id)
 
     user_repository.find_by_id.assert_called_once_with(user_id)
-    cart_item_repository.find_cart_items_for_user_id.assert_not_called()
+    cart_item_repository.find_cart_items_for_user_id.assert_called_once_with(user_id)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,69 @@
+from uuid import uuid4
+from unittest.mock import AsyncMock
+
+import pytest
+
+from be_task_ca.domain.entities.cart_summary import CartSummary
+from be_task_ca.domain.entities.user import User
+from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
+from be_task_ca.use_cases.get_user_cart_summary import GetUserCartSummaryUseCase
+
+
+@pytest.fixture
+def cart_summary_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def user_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def get_user_cart_summary_use_case(cart_summary_repository, user_repository):
+    return GetUserCartSummaryUseCase(cart_summary_repository, user_repository)
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_summary_reads_only_the_summary(
+    get_user_cart_summary_use_case, cart_summary_repository, user_repository
+):
+    user_id = uuid4()
+    summary = CartSummary(user_id=user_id, line_count=1, item_count=2, total_cents=500)
+    cart_summary_repository.find_by_user_id.return_value = summary
+
+    result = await get_user_cart_summary_use_case(user_id)
+
+    assert result == summary
+    user_repository.find_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_summary_empty_cart(
+    get_user_cart_summary_use_case, cart_summary_repository, user_repository
+):
+    user_id = uuid4()
+    cart_summary_repository.find_by_user_id.return_value = None
+    user_repository.find_by_id.return_value = User(
+        id=user_id,
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+
+    result = await get_user_cart_summary_use_case(user_id)
+
+    assert result == CartSummary(user_id=user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_summary_user_not_found(
+    get_user_cart_summary_use_case, cart_summary_repository, user_repository
+):
+    cart_summary_repository.find_by_user_id.return_value = None
+    user_repository.find_by_id.return_value = None
+
+    with pytest.raises(UserNotFoundError):
+        await get_user_cart_summary_use_case(uuid4())
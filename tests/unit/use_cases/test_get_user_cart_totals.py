@@ -0,0 +1,159 @@
+from uuid import uuid4
+from unittest.mock import AsyncMock
+
+import pytest
+
+from be_task_ca.domain.entities.cart_item import CartItem
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.entities.user import User
+from be_task_ca.use_cases.exceptions.user_exceptions import UserNotFoundError
+from be_task_ca.use_cases.get_user_cart_totals import GetUserCartTotalsUseCase
+
+
+@pytest.fixture
+def cart_item_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def user_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def item_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def get_user_cart_totals_use_case(
+    cart_item_repository, user_repository, item_repository
+):
+    return GetUserCartTotalsUseCase(
+        cart_item_repository, user_repository, item_repository
+    )
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=uuid4(),
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed",
+        shipping_address="",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_totals_enriches_lines(
+    get_user_cart_totals_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    user,
+):
+    keyboard = Item(name="Keyboard", description="Keys", price=149.99, quantity=20)
+    mouse = Item(name="Mouse", description="Clicks", price=29.99, quantity=50)
+
+    user_repository.find_by_id.return_value = user
+    cart_item_repository.find_cart_items_for_user_id.return_value = [
+        CartItem(user_id=user.id, item_id=keyboard.id, quantity=2),
+        CartItem(user_id=user.id, item_id=mouse.id, quantity=3),
+    ]
+    item_repository.find_by_ids.return_value = [mouse, keyboard]
+
+    result = await get_user_cart_totals_use_case(user.id)
+
+    assert [line.name for line in result.lines] == ["Keyboard", "Mouse"]
+    assert result.lines[0].unit_price_cents == 14999
+    assert result.lines[0].line_total_cents == 29998
+    assert result.lines[1].line_total_cents == 8997
+    assert result.subtotal_cents == 38995
+    assert result.total_cents == 38995
+    assert result.item_count == 5
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_totals_fetches_items_in_one_batch(
+    get_user_cart_totals_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    user,
+):
+    cart_items = [
+        CartItem(user_id=user.id, item_id=uuid4(), quantity=1) for _ in range(10)
+    ]
+
+    user_repository.find_by_id.return_value = user
+    cart_item_repository.find_cart_items_for_user_id.return_value = cart_items
+    item_repository.find_by_ids.return_value = []
+
+    await get_user_cart_totals_use_case(user.id)
+
+    item_repository.find_by_ids.assert_called_once_with(
+        [cart_item.item_id for cart_item in cart_items]
+    )
+    item_repository.find_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_totals_empty_cart(
+    get_user_cart_totals_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    user,
+):
+    user_repository.find_by_id.return_value = user
+    cart_item_repository.find_cart_items_for_user_id.return_value = []
+
+    result = await get_user_cart_totals_use_case(user.id)
+
+    assert result.lines == []
+    assert result.subtotal_cents == 0
+    assert result.item_count == 0
+    item_repository.find_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_totals_skips_missing_items(
+    get_user_cart_totals_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+    user,
+):
+    item = Item(name="Item", description="Description", price=10.0, quantity=5)
+
+    user_repository.find_by_id.return_value = user
+    cart_item_repository.find_cart_items_for_user_id.return_value = [
+        CartItem(user_id=user.id, item_id=item.id, quantity=2),
+        CartItem(user_id=user.id, item_id=uuid4(), quantity=4),
+    ]
+    item_repository.find_by_ids.return_value = [item]
+
+    result = await get_user_cart_totals_use_case(user.id)
+
+    assert len(result.lines) == 1
+    assert result.subtotal_cents == 2000
+    assert result.item_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_user_cart_totals_user_not_found(
+    get_user_cart_totals_use_case,
+    cart_item_repository,
+    user_repository,
+    item_repository,
+):
+    user_id = uuid4()
+
+    user_repository.find_by_id.return_value = None
+
+    with pytest.raises(UserNotFoundError):
+        await get_user_cart_totals_use_case(user_id)
+
+    item_repository.find_by_ids.assert_not_called()
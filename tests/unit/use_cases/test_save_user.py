@@ -1,10 +1,14 @@
+import asyncio
 import hashlib
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from be_task_ca.adapters.repositories.user.in_memory_user_repository import InMemoryUserRepository
+from be_task_ca.adapters.security.sha256_password_hasher import Sha256PasswordHasher
 from be_task_ca.domain.entities.user import User
+from be_task_ca.domain.events import UserRegistered
 from be_task_ca.use_cases.commands.user_commands import CreateUserCommand
 from be_task_ca.use_cases.exceptions.user_exceptions import EmailAlreadyExistsError
 from be_task_ca.use_cases.save_user import CreateUserUseCase
@@ -16,12 +20,24 @@ def user_repository():
 
 
 @pytest.fixture
-def create_user_use_case(user_repository):
-    return CreateUserUseCase(user_repository)
+def password_hasher():
+    return Sha256PasswordHasher()
+
+
+@pytest.fixture
+def event_publisher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def create_user_use_case(user_repository, password_hasher, event_publisher):
+    return CreateUserUseCase(user_repository, password_hasher, event_publisher)
 
 
 @pytest.mark.asyncio
-async def test_create_user_successfully(create_user_use_case, user_repository):
+async def test_create_user_successfully(
+    create_user_use_case, user_repository, event_publisher
+):
     command = CreateUserCommand(
         email="john@example.com",
         first_name="John",
@@ -49,6 +65,14 @@ async def test_create_user_successfully(create_user_use_case, user_repository):
     assert result.last_name == "Doe"
     user_repository.find_by_email.assert_called_once_with("john@example.com")
     user_repository.save.assert_called_once()
+    event_publisher.publish.assert_called_once_with(
+        UserRegistered(
+            user_id=user.id,
+            email="john@example.com",
+            event_id=event_publisher.publish.call_args.args[0].event_id,
+            occurred_at=event_publisher.publish.call_args.args[0].occurred_at,
+        )
+    )
 
 
 @pytest.mark.asyncio
@@ -80,7 +104,9 @@ async def test_create_user_with_no_shipping_address(create_user_use_case, user_r
 
 
 @pytest.mark.asyncio
-async def test_create_user_email_already_exists(create_user_use_case, user_repository):
+async def test_create_user_email_already_exists(
+    create_user_use_case, user_repository, event_publisher
+):
     command = CreateUserCommand(
         email="existing@example.com",
         first_name="John",
@@ -104,6 +130,7 @@ async def test_create_user_email_already_exists(create_user_use_case, user_repos
 
     user_repository.find_by_email.assert_called_once_with("existing@example.com")
     user_repository.save.assert_not_called()
+    event_publisher.publish.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -131,3 +158,77 @@ async def test_create_user_hashes_password(create_user_use_case, user_repository
     await create_user_use_case(command)
 
     assert saved_user.hashed_password == expected_hash
+
+
+@pytest.mark.asyncio
+async def test_create_user_delegates_to_password_hasher(user_repository):
+    password_hasher = AsyncMock()
+    password_hasher.hash.return_value = "scrypt$derived"
+    create_user_use_case = CreateUserUseCase(
+        user_repository, password_hasher, AsyncMock()
+    )
+    command = CreateUserCommand(
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        password="mysecretpassword",
+    )
+
+    user_repository.find_by_email.return_value = None
+    user_repository.save.side_effect = lambda user: user
+
+    result = await create_user_use_case(command)
+
+    password_hasher.hash.assert_awaited_once_with("mysecretpassword")
+    assert result.hashed_password == "scrypt$derived"
+
+
+@pytest.mark.asyncio
+async def test_create_user_email_exists_skips_hashing(user_repository):
+    password_hasher = AsyncMock()
+    create_user_use_case = CreateUserUseCase(
+        user_repository, password_hasher, AsyncMock()
+    )
+    command = CreateUserCommand(
+        email="existing@example.com",
+        first_name="John",
+        last_name="Doe",
+        password="password123",
+    )
+
+    user_repository.find_by_email.return_value = MagicMock()
+
+    with pytest.raises(EmailAlreadyExistsError):
+        await create_user_use_case(command)
+
+    password_hasher.hash.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_signups_for_one_email_create_one_user():
+    user_repository = InMemoryUserRepository()
+
+    async def slow_hash(password):
+        await asyncio.sleep(0.01)
+        return "hashed"
+
+    password_hasher = AsyncMock()
+    password_hasher.hash.side_effect = slow_hash
+    create_user_use_case = CreateUserUseCase(
+        user_repository, password_hasher, AsyncMock()
+    )
+    commands = [
+        CreateUserCommand(
+            email=email, first_name="John", last_name="Doe", password="password123"
+        )
+        for email in ("race@example.com", "Race@example.com", "other@example.com")
+    ]
+
+    results = await asyncio.gather(
+        *(create_user_use_case(command) for command in commands),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [User, EmailAlreadyExistsError, User]
+    assert len(user_repository.users) == 2
+    assert len(create_user_use_case.email_locks) == 0
@@ -0,0 +1,106 @@
+import asyncio
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from be_task_ca.domain.entities.item import Item
+from be_task_ca.domain.events import ItemPriceChanged
+from be_task_ca.use_cases.commands.item_commands import UpdateItemPriceCommand
+from be_task_ca.use_cases.exceptions.item_exceptions import ItemNotFoundError
+from be_task_ca.use_cases.update_item_price import UpdateItemPriceUseCase
+
+
+@pytest.fixture
+def item_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def cart_summary_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def event_publisher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def update_item_price_use_case(
+    item_repository, cart_summary_repository, event_publisher
+):
+    return UpdateItemPriceUseCase(
+        item_repository, cart_summary_repository, event_publisher
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_item_price_reprices_cart_summaries(
+    update_item_price_use_case,
+    item_repository,
+    cart_summary_repository,
+    event_publisher,
+):
+    item = Item(id=uuid4(), name="Lamp", description="", price=12.5, quantity=3)
+    item_repository.update_price.return_value = item
+
+    result = await update_item_price_use_case(
+        UpdateItemPriceCommand(item_id=item.id, price=12.5)
+    )
+
+    assert result is item
+    item_repository.update_price.assert_called_once_with(item.id, 12.5)
+    cart_summary_repository.reprice.assert_called_once_with(item.id, 1250)
+    event = event_publisher.publish.call_args.args[0]
+    assert isinstance(event, ItemPriceChanged)
+    assert (event.item_id, event.price) == (item.id, 12.5)
+
+
+@pytest.mark.asyncio
+async def test_update_item_price_item_not_found(
+    update_item_price_use_case,
+    item_repository,
+    cart_summary_repository,
+    event_publisher,
+):
+    item_repository.update_price.return_value = None
+
+    with pytest.raises(ItemNotFoundError):
+        await update_item_price_use_case(
+            UpdateItemPriceCommand(item_id=uuid4(), price=1.0)
+        )
+
+    cart_summary_repository.reprice.assert_not_called()
+    event_publisher.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_reprice_in_the_order_they_were_applied(
+    update_item_price_use_case,
+    item_repository,
+    cart_summary_repository,
+):
+    item_id = uuid4()
+    delays = iter([0.02, 0])
+
+    async def update_price(item_id, price):
+        return Item(id=item_id, name="Lamp", description="", price=price, quantity=1)
+
+    async def reprice(item_id, price_cents):
+        # The first reprice is slower, so without the lock the second update
+        # would reprice first and be overwritten with the older price.
+        await asyncio.sleep(next(delays))
+        repriced.append(price_cents)
+
+    repriced = []
+    item_repository.update_price.side_effect = update_price
+    cart_summary_repository.reprice.side_effect = reprice
+
+    await asyncio.gather(
+        update_item_price_use_case(UpdateItemPriceCommand(item_id=item_id, price=1.0)),
+        update_item_price_use_case(UpdateItemPriceCommand(item_id=item_id, price=2.0)),
+    )
+
+    assert repriced == [100, 200]
+    assert len(update_item_price_use_case.price_locks) == 0